@@ -0,0 +1,47 @@
+"""
+Running blocking work from async views.
+
+Under ASGI (see inventory/asgi.py) the dashboard and list views are
+coroutines. The ORM, the template engine and password hashing all block,
+so they run on worker threads through ``offload``; ``gather`` runs several
+independent reads at once. Each worker thread has its own database
+connection, which is closed once it outlives ``CONN_MAX_AGE`` just as
+``request_finished`` does for the request thread. A profiled request's
+samples follow it onto those threads (monitoring.profiling).
+"""
+import asyncio
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.db import close_old_connections
+
+from monitoring.profiling import sampled_thread
+
+
+def _in_worker(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            with sampled_thread():
+                return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+    return wrapper
+
+
+async def offload(func, *args, **kwargs):
+    """
+    Await ``func(*args, **kwargs)`` run on a worker thread.
+
+    The thread is not the request's thread-sensitive one, so a slow call
+    neither blocks the event loop nor queues behind other requests' sync
+    code. Context variables (e.g. replica routing) are carried over.
+    """
+    return await sync_to_async(_in_worker(func), thread_sensitive=False)(*args, **kwargs)
+
+
+async def gather(calls):
+    """Run ``{name: callable}`` concurrently on worker threads; returns ``{name: result}``."""
+    names = list(calls)
+    results = await asyncio.gather(*(offload(calls[name]) for name in names))
+    return dict(zip(names, results))
@@ -0,0 +1,50 @@
+"""
+Retrying writes that lose the race for SQLite's write lock.
+
+``busy_timeout`` already makes SQLite wait for the lock; a write still raises
+"database is locked" when it waited longer than that. ``retry_on_locked``
+runs such a write again after a short, jittered, exponentially growing pause.
+"""
+import random
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.db import OperationalError, connection
+
+LOCK_MESSAGES = ('database is locked', 'database table is locked')
+
+
+def is_lock_error(error):
+    return isinstance(error, OperationalError) and any(m in str(error) for m in LOCK_MESSAGES)
+
+
+def backoff_delays(retries=None, base=None):
+    """Full-jitter delays: attempt ``n`` waits up to ``base * 2**n`` seconds."""
+    retries = settings.SQLITE_LOCK_RETRIES if retries is None else retries
+    base = settings.SQLITE_LOCK_BACKOFF if base is None else base
+    for attempt in range(retries):
+        yield random.uniform(0, base * 2 ** attempt)
+
+
+def retry_on_locked(func):
+    """
+    Re-run ``func`` when it fails with a lock error.
+
+    Only the outermost call retries: inside an atomic block the transaction
+    is already broken, so the error is passed up to whoever owns it.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        delays = backoff_delays()
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except OperationalError as e:
+                if not is_lock_error(e) or connection.in_atomic_block:
+                    raise
+                delay = next(delays, None)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+    return wrapper
@@ -0,0 +1,160 @@
+"""
+Read/write routing between the primary database and a local read replica.
+
+Views decorated with ``reads_from_replica`` send their ORM reads to the
+``replica`` alias; everything else, and every write, stays on ``default``.
+A client that has just written is pinned to the primary for
+``REPLICA_PIN_SECONDS`` (a cookie set by ``ReplicaPinMiddleware``) so it
+always reads its own writes. The replica is a copy of the primary kept
+fresh by ``manage.py refresh_replica``; keep the pin longer than the
+refresh interval.
+
+``request.user`` is resolved by middleware before any routed view runs, so
+sessions and users are always read from the primary.
+"""
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+
+from .aio import offload
+
+PRIMARY = 'default'
+REPLICA = 'replica'
+PIN_COOKIE = 'pin_primary'
+
+# models whose writes do not make the client's next reads stale
+UNTRACKED_APPS = ('sessions',)
+
+_use_replica = ContextVar('use_replica', default=False)
+_wrote = ContextVar('wrote', default=False)
+
+
+def replica_enabled():
+    return REPLICA in connections.databases
+
+
+@contextmanager
+def reading_from(replica):
+    token = _use_replica.set(replica)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def use_primary():
+    """Read from the primary inside a replica view, e.g. before caching."""
+    return reading_from(False)
+
+
+def is_pinned(request):
+    return PIN_COOKIE in request.COOKIES
+
+
+def read_alias(request):
+    """The alias ``request`` may read from, for querysets consumed after the view returns."""
+    return REPLICA if replica_enabled() and not is_pinned(request) else PRIMARY
+
+
+def _needs_render(response):
+    return callable(getattr(response, 'render', None)) and not response.is_rendered
+
+
+async def _routed(response, replica):
+    with reading_from(replica):
+        response = await response
+        if _needs_render(response):
+            await offload(response.render)
+    return response
+
+
+def reads_from_replica(view_func):
+    """
+    Route the view's reads to the replica unless the client is pinned.
+
+    Template responses are rendered inside the routing scope so lazy
+    querysets evaluated by the template read from the replica too. Works
+    for async views, and for class-based views whose async handler is
+    reached through a sync ``dispatch``.
+    """
+    if iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def async_wrapper(request, *args, **kwargs):
+            return await _routed(view_func(request, *args, **kwargs), not is_pinned(request))
+        return async_wrapper
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        replica = not is_pinned(request)
+        with reading_from(replica):
+            response = view_func(request, *args, **kwargs)
+            if inspect.isawaitable(response):
+                return _routed(response, replica)
+            if _needs_render(response):
+                response.render()
+        return response
+    return wrapper
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _use_replica.get() and replica_enabled():
+            return REPLICA
+        return PRIMARY
+
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label not in UNTRACKED_APPS:
+            _wrote.set(True)
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # both aliases hold the same tables
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # the replica is a copy of the primary, never migrated on its own
+        return db != REPLICA
+
+
+class ReplicaPinMiddleware:
+    """Pin a client to the primary for a short while after it writes."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _wrote.set(False)
+        try:
+            response = self.get_response(request)
+            self.pin(response)
+        finally:
+            _wrote.reset(token)
+        return response
+
+    async def __acall__(self, request):
+        token = _wrote.set(False)
+        try:
+            # sync views run through sync_to_async, which copies _wrote back
+            response = await self.get_response(request)
+            self.pin(response)
+        finally:
+            _wrote.reset(token)
+        return response
+
+    def pin(self, response):
+        if _wrote.get() and replica_enabled():
+            response.set_cookie(
+                PIN_COOKIE, '1', max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True, samesite='Lax',
+            )
@@ -40,15 +40,21 @@ INSTALLED_APPS = [
     # local
     'store.apps.StoreConfig',
     'users.apps.UsersConfig',
+    'monitoring.apps.MonitoringConfig',
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'inventory.middleware.WhiteNoiseMiddleware',
+    'monitoring.middleware.RequestTimingMiddleware',
+    'monitoring.middleware.NPlusOneMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'store.permissions.RolePermissionMiddleware',
+    'monitoring.middleware.RequestProfilingMiddleware',
+    'inventory.routers.ReplicaPinMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -58,15 +64,23 @@ ROOT_URLCONF = 'inventory.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # Django's backend, with each render timed for monitoring
+        'BACKEND': 'monitoring.templates.DjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')],
-        'APP_DIRS': True,
         'OPTIONS': {
+            # compiled templates are kept in memory for the life of the process
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'store.permissions.permissions_context',
             ],
         },
     },
@@ -78,13 +92,54 @@ WSGI_APPLICATION = 'inventory.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/3.0/ref/settings/#databases
 
+# SQLite tuned for several gunicorn workers: WAL lets readers run alongside
+# the single writer, busy_timeout waits out short write locks, and IMMEDIATE
+# transactions take the write lock up front instead of failing on upgrade.
+# IMMEDIATE applies to every atomic() block, read-only ones included (the
+# admin wraps its change views in one), so those also queue behind writers;
+# reads outside atomic() are unaffected.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'wal',
+    'synchronous': 'normal',
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 5000)),
+    'cache_size': -20000,  # KiB
+    'mmap_size': 128 * 1024 * 1024,
+    'temp_store': 'memory',
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+        'CONN_MAX_AGE': int(os.environ.get('CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': ''.join('PRAGMA %s=%s;' % pragma for pragma in SQLITE_PRAGMAS.items()),
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
+# Optional local read replica (inventory/routers.py): list and report views
+# read from a copy of the primary refreshed by `manage.py refresh_replica`.
+if os.environ.get('SQLITE_REPLICA', '').lower() in ('1', 'true', 'yes'):
+    DATABASES['replica'] = dict(
+        DATABASES['default'],
+        NAME=os.environ.get('SQLITE_REPLICA_NAME', os.path.join(BASE_DIR, 'db.replica.sqlite3')),
+        OPTIONS=dict(
+            DATABASES['default']['OPTIONS'],
+            init_command=DATABASES['default']['OPTIONS']['init_command'] + 'PRAGMA query_only=1;',
+        ),
+        TEST={'MIRROR': 'default'},
+    )
+DATABASE_ROUTERS = ['inventory.routers.ReplicaRouter']
+# how long a client reads from the primary after writing
+REPLICA_PIN_SECONDS = 10
+
+# Retries of a write that still finds the database locked (inventory/db.py)
+SQLITE_LOCK_RETRIES = 4
+SQLITE_LOCK_BACKOFF = 0.05  # seconds, doubled per attempt and jittered
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
@@ -130,7 +185,15 @@ STATIC_URL = '/static/'
 
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
-# STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# collectstatic writes hashed names plus .gz/.br variants; WhiteNoise serves
+# hashed files with far-future cache headers. Pages are bundled by
+# `manage.py vendor_assets && manage.py build_assets` (see store/assets.py).
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'inventory.storage.StaticFilesStorage'},
+}
+# fall back to the plain name for files collected after the manifest was written
+WHITENOISE_MANIFEST_STRICT = False
 AUTH_USER_MODEL = 'users.User'
 
 # Default primary key field type
@@ -148,3 +211,90 @@ STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 
 
+# Cache backend: CACHE_BACKEND is 'locmem' (per process), 'file' (shared by
+# the workers of one host) or the dotted path of any cache backend, e.g.
+# django.core.cache.backends.redis.RedisCache with CACHE_LOCATION=redis://...
+# Invalidation bumps versions stored in this cache, so run several workers
+# on a shared backend.
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+}
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'locmem')
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS.get(CACHE_BACKEND, CACHE_BACKEND),
+        'LOCATION': os.environ.get(
+            'CACHE_LOCATION',
+            os.path.join(BASE_DIR, '.cache') if CACHE_BACKEND == 'file' else 'inventory',
+        ),
+        'KEY_PREFIX': os.environ.get('CACHE_KEY_PREFIX', 'inventory'),
+        'TIMEOUT': 300,
+        'OPTIONS': {'MAX_ENTRIES': 10000} if CACHE_BACKEND in CACHE_BACKENDS else {},
+    }
+}
+
+# Cached page chrome (sidebar, navbar): keyed on the user's role flags and
+# PERMISSION_VERSION, plus the deployed commit so new templates take effect
+CHROME_CACHE_TIMEOUT = 24 * 60 * 60
+TEMPLATE_CACHE_VERSION = os.environ.get('RENDER_GIT_COMMIT', '')
+
+# Cached tables of the reference data lists (season, drop, product)
+LIST_CACHE_TIMEOUT = 24 * 60 * 60
+
+# List pagination (keyset on -id, see store/pagination.py)
+LIST_PAGE_SIZE = 50
+LIST_PAGE_SIZE_MAX = 500
+ORDER_LIST_PAGE_SIZE = int(os.environ.get('ORDER_LIST_PAGE_SIZE', LIST_PAGE_SIZE))
+
+# Serve the dashboard, order/delivery lists and login as async views, which
+# run their independent queries concurrently on worker threads. Set by
+# inventory/asgi.py; under WSGI the sync views are used.
+ASYNC_VIEWS = os.environ.get('ASYNC_VIEWS', '').lower() in ('1', 'true', 'yes')
+
+# Role dashboards: rows per panel and how long a user's first page stays cached
+DASHBOARD_PANEL_SIZE = 10
+DASHBOARD_CACHE_TIMEOUT = 300
+
+# Rows fetched per round trip by the streaming exports
+EXPORT_CHUNK_SIZE = 2000
+
+# Upper bound on the ids one bulk order status request may carry
+BULK_STATUS_MAX_ORDERS = 1000
+
+# Order form selects: cached choice lists, and the size above which a select
+# switches to type-ahead against the autocomplete endpoint
+CHOICES_CACHE_TIMEOUT = 300
+ORDER_FORM_INLINE_CHOICES = int(os.environ.get('ORDER_FORM_INLINE_CHOICES', 200))
+AUTOCOMPLETE_LIMIT = 20
+
+# Full-text order search (store/search.py): results returned, and how many
+# of the newest matches are ranked to pick them
+ORDER_SEARCH_LIMIT = 50
+ORDER_SEARCH_WINDOW = 1000
+
+# Request timing (monitoring/): a Server-Timing header on every response,
+# and histograms per view at /metrics, readable by staff or by a scraper
+# sending "Authorization: Bearer $METRICS_TOKEN"
+SERVER_TIMING_HEADER = os.environ.get('SERVER_TIMING_HEADER', '1').lower() in ('1', 'true', 'yes')
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+# Slow-query log (monitoring/slowlog.py): statements taking SLOW_QUERY_MS or
+# more are buffered in memory (the newest SLOW_QUERY_BUFFER per process) and
+# saved every SLOW_QUERY_FLUSH_SECONDS; browse them under admin > Slow queries
+SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 100))
+SLOW_QUERY_BUFFER = 1000
+SLOW_QUERY_FLUSH_SECONDS = 30
+SLOW_QUERY_RETENTION_DAYS = 14
+
+# Request profiles (monitoring/profiling.py): staff add ?profile=1 or an
+# "X-Profile: 1" header to sample one request's stacks into PROFILE_DIR
+PROFILE_DIR = os.environ.get('PROFILE_DIR', os.path.join(BASE_DIR, 'profiles'))
+PROFILE_INTERVAL_MS = 2
+
+# N+1 detection (monitoring/nplusone.py): in development, a SELECT repeated
+# more than NPLUSONE_THRESHOLD times in one request is logged, or with
+# NPLUSONE_RAISE fails the request
+NPLUSONE_DETECT = os.environ.get('NPLUSONE_DETECT', str(DEBUG)).lower() in ('1', 'true', 'yes')
+NPLUSONE_RAISE = os.environ.get('NPLUSONE_RAISE', '').lower() in ('1', 'true', 'yes')
+NPLUSONE_THRESHOLD = int(os.environ.get('NPLUSONE_THRESHOLD', 5))
@@ -1,49 +1,174 @@
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
-from store.models import Product, Supplier, Buyer, Order, Delivery
+from inventory.aio import gather, offload
+from inventory.routers import reads_from_replica, use_primary
+from store import caching, counters, query_plans
+from store.models import Order, Delivery
+from store.pagination import keyset_paginate, link_page, parse_cursor
+from store.queries import supplier_products, with_delivery_columns, with_order_columns
+
+
+def _role_panels(user, role):
+    """Querysets behind each panel of the buyer and supplier dashboards."""
+    if role == 'buyer':
+        return {
+            'orders': with_order_columns(Order.objects.filter(buyer__user=user)),
+            'deliveries': with_delivery_columns(Delivery.objects.filter(buyer__user=user)),
+        }
+    return {
+        'products': supplier_products(user),
+        'orders': with_order_columns(Order.objects.filter(supplier__user=user)),
+        'deliveries': with_delivery_columns(Delivery.objects.filter(supplier__user=user)),
+    }
+
+
+for _role, _panels in (('buyer', ('orders', 'deliveries')),
+                       ('supplier', ('products', 'orders', 'deliveries'))):
+    for _panel in _panels:
+        query_plans.register(
+            'dashboard:%s-%s' % (_role, _panel),
+            lambda user, role=_role, panel=_panel: _role_panels(user, role)[panel],
+            roles=(_role,),
+            # the catalogue is walked newest-first, one index probe per
+            # product, until a page of the supplier's products is found
+            allow_scans=('store_product',) if _panel == 'products' else (),
+        )
+query_plans.register(
+    'dashboard:admin-orders',
+    lambda user: with_order_columns(Order.objects.all()),
+    roles=('admin',), allow_scans=('store_order',),
+)
+
+
+def _plan_panels(user, params, role):
+    """
+    Split the dashboard panels into pages found in the cache and reads
+    still to run, as ``(pages, {name: callable}, {name: cache key})``.
+
+    The newest page of each panel is cached per user until one of their
+    orders or deliveries changes (see store.signals). Older pages, asked for
+    with ``?<panel>_after=<id>``, are read straight from the database.
+    """
+    panels = _role_panels(user, role)
+    size = settings.DASHBOARD_PANEL_SIZE
+    prefix = caching.versioned_key(caching.dashboard_namespace(user.pk), size)
+    cursors = {name: parse_cursor(params.get('%s_after' % name)) for name in panels}
+    keys = {name: '%s:%s' % (prefix, name) for name in panels}
+
+    cached = cache.get_many([keys[name] for name in panels if cursors[name] is None])
+    pages, reads, fill = {}, {}, {}
+    for name, queryset in panels.items():
+        if keys[name] in cached:
+            pages[name] = cached[keys[name]]
+        elif cursors[name] is None:
+            reads[name] = partial(_first_page, queryset, size)
+            fill[name] = keys[name]
+        else:
+            reads[name] = partial(keyset_paginate, queryset, cursors[name], size)
+    return pages, reads, fill
+
+
+def _first_page(queryset, size):
+    # a page cached from a lagging replica would outlive the version bump
+    with use_primary():
+        return keyset_paginate(queryset, None, size)
+
+
+def _cache_panels(pages, fill):
+    if fill:
+        cache.set_many({key: pages[name] for name, key in fill.items()}, settings.DASHBOARD_CACHE_TIMEOUT)
+
+
+def _link_panels(pages, params):
+    # each panel's links move only its own cursor, keeping the others'
+    for name, page in pages.items():
+        link_page(page, params, '%s_after' % name)
+    return pages
+
+
+def _load_panels(request, role):
+    """Return a KeysetPage per dashboard panel."""
+    pages, reads, fill = _plan_panels(request.user, request.GET, role)
+    for name, read in reads.items():
+        pages[name] = read()
+    _cache_panels(pages, fill)
+    return _link_panels(pages, request.GET)
+
+
+async def _aload_panels(request, user, role):
+    """``_load_panels`` with the panels missing from the cache read concurrently."""
+    pages, reads, fill = await offload(_plan_panels, user, request.GET, role)
+    pages.update(await gather(reads))
+    await offload(_cache_panels, pages, fill)
+    return _link_panels(pages, request.GET)
+
+
+def _admin_reads():
+    # all four tiles come from one lookup on the counters table
+    return {
+        'totals': partial(counters.get_many, [
+            counters.PRODUCT, counters.SUPPLIER, counters.BUYER, counters.ORDER,
+        ]),
+        # Limit to recent 10
+        'orders': partial(list, with_order_columns(Order.objects.all())[:10]),
+        'deliveries': partial(list, with_delivery_columns(Delivery.objects.all())[:10]),
+    }
+
+
+def _admin_context(results):
+    totals = results['totals']
+    return {
+        'product': totals[counters.PRODUCT],
+        'supplier': totals[counters.SUPPLIER],
+        'buyer': totals[counters.BUYER],
+        'order': totals[counters.ORDER],
+        'orders': results['orders'],
+        'deliveries': results['deliveries'],
+    }
+
+
+def _dashboard_role(user):
+    if user.is_superuser:
+        return 'admin'
+    if user.is_buyer:
+        return 'buyer'
+    if user.is_supplier:
+        return 'supplier'
+    return None
+
 
 @login_required(login_url='login')
+@reads_from_replica
 def dashboard(request):
-    user = request.user
-    if user.is_superuser:
+    role = _dashboard_role(request.user)
+    if role == 'admin':
         # Admin: full access
-        total_product = Product.objects.count()
-        total_supplier = Supplier.objects.count()
-        total_buyer = Buyer.objects.count()
-        total_order = Order.objects.count()
-        orders = Order.objects.all().order_by('-id')[:10]  # Limit to recent 10
-        deliveries = Delivery.objects.all().order_by('-id')[:10]
-        context = {
-            'product': total_product,
-            'supplier': total_supplier,
-            'buyer': total_buyer,
-            'order': total_order,
-            'orders': orders,
-            'deliveries': deliveries,
-            'role': 'admin'
-        }
-    elif user.is_buyer:
-        # Buyer: view their orders and track deliveries
-        orders = Order.objects.filter(buyer__user=user).order_by('-id')
-        deliveries = Delivery.objects.filter(order__buyer__user=user).order_by('-id')
-        context = {
-            'orders': orders,
-            'deliveries': deliveries,
-            'role': 'buyer'
-        }
-    elif user.is_supplier:
-        # Supplier: their products, orders, deliveries
-        products = Product.objects.filter(order__supplier__user=user).distinct()
-        orders = Order.objects.filter(supplier__user=user).order_by('-id')
-        deliveries = Delivery.objects.filter(order__supplier__user=user).order_by('-id')
-        context = {
-            'products': products,
-            'orders': orders,
-            'deliveries': deliveries,
-            'role': 'supplier'
-        }
+        context = _admin_context({name: read() for name, read in _admin_reads().items()})
+    elif role:
+        # Buyer: their orders and deliveries; supplier: also their products
+        context = _load_panels(request, role)
     else:
         # Fallback
-        context = {'role': 'unknown'}
-    
-    return render(request, 'dashboard.html', context)
\ No newline at end of file
+        context = {}
+    context['role'] = role or 'unknown'
+    return render(request, 'dashboard.html', context)
+
+
+@login_required(login_url='login')
+@reads_from_replica
+async def dashboard_async(request):
+    """``dashboard`` for ASGI: the panels' queries run concurrently, each on its own connection."""
+    user = await request.auser()
+    role = _dashboard_role(user)
+    if role == 'admin':
+        context = _admin_context(await gather(_admin_reads()))
+    elif role:
+        context = await _aload_panels(request, user, role)
+    else:
+        context = {}
+    context['role'] = role or 'unknown'
+    return await offload(render, request, 'dashboard.html', context)
@@ -0,0 +1,92 @@
+import os
+
+from django.conf import settings
+from django.contrib import admin
+from django.db.models import Avg, Count, Max, Sum
+from django.http import FileResponse, Http404
+from django.shortcuts import get_object_or_404
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
+from django.utils.html import format_html
+
+from .models import RequestProfile, SlowQuery
+
+
+class SlowQueryAdmin(admin.ModelAdmin):
+    """
+    Opens on the slow statements grouped by fingerprint, worst total time
+    first; each group links to its individual runs.
+    """
+    list_display = ['created_date', 'duration', 'view', 'source', 'statement']
+    list_filter = ['view']
+    search_fields = ['sql', 'view', 'source']
+    readonly_fields = [field.name for field in SlowQuery._meta.fields]
+    groups_shown = 200
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def changelist_view(self, request, extra_context=None):
+        # any filter, search or ordering shows the plain list of runs
+        if request.GET:
+            return super().changelist_view(request, extra_context)
+        groups = (
+            SlowQuery.objects.values('fingerprint')
+            .annotate(
+                runs=Count('id'), total=Sum('duration'), mean=Avg('duration'), worst=Max('duration'),
+                views=Count('view', distinct=True), last_seen=Max('created_date'),
+                statement=Max('statement'), source=Max('source'),
+            )
+            .order_by('-total')[:self.groups_shown]
+        )
+        context = dict(
+            self.admin_site.each_context(request),
+            opts=self.model._meta,
+            title='Slow queries by fingerprint',
+            groups=groups,
+            **(extra_context or {}),
+        )
+        return TemplateResponse(request, 'admin/monitoring/slowquery/fingerprints.html', context)
+
+
+admin.site.register(SlowQuery, SlowQueryAdmin)
+
+
+class RequestProfileAdmin(admin.ModelAdmin):
+    list_display = ['created_date', 'view', 'path', 'username', 'status', 'duration', 'samples', 'download']
+    list_filter = ['view']
+    readonly_fields = [field.name for field in RequestProfile._meta.fields] + ['download']
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    @admin.display(description='Collapsed stacks')
+    def download(self, obj):
+        url = reverse('admin:monitoring_requestprofile_download', args=[obj.pk])
+        return format_html('<a href="{}">{}</a>', url, obj.filename)
+
+    def get_urls(self):
+        return [
+            path(
+                '<int:pk>/download/', self.admin_site.admin_view(self.download_view),
+                name='monitoring_requestprofile_download',
+            ),
+        ] + super().get_urls()
+
+    def download_view(self, request, pk):
+        profile = get_object_or_404(RequestProfile, pk=pk)
+        if not self.has_view_permission(request, profile):
+            raise Http404
+        filename = os.path.join(settings.PROFILE_DIR, os.path.basename(profile.filename))
+        if not os.path.exists(filename):
+            raise Http404('The profile file is gone.')
+        return FileResponse(open(filename, 'rb'), as_attachment=True, content_type='text/plain')
+
+
+admin.site.register(RequestProfile, RequestProfileAdmin)
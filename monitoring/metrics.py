@@ -0,0 +1,130 @@
+"""
+In-process request metrics, rendered in the Prometheus text format.
+
+Every worker process keeps its own series: scrape each worker (or put one
+worker behind the /metrics target) and let Prometheus sum them. Observing
+a value is a bisect and two additions under a lock; the cumulative bucket
+counts are only worked out when /metrics is scraped.
+"""
+import threading
+from bisect import bisect_left
+
+# seconds
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100, 250)
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(names, values, **extra):
+    pairs = list(zip(names, values)) + list(extra.items())
+    return '{%s}' % ','.join('%s="%s"' % (name, _escape(value)) for name, value in pairs)
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    def __init__(self, name, help, buckets, labels=('view',)):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self.labels = tuple(labels)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # per-bucket counts (the last is +Inf), then the sum
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self):
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        lines = ['# HELP %s %s' % (self.name, self.help), '# TYPE %s histogram' % self.name]
+        for labels, series in sorted(snapshot.items()):
+            total = 0
+            for bound, count in zip(self.buckets + ('+Inf',), series):
+                total += count
+                lines.append('%s_bucket%s %d' % (self.name, _labels(self.labels, labels, le=bound), total))
+            lines.append('%s_sum%s %s' % (self.name, _labels(self.labels, labels), _number(series[-1])))
+            lines.append('%s_count%s %d' % (self.name, _labels(self.labels, labels), total))
+        return lines
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+
+class Counter:
+    def __init__(self, name, help, labels=('view',)):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + 1
+
+    def render(self):
+        with self._lock:
+            snapshot = dict(self._values)
+        lines = ['# HELP %s %s' % (self.name, self.help), '# TYPE %s counter' % self.name]
+        for labels, value in sorted(snapshot.items()):
+            lines.append('%s%s %d' % (self.name, _labels(self.labels, labels), value))
+        return lines
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+
+REQUEST_DURATION = Histogram(
+    'inventory_request_duration_seconds', 'Time to handle a request, below the static files.',
+    DURATION_BUCKETS,
+)
+DB_DURATION = Histogram(
+    'inventory_request_db_duration_seconds', 'Time a request spent running SQL.', DURATION_BUCKETS,
+)
+DB_QUERIES = Histogram(
+    'inventory_request_db_queries', 'SQL queries run by a request.', QUERY_BUCKETS,
+)
+TEMPLATE_DURATION = Histogram(
+    'inventory_request_template_duration_seconds',
+    'Time a request spent rendering templates, not counting the queries they ran.', DURATION_BUCKETS,
+)
+RESPONSES = Counter(
+    'inventory_responses_total', 'Responses by view and status code.', labels=('view', 'status'),
+)
+
+REGISTRY = (REQUEST_DURATION, DB_DURATION, DB_QUERIES, TEMPLATE_DURATION, RESPONSES)
+
+
+def record(view, status, total, stats):
+    REQUEST_DURATION.observe(total, view)
+    DB_DURATION.observe(stats.db_time, view)
+    DB_QUERIES.observe(stats.queries, view)
+    TEMPLATE_DURATION.observe(stats.template_time, view)
+    RESPONSES.inc(view, status)
+
+
+def render():
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+
+def clear():
+    for metric in REGISTRY:
+        metric.clear()
@@ -0,0 +1,148 @@
+import logging
+import threading
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from inventory.aio import offload
+
+from . import metrics, profiling
+from .nplusone import NPlusOneError, detect_nplusone
+from .timing import collecting, view_name
+
+
+logger = logging.getLogger('monitoring.nplusone')
+
+
+def server_timing(stats, total):
+    return 'db;dur=%.1f;desc="%d queries", tpl;dur=%.1f, total;dur=%.1f' % (
+        stats.db_time * 1000, stats.queries, stats.template_time * 1000, total * 1000,
+    )
+
+
+class RequestTimingMiddleware:
+    """
+    Time each request and record its query count, database and template
+    time under the name of the view it resolved to: as a Server-Timing
+    header on the response, and in the histograms /metrics serves.
+
+    Streaming responses are measured up to their first byte; the rows
+    they send afterwards are not counted.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.header = settings.SERVER_TIMING_HEADER
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = perf_counter()
+        with collecting(request) as stats:
+            response = self.get_response(request)
+        return self.finish(request, response, stats, perf_counter() - started)
+
+    async def __acall__(self, request):
+        started = perf_counter()
+        with collecting(request) as stats:
+            response = await self.get_response(request)
+        return self.finish(request, response, stats, perf_counter() - started)
+
+    def finish(self, request, response, stats, total):
+        metrics.record(view_name(request), response.status_code, total, stats)
+        if self.header:
+            response.headers['Server-Timing'] = server_timing(stats, total)
+        return response
+
+
+class RequestProfilingMiddleware:
+    """
+    Profile the rest of the request when a staff user asks for it (see
+    monitoring.profiling); the response's X-Profile header names the
+    saved RequestProfile. Others' requests pass straight through.
+
+    Sits below RolePermissionMiddleware, which has loaded the user by the
+    time an async request gets here.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.allowed(request):
+            return self.get_response(request)
+        user = request.user
+        with profiling.profiling([threading.get_ident()]) as profile:
+            response = self.get_response(request)
+        return self.finish(profiling.save(profile, request, user, view_name(request), response.status_code), response)
+
+    async def __acall__(self, request):
+        if not self.allowed(request):
+            return await self.get_response(request)
+        user = request.user
+        # the event loop only waits; the request's work is on the threads it offloads to
+        with profiling.profiling() as profile:
+            response = await self.get_response(request)
+        saved = await offload(profiling.save, profile, request, user, view_name(request), response.status_code)
+        return self.finish(saved, response)
+
+    def allowed(self, request):
+        return profiling.wants_profile(request) and request.user.is_staff
+
+    def finish(self, saved, response):
+        response.headers['X-Profile'] = str(saved.pk)
+        return response
+
+
+class NPlusOneMiddleware:
+    """
+    Report N+1 queries (see monitoring.nplusone) in every request: logged
+    as a warning, or raised as NPlusOneError with NPLUSONE_RAISE. Only
+    installed while NPLUSONE_DETECT is on.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.NPLUSONE_DETECT:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.raise_error = settings.NPLUSONE_RAISE
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with detect_nplusone() as detector:
+            response = self.get_response(request)
+        return self.check(request, response, detector)
+
+    async def __acall__(self, request):
+        with detect_nplusone() as detector:
+            response = await self.get_response(request)
+        return self.check(request, response, detector)
+
+    def check(self, request, response, detector):
+        if detector.repeats():
+            # this runs above the session and auth middleware, before the URL
+            # is resolved; view_name works here only because the handler has
+            # set request.resolver_match by the time the response comes back
+            # (a response from a middleware below reads as unmatched)
+            report = detector.report('%s (%s)' % (view_name(request), request.get_full_path()))
+            if self.raise_error:
+                raise NPlusOneError(report)
+            logger.warning(report)
+        return response
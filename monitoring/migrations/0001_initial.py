@@ -0,0 +1,32 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SlowQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(db_index=True, max_length=16)),
+                ('statement', models.TextField(help_text='The SQL with its values taken out.')),
+                ('sql', models.TextField()),
+                ('params', models.TextField(blank=True)),
+                ('duration', models.FloatField(help_text='Milliseconds.')),
+                ('view', models.CharField(blank=True, max_length=200)),
+                ('source', models.CharField(blank=True, help_text='Template or code line that ran it.', max_length=300)),
+                ('created_date', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'verbose_name_plural': 'slow queries',
+                'ordering': ['-created_date'],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('monitoring', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('username', models.CharField(max_length=150)),
+                ('path', models.CharField(max_length=500)),
+                ('view', models.CharField(blank=True, max_length=200)),
+                ('status', models.PositiveSmallIntegerField()),
+                ('duration', models.FloatField(help_text='Milliseconds.')),
+                ('samples', models.PositiveIntegerField()),
+                ('filename', models.CharField(help_text='Collapsed stacks, in PROFILE_DIR.', max_length=200)),
+                ('created_date', models.DateTimeField(db_index=True)),
+            ],
+            options={
+                'ordering': ['-created_date'],
+            },
+        ),
+    ]
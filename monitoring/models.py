@@ -0,0 +1,39 @@
+from django.db import models
+
+
+class SlowQuery(models.Model):
+    """A statement that took longer than SLOW_QUERY_MS (see monitoring.slowlog)."""
+    fingerprint = models.CharField(max_length=16, db_index=True)
+    statement = models.TextField(help_text='The SQL with its values taken out.')
+    sql = models.TextField()
+    params = models.TextField(blank=True)
+    duration = models.FloatField(help_text='Milliseconds.')
+    view = models.CharField(max_length=200, blank=True)
+    source = models.CharField(max_length=300, blank=True, help_text='Template or code line that ran it.')
+    created_date = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ['-created_date']
+        verbose_name_plural = 'slow queries'
+
+    def __str__(self):
+        return '%.0f ms: %s' % (self.duration, self.statement[:80])
+
+
+class RequestProfile(models.Model):
+    """A sampled profile of one request, saved under PROFILE_DIR (see monitoring.profiling)."""
+    # a name rather than a key, so deleting a user has no profiles to visit
+    username = models.CharField(max_length=150)
+    path = models.CharField(max_length=500)
+    view = models.CharField(max_length=200, blank=True)
+    status = models.PositiveSmallIntegerField()
+    duration = models.FloatField(help_text='Milliseconds.')
+    samples = models.PositiveIntegerField()
+    filename = models.CharField(max_length=200, help_text='Collapsed stacks, in PROFILE_DIR.')
+    created_date = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ['-created_date']
+
+    def __str__(self):
+        return '%s (%.0f ms)' % (self.path, self.duration)
@@ -0,0 +1,82 @@
+"""
+Spotting N+1 queries: the same SELECT, differing only in its values, run
+over and over in one request, usually a foreign key loaded lazily per row
+of a loop.
+
+``NPlusOneMiddleware`` watches every request when NPLUSONE_DETECT is on
+(by default whenever DEBUG is); ``detect_nplusone`` watches a block of
+code, e.g. in a test. Statements are grouped by fingerprint
+(monitoring.sql); a group run more than NPLUSONE_THRESHOLD times is
+reported with the template line or code frame that ran it, and with
+NPLUSONE_RAISE (or ``raise_error``) fails the request or test.
+"""
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+from . import sql as sqltools
+from .slowlog import query_source
+
+_detector = ContextVar('nplusone_detector', default=None)
+
+
+class NPlusOneError(Exception):
+    pass
+
+
+class Repeat:
+    __slots__ = ('statement', 'count', 'source')
+
+    def __init__(self, statement, count, source):
+        self.statement = statement
+        self.count = count
+        self.source = source
+
+    def __str__(self):
+        return '%d x %s (from %s)' % (self.count, self.statement, self.source or 'unknown')
+
+
+class Detector:
+    def __init__(self, threshold=None):
+        self.threshold = settings.NPLUSONE_THRESHOLD if threshold is None else threshold
+        self.counts = Counter()
+        self.sources = {}
+
+    def record(self, sql):
+        if not sql.lstrip()[:6].upper() == 'SELECT':
+            return
+        statement = sqltools.normalize(sql)
+        self.counts[statement] += 1
+        # where the repeats come from, noted once the statement crosses the line
+        if self.counts[statement] == self.threshold + 1:
+            self.sources[statement] = query_source()
+
+    def repeats(self):
+        return [
+            Repeat(statement, count, self.sources.get(statement, ''))
+            for statement, count in self.counts.most_common() if count > self.threshold
+        ]
+
+    def report(self, where):
+        return 'N+1 queries in %s:\n%s' % (where, '\n'.join('  %s' % repeat for repeat in self.repeats()))
+
+
+def record(sql):
+    detector = _detector.get()
+    if detector is not None:
+        detector.record(sql)
+
+
+@contextmanager
+def detect_nplusone(threshold=None, raise_error=False, where='block'):
+    """Watch the block for N+1 queries; raises NPlusOneError on exit when ``raise_error``."""
+    detector = Detector(threshold)
+    token = _detector.set(detector)
+    try:
+        yield detector
+    finally:
+        _detector.reset(token)
+    if raise_error and detector.repeats():
+        raise NPlusOneError(detector.report(where))
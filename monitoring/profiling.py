@@ -0,0 +1,146 @@
+"""
+Sampling profiles of single requests.
+
+A staff user asks for one with ``?profile=1`` or an ``X-Profile: 1``
+header. While the view runs and its response renders, a daemon thread
+reads the stacks of the request's threads every PROFILE_INTERVAL_MS and
+counts them. The result is written to PROFILE_DIR in the collapsed-stack
+format (``outer;inner;innermost count`` per line) that flamegraph.pl,
+speedscope and inferno read, and listed in the admin as a RequestProfile.
+
+Async views run their blocking work on worker threads; ``inventory.aio``
+marks those threads with ``sampled_thread`` so they are sampled while
+they work for the profiled request.
+"""
+import os
+import sys
+import sysconfig
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.text import slugify
+
+_profile = ContextVar('request_profile', default=None)
+
+SITE_PACKAGES = 'site-packages' + os.sep
+STDLIB = sysconfig.get_paths()['stdlib'] + os.sep
+
+
+def _asks(value):
+    return value.strip() not in ('', '0')
+
+
+def wants_profile(request):
+    """``?profile=`` or ``X-Profile:`` set to anything but nothing or 0."""
+    return _asks(request.GET.get('profile', '')) or _asks(request.headers.get('X-Profile', ''))
+
+
+def _label(code, labels):
+    label = labels.get(code)
+    if label is None:
+        filename = code.co_filename
+        if SITE_PACKAGES in filename:
+            filename = filename.split(SITE_PACKAGES, 1)[1]
+        elif filename.startswith(STDLIB):
+            filename = filename[len(STDLIB):]
+        elif filename.startswith(str(settings.BASE_DIR)):
+            filename = os.path.relpath(filename, settings.BASE_DIR)
+        # ';' separates frames in the collapsed format
+        label = labels[code] = ('%s (%s:%d)' % (code.co_name, filename, code.co_firstlineno)).replace(';', ':')
+    return label
+
+
+class Profile:
+    """Samples the stacks of ``threads`` until stopped."""
+
+    def __init__(self, interval, threads=()):
+        self.interval = interval
+        self.threads = set(threads)
+        self.stacks = Counter()
+        self.samples = 0
+        self.duration = 0.0
+        self._labels = {}
+        self._stopped = threading.Event()
+        self._sampler = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+
+    def start(self):
+        self._started = perf_counter()
+        self._sampler.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._sampler.join()
+        self.duration = perf_counter() - self._started
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frames = sys._current_frames()
+            for ident in list(self.threads):
+                frame = frames.get(ident)
+                if frame is not None:
+                    self.stacks[self._collapse(frame)] += 1
+                    self.samples += 1
+
+    def _collapse(self, frame):
+        labels = []
+        while frame is not None:
+            labels.append(_label(frame.f_code, self._labels))
+            frame = frame.f_back
+        return ';'.join(reversed(labels))
+
+    def collapsed(self):
+        return ''.join('%s %d\n' % (stack, count) for stack, count in sorted(self.stacks.items()))
+
+
+@contextmanager
+def profiling(threads=()):
+    """Sample ``threads``, and any thread marked by ``sampled_thread``, inside the block."""
+    profile = Profile(settings.PROFILE_INTERVAL_MS / 1000, threads)
+    token = _profile.set(profile)
+    profile.start()
+    try:
+        yield profile
+    finally:
+        profile.stop()
+        _profile.reset(token)
+
+
+@contextmanager
+def sampled_thread():
+    """Sample the current thread inside the block if the request is being profiled."""
+    profile = _profile.get()
+    ident = threading.get_ident()
+    if profile is None or ident in profile.threads:
+        yield
+        return
+    profile.threads.add(ident)
+    try:
+        yield
+    finally:
+        profile.threads.discard(ident)
+
+
+def save(profile, request, user, view, status):
+    """Write ``profile`` to PROFILE_DIR and record it; returns the RequestProfile."""
+    from .models import RequestProfile
+
+    created = timezone.now()
+    os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+    filename = '%s-%s.collapsed' % (created.strftime('%Y%m%d-%H%M%S-%f'), slugify(view) or 'request')
+    with open(os.path.join(settings.PROFILE_DIR, filename), 'w') as f:
+        f.write(profile.collapsed())
+    return RequestProfile.objects.create(
+        created_date=created,
+        username=user.get_username(),
+        path=request.get_full_path()[:500],
+        view=view,
+        status=status,
+        duration=profile.duration * 1000,
+        samples=profile.samples,
+        filename=filename,
+    )
@@ -0,0 +1,138 @@
+"""
+The slow-query log.
+
+``query_timer`` (monitoring.timing) hands every statement that took at
+least SLOW_QUERY_MS to ``capture``, which notes the view serving the
+request and the template or code line that ran it, and appends it to an
+in-memory ring buffer of SLOW_QUERY_BUFFER entries; when statements come
+faster than they are saved, the oldest are dropped. A daemon thread per
+process saves the buffer as SlowQuery rows every SLOW_QUERY_FLUSH_SECONDS
+(and at exit), and deletes rows older than SLOW_QUERY_RETENTION_DAYS.
+"""
+import atexit
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.template.base import Node
+from django.utils import timezone
+
+from inventory.db import retry_on_locked
+
+from . import sql as sqltools
+
+logger = logging.getLogger(__name__)
+
+PARAMS_MAX_LENGTH = 1000
+PROJECT_DIR = str(settings.BASE_DIR) + os.sep
+# the instrumentation calling query_source, skipped when looking for the caller
+INSTRUMENTATION = ('monitoring.timing', 'monitoring.slowlog', 'monitoring.nplusone')
+
+_buffer = deque(maxlen=settings.SLOW_QUERY_BUFFER)
+# set while the log saves itself, so its own statements are not captured
+_saving = ContextVar('saving_slow_queries', default=False)
+_flusher = None
+_flusher_lock = threading.Lock()
+
+
+def query_source():
+    """
+    Where the running statement comes from: the innermost template tag on
+    the stack as ``name:line``, or else the innermost project code line.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        node = frame.f_locals.get('self')
+        # type(), not isinstance(): that would evaluate lazy objects such as request.user
+        if issubclass(type(node), Node) and getattr(node, 'origin', None) is not None:
+            return '%s:%d' % (node.origin.template_name, node.token.lineno)
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(PROJECT_DIR) and 'site-packages' not in filename
+            and frame.f_globals.get('__name__') not in INSTRUMENTATION
+        ):
+            return '%s:%d in %s' % (filename[len(PROJECT_DIR):], frame.f_lineno, frame.f_code.co_name)
+        frame = frame.f_back
+    return ''
+
+
+def capture(sql, params, duration, view):
+    """Buffer a statement that took ``duration`` seconds."""
+    if _saving.get():
+        return
+    _buffer.append({
+        'sql': sql,
+        'params': repr(params)[:PARAMS_MAX_LENGTH] if params else '',
+        'duration': duration * 1000,
+        'view': view,
+        'source': query_source()[:300],
+        'created_date': timezone.now(),
+    })
+    _start_flusher()
+
+
+def _drain():
+    records = []
+    while True:
+        try:
+            records.append(_buffer.popleft())
+        except IndexError:
+            return records
+
+
+@retry_on_locked
+def _save(rows):
+    from .models import SlowQuery
+
+    SlowQuery.objects.bulk_create(rows)
+    cutoff = timezone.now() - timedelta(days=settings.SLOW_QUERY_RETENTION_DAYS)
+    SlowQuery.objects.filter(created_date__lt=cutoff).delete()
+
+
+def flush():
+    """Save the buffered statements; returns how many there were."""
+    from .models import SlowQuery
+
+    records = _drain()
+    if not records:
+        return 0
+    rows = []
+    for record in records:
+        rows.append(SlowQuery(
+            statement=sqltools.normalize(record['sql']), fingerprint=sqltools.fingerprint(record['sql']), **record
+        ))
+    token = _saving.set(True)
+    try:
+        _save(rows)
+    finally:
+        _saving.reset(token)
+    return len(rows)
+
+
+def _flush_forever():
+    while True:
+        time.sleep(settings.SLOW_QUERY_FLUSH_SECONDS)
+        try:
+            flush()
+        except Exception:
+            logger.exception('Could not save the slow-query log')
+        finally:
+            close_old_connections()
+
+
+def _start_flusher():
+    global _flusher
+    if _flusher is not None or settings.SLOW_QUERY_FLUSH_SECONDS <= 0:
+        return
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_forever, name='slow-query-log', daemon=True)
+            _flusher.start()
+            atexit.register(flush)
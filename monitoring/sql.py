@@ -0,0 +1,28 @@
+"""
+Fingerprints of SQL statements: the same statement with different values,
+or a different number of them in an IN list or VALUES, gets the same one.
+"""
+import hashlib
+import re
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'(?<![\w."])-?\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_RE = re.compile(r'%s|\?')
+_LIST_RE = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_ROWS_RE = re.compile(r'\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def normalize(sql):
+    """``sql`` with every value replaced by ``?`` and lists of them by ``(...)``."""
+    sql = _STRING_RE.sub('?', sql)
+    sql = _NUMBER_RE.sub('?', sql)
+    sql = _PLACEHOLDER_RE.sub('?', sql)
+    sql = _LIST_RE.sub('(...)', sql)
+    sql = _ROWS_RE.sub('(...)', sql)
+    return _SPACE_RE.sub(' ', sql).strip()
+
+
+def fingerprint(sql):
+    """A short hash of ``normalize(sql)``."""
+    return hashlib.sha1(normalize(sql).encode()).hexdigest()[:16]
@@ -0,0 +1,27 @@
+"""
+The Django template backend, with each render timed for the request's
+Server-Timing and metrics (see monitoring.timing). Only top-level
+renders go through the backend, so included templates are not counted
+twice.
+"""
+from django.template import TemplateDoesNotExist
+from django.template.backends import django as backend
+
+from .timing import timing_render
+
+
+class Template(backend.Template):
+    def render(self, context=None, request=None):
+        with timing_render():
+            return super().render(context, request)
+
+
+class DjangoTemplates(backend.DjangoTemplates):
+    def from_string(self, template_code):
+        return Template(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return Template(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            backend.reraise(exc, self)
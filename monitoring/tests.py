@@ -0,0 +1,183 @@
+import os
+import re
+import tempfile
+
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from store.models import Product, Season
+from users.models import User
+
+from . import metrics, slowlog
+from .middleware import NPlusOneMiddleware
+from .models import RequestProfile, SlowQuery
+from .nplusone import NPlusOneError, detect_nplusone
+from .sql import fingerprint, normalize
+
+
+class RequestTimingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # the admin user comes from users/migrations/0004_create_admin.py
+        cls.admin = User.objects.get(username='admin')
+
+    def setUp(self):
+        metrics.clear()
+        self.client.force_login(self.admin)
+
+    def test_server_timing_counts_the_requests_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('season-list'))
+        timing = response.headers['Server-Timing']
+        self.assertRegex(timing, r'^db;dur=[\d.]+;desc="\d+ queries", tpl;dur=[\d.]+, total;dur=[\d.]+$')
+        self.assertEqual(int(re.search(r'(\d+) queries', timing).group(1)), len(queries))
+
+    def test_metrics_aggregate_by_view_name(self):
+        self.client.get(reverse('season-list'))
+        self.client.get(reverse('season-list'))
+        body = self.client.get(reverse('metrics')).content.decode()
+        self.assertIn('inventory_request_duration_seconds_count{view="season-list"} 2', body)
+        self.assertIn('inventory_request_db_queries_bucket{view="season-list",le="+Inf"} 2', body)
+        self.assertIn('inventory_responses_total{view="season-list",status="200"} 2', body)
+
+    @override_settings(METRICS_TOKEN='s3cret')
+    def test_metrics_need_staff_or_the_token(self):
+        self.client.logout()
+        self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+        response = self.client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer s3cret')
+        self.assertEqual(response.status_code, 200)
+
+
+class SlowQueryLogTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.get(username='admin')
+
+    def setUp(self):
+        slowlog._buffer.clear()
+        self.addCleanup(slowlog._buffer.clear)
+        self.client.force_login(self.admin)
+
+    def test_fingerprint_ignores_values(self):
+        self.assertEqual(
+            normalize("SELECT * FROM t WHERE a IN (%s, %s) AND b = 'x' LIMIT 21"),
+            'SELECT * FROM t WHERE a IN (...) AND b = ? LIMIT ?',
+        )
+        self.assertEqual(
+            fingerprint('SELECT * FROM t WHERE a IN (%s)'), fingerprint('SELECT * FROM t WHERE a IN (%s, %s, %s)'),
+        )
+
+    @override_settings(SLOW_QUERY_MS=0, SLOW_QUERY_FLUSH_SECONDS=0)
+    def test_slow_queries_are_saved_with_their_view_and_source(self):
+        cache.clear()
+        self.client.get(reverse('season-list'))
+        self.assertGreater(slowlog.flush(), 0)
+        self.assertEqual(slowlog.flush(), 0)
+
+        query = SlowQuery.objects.filter(view='season-list', sql__contains='store_season').first()
+        self.assertIsNotNone(query)
+        self.assertRegex(query.source, r'^(store/.+\.py:\d+ in \w+|.+\.html:\d+)$')
+        self.assertEqual(query.fingerprint, fingerprint(query.sql))
+
+    @override_settings(SLOW_QUERY_MS=0, SLOW_QUERY_FLUSH_SECONDS=0)
+    def test_admin_groups_by_fingerprint(self):
+        cache.clear()
+        self.client.get(reverse('season-list'))
+        self.client.get(reverse('season-list'))
+        slowlog.flush()
+        with self.settings(SLOW_QUERY_MS=1000):
+            response = self.client.get(reverse('admin:monitoring_slowquery_changelist'))
+            self.assertContains(response, 'store_season')
+            self.assertLess(len(response.context['groups']), SlowQuery.objects.count())
+            one = response.context['groups'][0]['fingerprint']
+            response = self.client.get(reverse('admin:monitoring_slowquery_changelist'), {'fingerprint': one})
+            self.assertEqual(response.status_code, 200)
+
+
+class RequestProfileTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.get(username='admin')
+        cls.clerk = User.objects.create_user('clerk', password='x', is_buyer=True)
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        profile_settings = self.settings(PROFILE_DIR=self.directory, PROFILE_INTERVAL_MS=0.5)
+        profile_settings.enable()
+        self.addCleanup(profile_settings.disable)
+
+    def test_staff_profile_a_request(self):
+        self.client.force_login(self.admin)
+        response = self.client.get(reverse('dashboard'), {'profile': 1})
+        profile = RequestProfile.objects.get(pk=response.headers['X-Profile'])
+        self.assertEqual((profile.view, profile.username, profile.status), ('dashboard', 'admin', 200))
+
+        with open(os.path.join(self.directory, profile.filename)) as f:
+            for line in f:
+                self.assertRegex(line, r'^\S.* \d+$')
+        download = self.client.get(reverse('admin:monitoring_requestprofile_download', args=[profile.pk]))
+        self.assertEqual(download.status_code, 200)
+
+    def test_others_cannot_ask_for_a_profile(self):
+        self.client.force_login(self.clerk)
+        response = self.client.get(reverse('dashboard'), HTTP_X_PROFILE='1')
+        self.assertNotIn('X-Profile', response.headers)
+        self.assertFalse(RequestProfile.objects.exists())
+
+    def test_zero_turns_profiling_off_either_way(self):
+        self.client.force_login(self.admin)
+        for response in (
+            self.client.get(reverse('dashboard'), {'profile': 0}),
+            self.client.get(reverse('dashboard'), HTTP_X_PROFILE='0'),
+            self.client.get(reverse('dashboard'), {'profile': ''}),
+        ):
+            self.assertNotIn('X-Profile', response.headers)
+        self.assertIn('X-Profile', self.client.get(reverse('dashboard'), HTTP_X_PROFILE='1').headers)
+
+
+class NPlusOneTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.get(username='admin')
+        for n in range(4):
+            Season.objects.create(name='Season %d' % n, description='')
+
+    def test_repeated_statements_are_reported_with_their_source(self):
+        with detect_nplusone(threshold=2) as detector:
+            for season in Season.objects.all():
+                list(Product.objects.filter(name=season.name))
+        [repeat] = detector.repeats()
+        self.assertEqual(repeat.count, 4)
+        self.assertIn('"store_product"', repeat.statement)
+        self.assertRegex(repeat.source, r'^monitoring/tests\.py:\d+ in test_')
+
+    def test_raise_error_fails_the_block(self):
+        with self.assertRaises(NPlusOneError):
+            with detect_nplusone(threshold=2, raise_error=True):
+                for season in Season.objects.all():
+                    list(Product.objects.filter(name=season.name))
+        with detect_nplusone(threshold=2, raise_error=True):
+            list(Product.objects.filter(name__in=Season.objects.values('name')))
+
+    @override_settings(NPLUSONE_DETECT=True, NPLUSONE_RAISE=True, NPLUSONE_THRESHOLD=2)
+    def test_middleware_checks_every_request(self):
+        def lazy_view(request):
+            for season in Season.objects.all():
+                list(Product.objects.filter(name=season.name))
+            return HttpResponse()
+
+        with self.assertRaisesMessage(NPlusOneError, 'monitoring/tests.py'):
+            NPlusOneMiddleware(lazy_view)(RequestFactory().get('/'))
+        self.client.force_login(self.admin)
+        self.assertEqual(self.client.get(reverse('season-list')).status_code, 200)
+
+    def test_middleware_is_off_by_default(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            NPlusOneMiddleware(lambda request: HttpResponse())
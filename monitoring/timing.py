@@ -0,0 +1,94 @@
+"""
+Where one request spends its time.
+
+``RequestTimingMiddleware`` opens a ``RequestStats`` for each request in a
+context variable. Every database connection carries ``query_timer`` and
+the template backend (monitoring.templates) times each render; both add
+to whatever stats are current, if any. Context
+variables follow the work onto the worker threads async views offload
+to, so queries on those threads' connections are counted too.
+
+Statements slower than SLOW_QUERY_MS also go to the slow-query log
+(monitoring.slowlog), inside a request or not, and every statement to the
+N+1 detector (monitoring.nplusone) when one is watching.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+from django.conf import settings
+
+from . import nplusone, slowlog
+
+_stats = ContextVar('request_stats', default=None)
+
+UNMATCHED = '<unmatched>'
+
+
+class RequestStats:
+    """Query count and seconds spent in the database and in templates."""
+    __slots__ = ('request', 'queries', 'db_time', 'template_time')
+
+    def __init__(self, request=None):
+        self.request = request
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+
+
+def current():
+    return _stats.get()
+
+
+@contextmanager
+def collecting(request=None):
+    """Collect ``RequestStats`` for everything run inside the block."""
+    stats = RequestStats(request)
+    token = _stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _stats.reset(token)
+
+
+def view_name(request):
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match is not None else UNMATCHED
+
+
+def query_timer(execute, sql, params, many, context):
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = perf_counter() - started
+        stats = _stats.get()
+        if stats is not None:
+            # concurrent reads of an async view share the stats; an increment
+            # lost to a thread switch here is within the histograms' resolution
+            stats.db_time += elapsed
+            stats.queries += 1
+        nplusone.record(sql)
+        if elapsed * 1000 >= settings.SLOW_QUERY_MS:
+            slowlog.capture(sql, params, elapsed, view_name(stats.request) if stats else '')
+
+
+def install_query_timer(sender, connection, **kwargs):
+    # connection_created fires again each time a connection reopens
+    if query_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, query_timer)
+
+
+@contextmanager
+def timing_render():
+    """Add the block's time to the template total, less the queries it ran."""
+    stats = _stats.get()
+    if stats is None:
+        yield
+        return
+    started = perf_counter()
+    db_before = stats.db_time
+    try:
+        yield
+    finally:
+        stats.template_time += perf_counter() - started - (stats.db_time - db_before)
@@ -0,0 +1,21 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+from . import metrics as registry
+
+
+def can_scrape(request):
+    token = settings.METRICS_TOKEN
+    authorization = request.headers.get('Authorization', '')
+    if token and hmac.compare_digest(authorization.encode(), ('Bearer %s' % token).encode()):
+        return True
+    return request.user.is_authenticated and request.user.is_staff
+
+
+def metrics(request):
+    """Request metrics in the Prometheus text format, for staff or a bearer of METRICS_TOKEN."""
+    if not can_scrape(request):
+        return HttpResponseForbidden('Not allowed to read metrics.')
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,89 @@
+// Type-ahead for selects rendered with data-autocomplete-url: a search box is
+// put in front of the select and its options are replaced with the matches.
+// Endpoints that page their results return a "next" cursor, which a "More"
+// button passes back as ?after= to append the following page.
+(function () {
+    'use strict';
+
+    var DELAY = 250;
+
+    function addOptions(select, results) {
+        var selected = select.value;
+        results.forEach(function (result) {
+            var option = new Option(result.text, result.id);
+            option.selected = String(result.id) === selected;
+            select.appendChild(option);
+        });
+    }
+
+    function replaceOptions(select, results) {
+        var selected = select.value;
+        var empty = select.querySelector('option[value=""]');
+        select.innerHTML = '';
+        if (empty) {
+            select.appendChild(empty);
+        }
+        addOptions(select, results);
+        select.value = selected;
+        if (!select.value && results.length) {
+            select.value = String(results[0].id);
+        }
+    }
+
+    function bind(select) {
+        var url = select.getAttribute('data-autocomplete-url');
+        var next = select.getAttribute('data-autocomplete-next');
+        var input = document.createElement('input');
+        var more = document.createElement('button');
+        var timer = null;
+        var latest = 0;
+
+        input.type = 'search';
+        input.className = 'form-control mb-1';
+        input.placeholder = 'Type to search...';
+        input.setAttribute('autocomplete', 'off');
+        select.parentNode.insertBefore(input, select);
+
+        more.type = 'button';
+        more.className = 'btn btn-link btn-sm px-0';
+        more.textContent = 'More';
+        select.parentNode.insertBefore(more, select.nextSibling);
+
+        function showMore() {
+            more.style.display = next ? '' : 'none';
+        }
+
+        function load(after, append) {
+            var request = ++latest;
+            var query = '?q=' + encodeURIComponent(input.value.trim());
+            if (after) {
+                query += '&after=' + encodeURIComponent(after);
+            }
+            fetch(url + query, {
+                credentials: 'same-origin',
+                headers: {'Accept': 'application/json'}
+            })
+                .then(function (response) { return response.json(); })
+                .then(function (data) {
+                    // drop answers that arrive after a newer request
+                    if (request !== latest) {
+                        return;
+                    }
+                    (append ? addOptions : replaceOptions)(select, data.results);
+                    next = data.next || null;
+                    showMore();
+                });
+        }
+
+        input.addEventListener('input', function () {
+            clearTimeout(timer);
+            timer = setTimeout(function () { load(null, false); }, DELAY);
+        });
+        more.addEventListener('click', function () { load(next, true); });
+        showMore();
+    }
+
+    document.addEventListener('DOMContentLoaded', function () {
+        Array.prototype.forEach.call(document.querySelectorAll('select[data-autocomplete-url]'), bind);
+    });
+})();
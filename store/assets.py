@@ -0,0 +1,132 @@
+"""
+Static asset manifest: third-party files to vendor and the bundles built from them.
+
+``manage.py vendor_assets`` downloads ``VENDOR`` into ``static/vendor/``;
+``manage.py build_assets`` concatenates and minifies each of ``BUNDLES`` into
+``static/bundles/``. ``collectstatic`` then gives every file a hashed name
+with gzip/brotli variants (see STORAGES), which WhiteNoise serves with
+far-future cache headers.
+
+Templates include a bundle with ``{% asset_bundle 'base.css' %}``; until it
+has been built the tag falls back to the individual files, using the CDN
+for anything not vendored yet.
+"""
+import posixpath
+import re
+
+VENDOR_DIR = 'vendor'
+BUNDLE_DIR = 'bundles'
+
+# vendored path (under static/vendor/) -> where it is downloaded from
+VENDOR = {
+    'normalize/normalize.min.css': 'https://cdn.jsdelivr.net/npm/normalize.css@8.0.0/normalize.min.css',
+    'bootstrap/css/bootstrap.min.css': 'https://cdn.jsdelivr.net/npm/bootstrap@4.1.3/dist/css/bootstrap.min.css',
+    'bootstrap/js/bootstrap.min.js': 'https://cdn.jsdelivr.net/npm/bootstrap@4.1.3/dist/js/bootstrap.min.js',
+    'font-awesome/css/font-awesome.min.css':
+        'https://cdn.jsdelivr.net/npm/font-awesome@4.7.0/css/font-awesome.min.css',
+    'font-awesome/fonts/fontawesome-webfont.eot':
+        'https://cdn.jsdelivr.net/npm/font-awesome@4.7.0/fonts/fontawesome-webfont.eot',
+    'font-awesome/fonts/fontawesome-webfont.woff2':
+        'https://cdn.jsdelivr.net/npm/font-awesome@4.7.0/fonts/fontawesome-webfont.woff2',
+    'font-awesome/fonts/fontawesome-webfont.woff':
+        'https://cdn.jsdelivr.net/npm/font-awesome@4.7.0/fonts/fontawesome-webfont.woff',
+    'font-awesome/fonts/fontawesome-webfont.ttf':
+        'https://cdn.jsdelivr.net/npm/font-awesome@4.7.0/fonts/fontawesome-webfont.ttf',
+    'font-awesome/fonts/fontawesome-webfont.svg':
+        'https://cdn.jsdelivr.net/npm/font-awesome@4.7.0/fonts/fontawesome-webfont.svg',
+    'jquery/jquery.min.js': 'https://cdn.jsdelivr.net/npm/jquery@2.2.4/dist/jquery.min.js',
+    'popper/popper.min.js': 'https://cdn.jsdelivr.net/npm/popper.js@1.14.4/dist/umd/popper.min.js',
+    'jquery-match-height/jquery.matchHeight.min.js':
+        'https://cdn.jsdelivr.net/npm/jquery-match-height@0.7.2/dist/jquery.matchHeight.min.js',
+}
+
+# bundle name (under static/bundles/) -> static paths, in load order
+BUNDLES = {
+    'base.css': (
+        'vendor/normalize/normalize.min.css',
+        'vendor/bootstrap/css/bootstrap.min.css',
+        'vendor/font-awesome/css/font-awesome.min.css',
+        'assets/css/cs-skin-elastic.css',
+        'assets/css/style.css',
+    ),
+    'base.js': (
+        'vendor/jquery/jquery.min.js',
+        'vendor/popper/popper.min.js',
+        'vendor/bootstrap/js/bootstrap.min.js',
+        'vendor/jquery-match-height/jquery.matchHeight.min.js',
+        'assets/js/main.js',
+    ),
+    'autocomplete.js': (
+        'assets/js/autocomplete.js',
+    ),
+}
+
+
+def bundle_path(name):
+    return posixpath.join(BUNDLE_DIR, name)
+
+
+def vendor_url(path):
+    """CDN URL of a vendored static path, or None for the project's own files."""
+    prefix = VENDOR_DIR + '/'
+    if path.startswith(prefix):
+        return VENDOR.get(path[len(prefix):])
+    return None
+
+
+# ---- minification: conservative, dependency-free ----
+
+CSS_COMMENT = re.compile(r'/\*(?!!).*?\*/', re.S)
+CSS_SPACE = re.compile(r'\s+')
+CSS_PUNCTUATION = re.compile(r'\s*([{};,])\s*')
+CSS_IMPORT = re.compile(r'@import\s+[^;]+;')
+CSS_URL = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+
+def minify_css(css):
+    css = CSS_COMMENT.sub('', css)
+    css = CSS_SPACE.sub(' ', css)
+    css = CSS_PUNCTUATION.sub(r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+def minify_js(js):
+    # only drops indentation, blank lines and whole-line comments, so line
+    # breaks (and automatic semicolon insertion) are left exactly as written
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+def rebase_css_urls(css, source, bundle):
+    """Rewrite relative ``url()``s in ``source`` so they resolve from ``bundle``."""
+    source_dir = posixpath.dirname(source)
+    bundle_dir = posixpath.dirname(bundle)
+
+    def rebase(match):
+        quote, url = match.groups()
+        if re.match(r'([a-z]+:|/|#)', url):
+            return match.group(0)
+        path, suffix = re.match(r'([^?#]*)(.*)', url).groups()
+        target = posixpath.normpath(posixpath.join(source_dir, path))
+        return 'url(%s%s%s%s)' % (quote, posixpath.relpath(target, bundle_dir), suffix, quote)
+
+    return CSS_URL.sub(rebase, css)
+
+
+def build_css(sources, bundle):
+    """``sources`` is ``[(static path, text)]``; @imports are hoisted to the top."""
+    imports, parts = [], []
+    for path, text in sources:
+        text = rebase_css_urls(text, path, bundle)
+        for rule in CSS_IMPORT.findall(text):
+            if rule not in imports:
+                imports.append(rule)
+        text = CSS_IMPORT.sub('', text)
+        parts.append(text if path.endswith('.min.css') else minify_css(text))
+    return '\n'.join(imports + parts) + '\n'
+
+
+def build_js(sources):
+    parts = [text if path.endswith('.min.js') else minify_js(text) for path, text in sources]
+    # a leading ';' keeps a file without a trailing semicolon from running into the next
+    return '\n;'.join(part.strip() for part in parts) + '\n'
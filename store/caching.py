@@ -0,0 +1,56 @@
+"""
+Versioned cache namespaces.
+
+Every cached value is stored under a key that embeds its namespace's current
+version. Invalidating a namespace is a single ``incr`` of that version; the
+old entries are never read again and simply age out of the cache.
+"""
+import time
+
+from django.core.cache import cache
+
+VERSION_TIMEOUT = None  # version counters never expire on their own
+
+
+def _version_key(namespace):
+    return 'v:%s' % namespace
+
+
+def _initial_version():
+    # seeded from the clock so an evicted counter never reuses old versions
+    return int(time.time() * 1000)
+
+
+def get_version(namespace):
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _initial_version(), VERSION_TIMEOUT)
+        version = cache.get(key, _initial_version())
+    return version
+
+
+def bump_version(*namespaces):
+    for namespace in namespaces:
+        key = _version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _initial_version(), VERSION_TIMEOUT)
+
+
+def versioned_key(namespace, *parts):
+    return ':'.join([namespace, str(get_version(namespace))] + [str(part) for part in parts])
+
+
+def model_namespace(model):
+    """Namespace of everything cached from one (reference data) model's rows."""
+    return 'model.%s' % model._meta.label_lower
+
+
+def dashboard_namespace(user_id):
+    return 'dashboard.user.%s' % user_id
+
+
+def invalidate_dashboards(user_ids):
+    bump_version(*[dashboard_namespace(user_id) for user_id in set(user_ids) if user_id])
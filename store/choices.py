@@ -0,0 +1,73 @@
+"""
+Cached ``<select>`` choices for the order form, plus a prefix index over them.
+
+Each model's ``(pk, name)`` list is cached under the model's versioned
+namespace, which ``store.signals`` bumps whenever a row is saved or deleted. The
+prefix index used by the autocomplete endpoint is rebuilt in-process only
+when that version changes.
+"""
+from bisect import bisect_left
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import caching
+from .models import Buyer, Drop, Product, Season, Supplier
+
+CHOICE_MODELS = {
+    'supplier': Supplier,
+    'product': Product,
+    'buyer': Buyer,
+    'season': Season,
+    'drop': Drop,
+}
+
+# per-process prefix indexes: {field name: (version, PrefixIndex)}
+_indexes = {}
+
+
+def namespace(name):
+    return caching.model_namespace(CHOICE_MODELS[name])
+
+
+def get_choices(name, version=None):
+    """``[(pk, name), ...]`` for ``name`` ordered by name, from the cache."""
+    version = version or caching.get_version(namespace(name))
+    key = '%s:%s:choices' % (namespace(name), version)
+    choices = cache.get(key)
+    if choices is None:
+        choices = list(CHOICE_MODELS[name].objects.order_by('name').values_list('pk', 'name'))
+        cache.set(key, choices, settings.CHOICES_CACHE_TIMEOUT)
+    return choices
+
+
+class PrefixIndex:
+    """Case-insensitive prefix search over ``(pk, label)`` pairs with bisect."""
+
+    def __init__(self, choices):
+        self.entries = sorted((label.casefold(), pk, label) for pk, label in choices)
+        self.keys = [entry[0] for entry in self.entries]
+        self.labels = {pk: label for _, pk, label in self.entries}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def search(self, prefix, limit):
+        """Return up to ``limit`` matches and whether more exist."""
+        prefix = prefix.casefold()
+        start = bisect_left(self.keys, prefix)
+        matches = []
+        for key, pk, label in self.entries[start:start + limit + 1]:
+            if not key.startswith(prefix):
+                break
+            matches.append((pk, label))
+        return matches[:limit], len(matches) > limit
+
+
+def prefix_index(name):
+    version = caching.get_version(namespace(name))
+    cached = _indexes.get(name)
+    if cached is None or cached[0] != version:
+        cached = (version, PrefixIndex(get_choices(name, version)))
+        _indexes[name] = cached
+    return cached[1]
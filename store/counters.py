@@ -0,0 +1,126 @@
+"""
+Incrementally maintained row counts for the dashboard tiles.
+
+Counts live in the ``Counter`` table, one row per key. They are adjusted by
+the signal handlers in ``store.signals`` (or explicitly by bulk writers that
+bypass signals) so they commit or roll back together with the write that
+caused them. ``manage.py rebuild_counters`` reconciles them from scratch.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, Value, When
+
+from .models import Buyer, Counter, Order, Product, Supplier
+
+PRODUCT = 'product'
+SUPPLIER = 'supplier'
+BUYER = 'buyer'
+ORDER = 'order'
+
+# models whose plain row count is kept under a single key
+MODEL_KEYS = {
+    Product: PRODUCT,
+    Supplier: SUPPLIER,
+    Buyer: BUYER,
+}
+
+
+def status_key(status):
+    return 'order.status.%s' % status
+
+
+def supplier_orders_key(supplier_id):
+    return 'order.supplier.%s' % supplier_id
+
+
+def buyer_orders_key(buyer_id):
+    return 'order.buyer.%s' % buyer_id
+
+
+def order_keys(status, supplier_id, buyer_id):
+    """Every counter a single order row contributes to."""
+    keys = [ORDER, status_key(status), supplier_orders_key(supplier_id)]
+    if buyer_id is not None:
+        keys.append(buyer_orders_key(buyer_id))
+    return keys
+
+
+def apply(deltas):
+    """
+    Add ``deltas`` ({key: amount}) to the counters in one UPDATE.
+
+    Keys that have no row yet are created; this only happens the first time
+    a supplier, buyer or status is counted.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    amount = Case(
+        *[When(key=key, then=Value(delta)) for key, delta in deltas.items()],
+        default=Value(0),
+    )
+    with transaction.atomic():
+        updated = Counter.objects.filter(key__in=deltas).update(value=F('value') + amount)
+        if updated == len(deltas):
+            return
+        existing = set(Counter.objects.filter(key__in=deltas).values_list('key', flat=True))
+        for key in deltas.keys() - existing:
+            try:
+                with transaction.atomic():
+                    Counter.objects.create(key=key, value=deltas[key])
+            except IntegrityError:
+                # created concurrently by another writer
+                Counter.objects.filter(key=key).update(value=F('value') + deltas[key])
+
+
+def discard(*keys):
+    Counter.objects.filter(key__in=keys).delete()
+
+
+def get_many(keys):
+    """Return {key: value} for ``keys`` with a single indexed lookup."""
+    values = dict(Counter.objects.filter(key__in=keys).values_list('key', 'value'))
+    return {key: values.get(key, 0) for key in keys}
+
+
+def expected_counts():
+    """Compute every counter from the underlying tables."""
+    counts = {key: model.objects.count() for model, key in MODEL_KEYS.items()}
+    counts[ORDER] = Order.objects.count()
+    for status, _ in Order.STATUS_CHOICE:
+        counts[status_key(status)] = 0
+
+    grouped = Order.objects.order_by().values_list
+    for status, total in grouped('status').annotate(total=Count('id')):
+        counts[status_key(status)] = total
+    for supplier_id, total in grouped('supplier_id').annotate(total=Count('id')):
+        counts[supplier_orders_key(supplier_id)] = total
+    for buyer_id, total in grouped('buyer_id').annotate(total=Count('id')):
+        if buyer_id is not None:
+            counts[buyer_orders_key(buyer_id)] = total
+    return counts
+
+
+def rebuild(dry_run=False):
+    """
+    Reconcile the counter table with the real row counts.
+
+    Returns {key: (stored, actual)} for every key that had drifted; a missing
+    row counts as zero.
+
+    The counter rows are locked before the tables are counted, and the
+    drift is written back through ``apply`` as increments rather than by
+    replacing the rows, so a write that lands meanwhile either waits for
+    the rebuild or keeps its own adjustment. (SQLite ignores the lock, but
+    serializes write transactions on its own.)
+    """
+    with transaction.atomic():
+        stored = dict(Counter.objects.select_for_update().values_list('key', 'value'))
+        expected = expected_counts()
+        drift = {
+            key: (stored.get(key, 0), expected.get(key, 0))
+            for key in stored.keys() | expected.keys()
+            if stored.get(key, 0) != expected.get(key, 0)
+        }
+        if drift and not dry_run:
+            apply({key: actual - value for key, (value, actual) in drift.items()})
+    return drift
@@ -0,0 +1,90 @@
+"""
+Streaming CSV / JSON Lines exports.
+
+Rows are pulled from the database with a server-side iterator and written to
+a StreamingHttpResponse in small batches, so memory use does not grow with
+the size of the export and the header goes out before the first query
+finishes.
+"""
+import csv
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+}
+
+# (column name, queryset field)
+ORDER_COLUMNS = (
+    ('id', 'id'),
+    ('supplier', 'supplier__name'),
+    ('product', 'product__name'),
+    ('design', 'design'),
+    ('color', 'color'),
+    ('buyer', 'buyer__name'),
+    ('season', 'season__name'),
+    ('drop', 'drop__name'),
+    ('status', 'status'),
+    ('created_date', 'created_date'),
+)
+DELIVERY_COLUMNS = (
+    ('id', 'id'),
+    ('order', 'order_id'),
+    ('product', 'order__product__name'),
+    ('courier_name', 'courier_name'),
+    ('created_date', 'created_date'),
+)
+
+# rows joined into one chunk of the response body
+ROWS_PER_WRITE = 500
+
+
+class _Echo:
+    """File-like object handing back whatever csv.writer writes to it."""
+
+    def write(self, value):
+        return value
+
+
+def _csv_lines(header, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def _jsonl_lines(header, rows):
+    encoder = DjangoJSONEncoder()
+    for row in rows:
+        yield encoder.encode(dict(zip(header, row))) + '\n'
+
+
+def _batched(lines):
+    batch = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= ROWS_PER_WRITE:
+            yield ''.join(batch)
+            batch = []
+    if batch:
+        yield ''.join(batch)
+
+
+def stream_rows(queryset, columns, fmt, chunk_size=None):
+    header = [name for name, _ in columns]
+    rows = queryset.values_list(*[field for _, field in columns]).order_by('-id').iterator(
+        chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE,
+    )
+    lines = _csv_lines(header, rows) if fmt == 'csv' else _jsonl_lines(header, rows)
+    # the first line is sent on its own so the client sees bytes at once
+    yield next(lines, '')
+    yield from _batched(lines)
+
+
+def export_response(queryset, columns, fmt, basename):
+    response = StreamingHttpResponse(stream_rows(queryset, columns, fmt), content_type=FORMATS[fmt])
+    response['Content-Disposition'] = 'attachment; filename="%s.%s"' % (basename, fmt)
+    return response
@@ -1,6 +1,14 @@
+from functools import partial
+
 from django import forms
+from django.conf import settings
+from django.urls import reverse
+from django.utils.http import urlencode
 
+from . import choices
 from .models import Season, Drop, Product, Order, Delivery, Buyer
+from .pagination import keyset_paginate
+from .queries import order_label, order_picker_rows, orders_for_user, undelivered_orders
 
 
 class SupplierForm(forms.Form):
@@ -183,12 +191,42 @@ class ProductForm(forms.ModelForm):
         }
 
 
+class AutocompleteSelect(forms.Select):
+    """
+    A select that only renders its current option; the rest are fetched from
+    ``url`` as the user types (see assets/js/autocomplete.js).
+    """
+
+    def __init__(self, url, attrs=None):
+        attrs = dict(attrs or {}, **{'data-autocomplete-url': url})
+        super().__init__(attrs)
+
+
 class OrderForm(forms.ModelForm):
     def __init__(self, *args, **kwargs):
         user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
         if user and user.is_buyer:
             self.fields['buyer'].queryset = Buyer.objects.filter(user=user)
+        for name in choices.CHOICE_MODELS:
+            if name == 'buyer' and user and user.is_buyer:
+                continue  # only their own buyer, a short list
+            self._use_cached_choices(name)
+
+    def _use_cached_choices(self, name):
+        """Fill ``name``'s select from the choice cache instead of a query."""
+        field = self.fields[name]
+        cached = choices.get_choices(name)
+        empty = [('', field.empty_label)]
+        if len(cached) <= settings.ORDER_FORM_INLINE_CHOICES:
+            field.choices = empty + cached
+            return
+        # too many to inline: render the selected option only
+        field.widget = AutocompleteSelect(reverse('autocomplete', args=[name]), field.widget.attrs)
+        field.widget.is_required = field.required
+        selected = self[name].value()
+        label = choices.prefix_index(name).labels.get(_to_int(selected))
+        field.choices = empty + ([(selected, label)] if label is not None else [])
 
     class Meta:
         model = Order
@@ -221,7 +259,107 @@ class OrderForm(forms.ModelForm):
         }
 
 
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class OrderImportForm(forms.Form):
+    FORMAT_CHOICES = (
+        ('', 'Detect from file name'),
+        ('csv', 'CSV'),
+        ('jsonl', 'JSON Lines'),
+    )
+    file = forms.FileField(widget=forms.ClearableFileInput(attrs={
+        'class': 'form-control', 'id': 'file'
+    }))
+    format = forms.ChoiceField(required=False, choices=FORMAT_CHOICES, widget=forms.Select(attrs={
+        'class': 'form-control', 'id': 'format'
+    }))
+
+
+class OrderFilterForm(forms.Form):
+    """Status/season/drop/date filters shared by the list views and exports."""
+    status = forms.ChoiceField(
+        required=False,
+        choices=(('', 'All statuses'),) + Order.STATUS_CHOICE,
+        widget=forms.Select(attrs={'class': 'form-control form-control-sm'}),
+    )
+    season = forms.ModelChoiceField(
+        required=False,
+        queryset=Season.objects.only('name'),
+        empty_label='All seasons',
+        widget=forms.Select(attrs={'class': 'form-control form-control-sm'}),
+    )
+    drop = forms.ModelChoiceField(
+        required=False,
+        queryset=Drop.objects.only('name'),
+        empty_label='All drops',
+        widget=forms.Select(attrs={'class': 'form-control form-control-sm'}),
+    )
+    date_from = forms.DateField(required=False, widget=forms.DateInput(attrs={
+        'class': 'form-control form-control-sm', 'type': 'date'
+    }))
+    date_to = forms.DateField(required=False, widget=forms.DateInput(attrs={
+        'class': 'form-control form-control-sm', 'type': 'date'
+    }))
+
+    def filter(self, queryset, order_prefix=''):
+        """
+        Apply the cleaned filters to ``queryset``.
+
+        ``order_prefix`` (e.g. ``'order__'``) points the status/season/drop
+        filters at the related order; dates always apply to the row itself.
+        """
+        data = self.cleaned_data
+        lookups = {}
+        for name in ('status', 'season', 'drop'):
+            if data.get(name):
+                lookups[order_prefix + name] = data[name]
+        if data.get('date_from'):
+            lookups['created_date__gte'] = data['date_from']
+        if data.get('date_to'):
+            lookups['created_date__lte'] = data['date_to']
+        return queryset.filter(**lookups)
+
+    def choice_reads(self):
+        """``{field: callable}`` loading each select's options, to run ahead of rendering."""
+        # list(iter(...)): a bare list() would run a COUNT for its length hint
+        return {name: partial(list, iter(self.fields[name].choices)) for name in ('season', 'drop')}
+
+    def set_choices(self, loaded):
+        for name, options in loaded.items():
+            self.fields[name].choices = options
+
+    def query_string(self):
+        """The active filters as a query string, for links that keep them."""
+        return urlencode([
+            (name, self.data[name]) for name in self.fields if self.data.get(name)
+        ])
+
+
 class DeliveryForm(forms.ModelForm):
+    def __init__(self, *args, **kwargs):
+        user = kwargs.pop('user', None)
+        super().__init__(*args, **kwargs)
+        field = self.fields['order']
+        orders = Order.objects.all() if user is None else orders_for_user(user)
+        field.queryset = undelivered_orders(orders)
+        # newest undelivered orders inline; older ones come from the order picker
+        page = keyset_paginate(order_picker_rows(field.queryset), page_size=settings.AUTOCOMPLETE_LIMIT)
+        rows = list(page)
+        selected = _to_int(self['order'].value())
+        if selected and selected not in {row[0] for row in rows}:
+            rows += list(order_picker_rows(field.queryset.filter(pk=selected)))
+        attrs = dict(field.widget.attrs)
+        if page.has_next():
+            attrs['data-autocomplete-next'] = page.object_list[-1][0]
+        field.widget = AutocompleteSelect(reverse('order-picker'), attrs)
+        field.widget.is_required = field.required
+        field.choices = [('', field.empty_label)] + [(row[0], order_label(*row)) for row in rows]
+
     class Meta:
         model = Delivery
         fields = '__all__'
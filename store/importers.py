@@ -0,0 +1,195 @@
+"""
+Streaming bulk import of orders from CSV or JSON Lines.
+
+Rows are read one at a time, their names resolved against lookup maps loaded
+once up front, validated with the same field rules as ``OrderForm`` and
+written with ``bulk_create`` in chunks, each chunk in its own transaction.
+Invalid rows are reported by line number and never abort the rest of the file.
+"""
+import csv
+import io
+import json
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from . import caching, counters, search
+from .forms import OrderForm
+from .models import Buyer, Drop, Order, Product, Season, Supplier
+from .queries import owner_user_ids
+
+FORMATS = ('csv', 'jsonl')
+
+# related fields of OrderForm, looked up by name
+LOOKUP_MODELS = {
+    'supplier': Supplier,
+    'product': Product,
+    'buyer': Buyer,
+    'season': Season,
+    'drop': Drop,
+}
+
+BATCH_SIZE = 500
+CHUNK_SIZE = 5000
+MAX_REPORTED_ERRORS = 1000
+
+
+def guess_format(filename):
+    if filename.lower().endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    return 'csv'
+
+
+def read_rows(stream, fmt):
+    """
+    Yield ``(line_number, row)`` from a text stream. ``row`` is a dict, or
+    for a line that cannot be read, the message saying why.
+
+    A malformed CSV line is reported and skipped. Text that does not decode
+    ends the file: the decoder reads ahead in blocks, so the reported line
+    is the first one that was not read rather than the one at fault.
+    """
+    if fmt == 'csv':
+        rows = _read_csv(stream)
+    elif fmt == 'jsonl':
+        rows = _read_jsonl(stream)
+    else:
+        raise ValueError('Unknown import format %r' % fmt)
+    line_number = 0
+    try:
+        for line_number, row in rows:
+            yield line_number, row
+    except UnicodeDecodeError:
+        yield line_number + 1, 'The file is not UTF-8 text from here on; the rest of it was not read.'
+
+
+def _read_csv(stream):
+    reader = csv.DictReader(stream)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            # the reader has not counted the line it failed on yet
+            yield reader.line_num + 1, 'Malformed CSV: %s.' % e
+            continue
+        yield reader.line_num, {key.strip(): value for key, value in row.items() if key}
+
+
+def _read_jsonl(stream):
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield line_number, row if isinstance(row, dict) else 'Line is not a JSON object.'
+
+
+def open_upload(uploaded_file):
+    """Wrap an uploaded (binary) file as a streaming text file."""
+    return io.TextIOWrapper(uploaded_file.file, encoding='utf-8-sig', newline='')
+
+
+class ImportReport:
+    def __init__(self):
+        self.created = 0
+        self.rows = 0
+        self.error_count = 0
+        self.errors = []
+
+    @property
+    def truncated(self):
+        return self.error_count > len(self.errors)
+
+    def add_error(self, line_number, errors):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'line': line_number, 'errors': errors})
+
+    def as_dict(self):
+        return {
+            'rows': self.rows,
+            'created': self.created,
+            'error_count': self.error_count,
+            'errors': self.errors,
+        }
+
+
+class OrderImporter:
+    """
+    Validate and insert order rows for ``user``.
+
+    A buyer may only import orders for their own buyer record, mirroring the
+    buyer choices ``OrderForm`` offers them.
+    """
+
+    def __init__(self, user=None, batch_size=BATCH_SIZE, chunk_size=CHUNK_SIZE):
+        self.batch_size = batch_size
+        self.chunk_size = chunk_size
+        self.form_fields = OrderForm(user=user).fields
+        self.lookups = {
+            name: dict(self.form_fields[name].queryset.values_list('name', 'pk'))
+            for name in LOOKUP_MODELS
+        }
+
+    def build(self, row):
+        """Return ``(order, errors)`` for one row; ``order`` is None when invalid."""
+        values, errors = {}, {}
+        for name, field in self.form_fields.items():
+            raw = row.get(name)
+            raw = raw.strip() if isinstance(raw, str) else raw
+            if name in LOOKUP_MODELS:
+                if raw in field.empty_values:
+                    errors[name] = [str(field.error_messages['required'])]
+                elif str(raw) not in self.lookups[name]:
+                    errors[name] = ['Unknown %s "%s".' % (name, raw)]
+                else:
+                    values[name + '_id'] = self.lookups[name][str(raw)]
+                continue
+            try:
+                values[name] = field.clean(raw)
+            except ValidationError as e:
+                errors[name] = list(e.messages)
+        if errors:
+            return None, errors
+        return Order(status='pending', **values), None
+
+    def run(self, rows):
+        report = ImportReport()
+        pending = []
+        for line_number, row in rows:
+            report.rows += 1
+            if not isinstance(row, dict):
+                report.add_error(line_number, {'__all__': [row]})
+                continue
+            order, errors = self.build(row)
+            if errors:
+                report.add_error(line_number, errors)
+                continue
+            pending.append(order)
+            if len(pending) >= self.chunk_size:
+                report.created += self.flush(pending)
+                pending = []
+        if pending:
+            report.created += self.flush(pending)
+        return report
+
+    def flush(self, orders):
+        """Insert one chunk and account for it, all in one transaction."""
+        deltas = {}
+        for order in orders:
+            for key in counters.order_keys(order.status, order.supplier_id, order.buyer_id):
+                deltas[key] = deltas.get(key, 0) + 1
+        with transaction.atomic():
+            Order.objects.bulk_create(orders, batch_size=self.batch_size)
+            # bulk_create sends no signals, so do what store.signals would
+            counters.apply(deltas)
+            search.index_orders(order.pk for order in orders)
+            caching.invalidate_dashboards(owner_user_ids(
+                supplier_ids={order.supplier_id for order in orders},
+                buyer_ids={order.buyer_id for order in orders},
+            ))
+        return len(orders)
@@ -0,0 +1,144 @@
+import multiprocessing
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from inventory.db import LOCK_MESSAGES, backoff_delays
+
+PROFILES = ('default', 'tuned')
+
+READ_SQL = (
+    'SELECT o.id, o.design, o.color, o.status, p.name FROM store_order o '
+    'JOIN store_product p ON p.id = o.product_id '
+    'WHERE o.supplier_id = ? ORDER BY o.id DESC LIMIT 50'
+)
+# read-then-write, the shape of update_order_status
+WRITE_SQL = (
+    'SELECT status FROM store_order WHERE id = ?',
+    "UPDATE store_order SET status = CASE status WHEN 'pending' THEN 'done' ELSE 'pending' END WHERE id = ?",
+)
+
+
+def _connect(path, profile):
+    if profile == 'default':
+        # what Django does out of the box: 5s timeout, deferred transactions
+        return sqlite3.connect(path, timeout=5, isolation_level=None), 'BEGIN'
+    conn = sqlite3.connect(path, timeout=0, isolation_level=None)
+    for name, value in settings.SQLITE_PRAGMAS.items():
+        conn.execute('PRAGMA %s=%s' % (name, value))
+    return conn, 'BEGIN IMMEDIATE'
+
+
+def _write(conn, begin, order_id):
+    conn.execute(begin)
+    try:
+        for sql in WRITE_SQL:
+            conn.execute(sql, (order_id,)).fetchall()
+        conn.execute('COMMIT')
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.execute('ROLLBACK')
+        raise
+
+
+def _worker(path, profile, seconds, write_ratio, supplier_ids, order_ids, seed, results):
+    rng = random.Random(seed)
+    conn, begin = _connect(path, profile)
+    reads = writes = errors = retries = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        if rng.random() >= write_ratio:
+            conn.execute(READ_SQL, (rng.choice(supplier_ids),)).fetchall()
+            reads += 1
+            continue
+        delays = backoff_delays() if profile == 'tuned' else iter(())
+        order_id = rng.choice(order_ids)
+        while True:
+            try:
+                _write(conn, begin, order_id)
+                writes += 1
+                break
+            except sqlite3.OperationalError as e:
+                if not any(m in str(e) for m in LOCK_MESSAGES):
+                    raise
+                delay = next(delays, None)
+                if delay is None:
+                    errors += 1
+                    break
+                retries += 1
+                time.sleep(delay)
+    conn.close()
+    results.put((reads, writes, errors, retries))
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure read/write throughput of N concurrent processes against a copy of the '
+        'database, with the stock SQLite settings and with SQLITE_PRAGMAS plus lock retries.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help='Concurrent processes.')
+        parser.add_argument('--seconds', type=float, default=5.0, help='Duration of each run.')
+        parser.add_argument('--write-ratio', type=float, default=0.2, help='Share of operations that write.')
+        parser.add_argument('--profile', choices=PROFILES, action='append', help='Defaults to both.')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        database = settings.DATABASES['default']
+        if database['ENGINE'] != 'django.db.backends.sqlite3':
+            raise CommandError('benchmark_sqlite only runs against SQLite.')
+        source = connections['default']
+        with source.cursor() as cursor:
+            cursor.execute('SELECT id FROM store_supplier')
+            supplier_ids = [row[0] for row in cursor.fetchall()]
+            cursor.execute('SELECT id FROM store_order')
+            order_ids = [row[0] for row in cursor.fetchall()]
+        if not supplier_ids or not order_ids:
+            raise CommandError('The database has no suppliers or orders to benchmark with.')
+
+        self.stdout.write('%-8s %7s %10s %10s %8s %8s' % (
+            'profile', 'workers', 'reads/s', 'writes/s', 'failed', 'retries'))
+        workdir = tempfile.mkdtemp(prefix='benchmark_sqlite-')
+        try:
+            for profile in options['profile'] or PROFILES:
+                path = os.path.join(workdir, '%s.sqlite3' % profile)
+                self.copy_database(source, path, profile)
+                reads, writes, errors, retries = self.run(path, profile, options, supplier_ids, order_ids)
+                seconds = options['seconds']
+                self.stdout.write('%-8s %7d %10.0f %10.0f %8d %8d' % (
+                    profile, options['workers'], reads / seconds, writes / seconds, errors, retries))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def copy_database(self, source, path, profile):
+        source.ensure_connection()
+        target = sqlite3.connect(path)
+        source.connection.backup(target)
+        # WAL is a property of the file, so undo it for the stock profile
+        target.execute('PRAGMA journal_mode=%s' % ('delete' if profile == 'default' else 'wal'))
+        target.close()
+
+    def run(self, path, profile, options, supplier_ids, order_ids):
+        connections.close_all()
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=_worker, args=(
+                path, profile, options['seconds'], options['write_ratio'],
+                supplier_ids, order_ids, options['seed'] + n, results,
+            ))
+            for n in range(options['workers'])
+        ]
+        for process in processes:
+            process.start()
+        totals = [sum(values) for values in zip(*[results.get() for _ in processes])]
+        for process in processes:
+            process.join()
+        return totals
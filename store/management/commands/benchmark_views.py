@@ -0,0 +1,435 @@
+import json
+import math
+import platform
+import re
+import resource
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import HTTPCookieProcessor, HTTPRedirectHandler, Request, build_opener
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.urls import reverse
+
+from store.models import Buyer, Drop, Order, Product, Season, Supplier
+from store.queries import orders_for_user
+from store.urls import urlpatterns as store_urls
+from users.models import User
+
+# GETs that change data or end the session
+SKIPPED = ('logout', 'bulk-update-order-status')
+SKIPPED_PREFIXES = ('delete-',)
+# a p50/p95 this much slower than the baseline (or any extra query) is flagged
+DEFAULT_THRESHOLD = 10.0
+# the db entry monitoring.middleware adds to Server-Timing
+SERVER_TIMING_QUERIES = re.compile(r'\bdb;[^,]*desc="(\d+) queries"')
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of the sorted ``values``."""
+    if not values:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(values)))
+    return values[rank - 1]
+
+
+def endpoints(user):
+    """``[(name, path)]`` for every store URL plus the dashboard and login, as ``user`` sees them."""
+    supplier = Supplier.objects.filter(user=user).first() or Supplier.objects.order_by('-pk').first()
+    buyer = Buyer.objects.filter(user=user).first() or Buyer.objects.order_by('-pk').first()
+    order = orders_for_user(user).order_by('-pk').first()
+    pks = {
+        'supplier': supplier and supplier.pk,
+        'buyer': buyer and buyer.pk,
+        'order-status': order and order.pk,
+        'season': Season.objects.order_by('-pk').values_list('pk', flat=True).first(),
+        'drop': Drop.objects.order_by('-pk').values_list('pk', flat=True).first(),
+        'product': Product.objects.order_by('-pk').values_list('pk', flat=True).first(),
+    }
+    found = [('dashboard', reverse('dashboard')), ('login', reverse('login'))]
+    for pattern in store_urls:
+        name = pattern.name
+        if not name or name in SKIPPED or name.startswith(SKIPPED_PREFIXES):
+            continue
+        if name == 'autocomplete':
+            found.append((name, reverse(name, args=['product'])))
+        elif name.startswith(('edit-', 'update-')):
+            pk = pks[name.split('-', 1)[1]]
+            if pk is not None:
+                found.append((name, reverse(name, args=[pk])))
+        else:
+            found.append((name, reverse(name)))
+    return found
+
+
+def timed_queries(response):
+    """The query count in the response's Server-Timing header, if the server sends one."""
+    match = SERVER_TIMING_QUERIES.search(response.headers.get('Server-Timing') or '')
+    return int(match.group(1)) if match else None
+
+
+def allowed_host():
+    """A Host header ALLOWED_HOSTS accepts."""
+    for host in settings.ALLOWED_HOSTS:
+        if host != '*':
+            return host.lstrip('.')
+    return 'localhost'
+
+
+class ClientDriver:
+    """Requests through the test client, in this process; counts queries."""
+    name = 'client'
+
+    def __init__(self):
+        self.host = allowed_host()
+
+    def login(self, user, password):
+        client = Client(HTTP_HOST=self.host)
+        client.force_login(user)
+        return client.cookies
+
+    def fetcher(self, cookies):
+        client = Client(HTTP_HOST=self.host, raise_request_exception=False)
+        client.cookies.update(cookies)
+
+        def fetch(path):
+            queries = [0]
+
+            def count(execute, sql, params, many, context):
+                queries[0] += 1
+                return execute(sql, params, many, context)
+
+            with connection.execute_wrapper(count):
+                response = client.get(path)
+                if response.streaming:
+                    b''.join(response.streaming_content)
+            return response.status_code, queries[0]
+        return fetch
+
+    def finish_thread(self):
+        connection.close()
+
+    def peak_rss_kb(self):
+        # ru_maxrss is in kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+class _NoRedirect(HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class HttpDriver:
+    """Requests over HTTP to a running server; ``pids`` are its processes, for RSS."""
+    name = 'http'
+
+    def __init__(self, base_url, pids=()):
+        self.base_url = base_url.rstrip('/')
+        self.host = allowed_host()
+        self.pids = pids
+
+    def login(self, user, password):
+        jar = CookieJar()
+        opener = build_opener(HTTPCookieProcessor(jar))
+        path = reverse('login')
+        opener.open(Request(self.base_url + path, headers={'Host': self.host})).read()
+        token = next((cookie.value for cookie in jar if cookie.name == settings.CSRF_COOKIE_NAME), '')
+        data = urlencode({
+            'csrfmiddlewaretoken': token, 'username': user.username, 'password': password,
+        }).encode()
+        opener.open(Request(self.base_url + path, data=data, headers={'Host': self.host})).read()
+        if not any(cookie.name == settings.SESSION_COOKIE_NAME for cookie in jar):
+            raise CommandError('Could not log in as %s; pass its password with --user.' % user.username)
+        return '; '.join('%s=%s' % (cookie.name, cookie.value) for cookie in jar)
+
+    def fetcher(self, cookies):
+        opener = build_opener(_NoRedirect)
+        headers = {'Host': self.host, 'Cookie': cookies}
+
+        def fetch(path):
+            try:
+                with opener.open(Request(self.base_url + path, headers=headers)) as response:
+                    response.read()
+                    return response.status, timed_queries(response)
+            except HTTPError as e:
+                e.read()
+                return e.code, timed_queries(e)
+        return fetch
+
+    def finish_thread(self):
+        pass
+
+    def peak_rss_kb(self):
+        """Largest high-water RSS among the server's processes (Linux only)."""
+        peaks = []
+        for pid in self.pids:
+            for child in [pid] + self._children(pid):
+                try:
+                    with open('/proc/%d/status' % child) as status:
+                        for line in status:
+                            if line.startswith('VmHWM:'):
+                                peaks.append(int(line.split()[1]))
+                except OSError:
+                    continue
+        return max(peaks) if peaks else None
+
+    @staticmethod
+    def _children(pid):
+        try:
+            with open('/proc/%d/task/%d/children' % (pid, pid)) as children:
+                return [int(child) for child in children.read().split()]
+        except OSError:
+            return []
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure latency (p50/p95/p99), throughput, queries per request and peak RSS of every '
+        'store view plus the dashboard and login, per role, and compare with a saved baseline.'
+    )
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group()
+        target.add_argument('--url', help='Benchmark a running server at this base URL instead of the test client.')
+        target.add_argument('--gunicorn', action='store_true', help='Start gunicorn locally and benchmark it.')
+        parser.add_argument('--asgi', action='store_true', help='With --gunicorn: serve inventory.asgi with uvicorn workers.')
+        parser.add_argument('--workers', type=int, default=2, help='With --gunicorn: worker processes.')
+        parser.add_argument('--requests', type=int, default=50, help='Measured requests per view and user.')
+        parser.add_argument('--warmup', type=int, default=3, help='Unmeasured requests first, to fill caches.')
+        parser.add_argument('--concurrency', type=int, default=1, help='Requests in flight at once.')
+        parser.add_argument(
+            '--user', action='append', metavar='USERNAME[:PASSWORD]',
+            help='Benchmark as this user (repeatable). Defaults to a superuser and the supplier '
+                 'and buyer with the most orders. Over HTTP the password defaults to --password.',
+        )
+        parser.add_argument('--password', default='password')
+        parser.add_argument('--only', action='append', metavar='URL_NAME', help='Only these views (repeatable).')
+        parser.add_argument('--output', help='Write the results to this JSON file.')
+        parser.add_argument('--baseline', help='Compare with the JSON results of an earlier run.')
+        parser.add_argument(
+            '--threshold', type=float, default=DEFAULT_THRESHOLD,
+            help='Percent slowdown of p50 or p95 flagged as a regression.',
+        )
+        parser.add_argument('--fail-on-regression', action='store_true', help='Exit non-zero on a regression.')
+
+    def handle(self, *args, **options):
+        users = self.users(options)
+        server = None
+        if options['gunicorn']:
+            server, base_url = self.start_gunicorn(options)
+            driver = HttpDriver(base_url, pids=[server.pid])
+        elif options['url']:
+            driver = HttpDriver(options['url'])
+        else:
+            driver = ClientDriver()
+
+        try:
+            results = self.run(driver, users, options)
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait(timeout=10)
+
+        report = {'meta': self.meta(driver, options), 'results': results}
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(report, output, indent=2, sort_keys=True)
+            self.stdout.write('Wrote %s' % options['output'])
+        if options['baseline']:
+            with open(options['baseline']) as baseline:
+                regressions = self.compare(json.load(baseline), report, options['threshold'])
+            if regressions and options['fail_on_regression']:
+                raise CommandError('%d view(s) regressed: %s' % (len(regressions), ', '.join(regressions)))
+
+    def users(self, options):
+        """``[(role, user, password)]`` to benchmark as."""
+        if options['user']:
+            found = []
+            for spec in options['user']:
+                username, _, password = spec.partition(':')
+                try:
+                    user = User.objects.get(username=username)
+                except User.DoesNotExist:
+                    raise CommandError('No user named %r.' % username)
+                found.append((user.role or 'user', user, password or options['password']))
+            return found
+
+        def busiest(field):
+            row = (
+                Order.objects.order_by().values_list(field).annotate(orders=Count('id'))
+                .order_by('-orders').first()
+            )
+            return row and User.objects.get(pk=row[0])
+
+        candidates = [
+            ('admin', User.objects.filter(is_superuser=True).order_by('pk').first()),
+            ('supplier', busiest('supplier__user')),
+            ('buyer', busiest('buyer__user')),
+        ]
+        found = [(role, user, options['password']) for role, user in candidates if user]
+        if not found:
+            raise CommandError('No users to benchmark as; seed some data with seed_inventory.')
+        return found
+
+    def start_gunicorn(self, options):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        command = [
+            sys.executable, '-m', 'gunicorn',
+            'inventory.asgi:application' if options['asgi'] else 'inventory.wsgi:application',
+            '--bind', '127.0.0.1:%d' % port, '--workers', str(options['workers']),
+        ]
+        if options['asgi']:
+            command += ['--worker-class', 'uvicorn.workers.UvicornWorker']
+        server = subprocess.Popen(command, cwd=str(settings.BASE_DIR), stdout=subprocess.DEVNULL)
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError('gunicorn exited with status %s.' % server.returncode)
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                return server, 'http://127.0.0.1:%d' % port
+            except OSError:
+                time.sleep(0.2)
+        server.terminate()
+        raise CommandError('gunicorn did not start listening within 30s.')
+
+    def run(self, driver, users, options):
+        results = {}
+        self.stdout.write('%-34s %8s %8s %8s %8s %8s %9s' % (
+            'view', 'p50 ms', 'p95 ms', 'p99 ms', 'req/s', 'queries', 'rss MB'))
+        for role, user, password in users:
+            cookies = driver.login(user, password)
+            for name, path in endpoints(user):
+                if options['only'] and name not in options['only']:
+                    continue
+                label = '%s:%s' % (name, role)
+                results[label] = result = self.measure(driver, cookies, path, options)
+                self.stdout.write('%-34s %8s %8s %8s %8.1f %8s %9s' % (
+                    label, self.ms(result['p50']), self.ms(result['p95']), self.ms(result['p99']),
+                    result['rps'], '-' if result['queries'] is None else '%.1f' % result['queries'],
+                    '-' if result['peak_rss_kb'] is None else '%.0f' % (result['peak_rss_kb'] / 1024.0),
+                ))
+        return results
+
+    @staticmethod
+    def ms(seconds):
+        return '-' if seconds is None else '%.1f' % (seconds * 1000)
+
+    def measure(self, driver, cookies, path, options):
+        """Run the warmup and measured requests for one path across ``--concurrency`` threads."""
+        concurrency = max(1, options['concurrency'])
+        total = options['requests']
+        shares = [total // concurrency + (n < total % concurrency) for n in range(concurrency)]
+        fetch = driver.fetcher(cookies)
+        for _ in range(options['warmup']):
+            fetch(path)
+
+        def worker(count):
+            fetch = driver.fetcher(cookies)
+            try:
+                samples = []
+                for _ in range(count):
+                    started = time.perf_counter()
+                    status, queries = fetch(path)
+                    samples.append((time.perf_counter() - started, status, queries))
+                return samples
+            finally:
+                driver.finish_thread()
+
+        with ThreadPoolExecutor(concurrency) as pool:
+            futures = [pool.submit(worker, count) for count in shares]
+            started = time.perf_counter()
+            samples = [sample for future in futures for sample in future.result()]
+            elapsed = time.perf_counter() - started
+
+        latencies = sorted(sample[0] for sample in samples)
+        statuses = {}
+        for _, status, _ in samples:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        counted = [sample[2] for sample in samples if sample[2] is not None]
+        return {
+            'path': path,
+            'requests': len(samples),
+            'p50': percentile(latencies, 50),
+            'p95': percentile(latencies, 95),
+            'p99': percentile(latencies, 99),
+            'mean': sum(latencies) / len(latencies) if latencies else None,
+            'rps': len(samples) / elapsed if elapsed else 0.0,
+            'queries': sum(counted) / len(counted) if counted else None,
+            'statuses': statuses,
+            'peak_rss_kb': driver.peak_rss_kb(),
+        }
+
+    def meta(self, driver, options):
+        try:
+            commit = subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], cwd=str(settings.BASE_DIR),
+                capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            'commit': commit,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'driver': driver.name,
+            'asgi': options['asgi'],
+            'concurrency': options['concurrency'],
+            'requests': options['requests'],
+            'warmup': options['warmup'],
+            'orders': Order.objects.count(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+        }
+
+    def compare(self, baseline, report, threshold):
+        """Print the change against ``baseline`` per view; returns the labels that regressed."""
+        old, new = baseline['results'], report['results']
+        self.stdout.write('')
+        self.stdout.write('Compared with %s (commit %s):' % (
+            baseline['meta'].get('created'), baseline['meta'].get('commit')))
+        for key in ('driver', 'asgi', 'concurrency', 'orders'):
+            if baseline['meta'].get(key) != report['meta'][key]:
+                self.stdout.write(self.style.WARNING('%s differs: %s in the baseline, %s now' % (
+                    key, baseline['meta'].get(key), report['meta'][key])))
+        self.stdout.write('%-34s %17s %17s %13s' % ('view', 'p50 ms', 'p95 ms', 'queries'))
+        regressions = []
+        for label in sorted(new.keys() & old.keys()):
+            before, after = old[label], new[label]
+            changes = {key: self.change(before[key], after[key]) for key in ('p50', 'p95')}
+            more_queries = (
+                before['queries'] is not None and after['queries'] is not None
+                and after['queries'] > before['queries']
+            )
+            regressed = more_queries or any(change is not None and change > threshold for change in changes.values())
+            if regressed:
+                regressions.append(label)
+            self.stdout.write('%-34s %7s %+8.0f%% %7s %+8.0f%% %5s -> %-5s%s' % (
+                label,
+                self.ms(after['p50']), changes['p50'] or 0,
+                self.ms(after['p95']), changes['p95'] or 0,
+                '-' if before['queries'] is None else '%.0f' % before['queries'],
+                '-' if after['queries'] is None else '%.0f' % after['queries'],
+                '  SLOWER' if regressed else '',
+            ))
+        for label in sorted(new.keys() - old.keys()):
+            self.stdout.write('%-34s (not in baseline)' % label)
+        return regressions
+
+    @staticmethod
+    def change(before, after):
+        if not before or after is None:
+            return None
+        return (after - before) / before * 100
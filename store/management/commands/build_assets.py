@@ -0,0 +1,34 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from store import assets
+
+
+class Command(BaseCommand):
+    help = 'Concatenate and minify the bundles in store.assets.BUNDLES into static/bundles/.'
+
+    def handle(self, *args, **options):
+        root = settings.STATICFILES_DIRS[0]
+        for name, paths in sorted(assets.BUNDLES.items()):
+            sources = []
+            for path in paths:
+                source = os.path.join(root, *path.split('/'))
+                if not os.path.exists(source):
+                    hint = ' (run vendor_assets first)' if assets.vendor_url(path) else ''
+                    raise CommandError('Missing %s%s.' % (path, hint))
+                with open(source, encoding='utf-8') as f:
+                    sources.append((path, f.read()))
+
+            bundle = assets.bundle_path(name)
+            if name.endswith('.css'):
+                content = assets.build_css(sources, bundle)
+            else:
+                content = assets.build_js(sources)
+            target = os.path.join(root, *bundle.split('/'))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'w', encoding='utf-8') as f:
+                f.write(content)
+            size = sum(len(text) for _, text in sources)
+            self.stdout.write('%s: %d file(s), %d -> %d bytes' % (bundle, len(sources), size, len(content)))
@@ -0,0 +1,64 @@
+from importlib import import_module
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from store import query_plans
+from users.models import User
+
+
+def sample_user(role):
+    # never saved: the querysets only need its primary key and role flags
+    return User(
+        pk=0,
+        username='explain-%s' % role,
+        is_staff=role == 'admin',
+        is_superuser=role == 'admin',
+        is_supplier=role == 'supplier',
+        is_buyer=role == 'buyer',
+    )
+
+
+class Command(BaseCommand):
+    help = 'Run EXPLAIN QUERY PLAN on every registered view queryset and flag full scans.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', help='Only explain these registered names.')
+        parser.add_argument(
+            '--verbose-plan', action='store_true',
+            help='Print the whole plan for every query, not only the flagged lines.',
+        )
+        parser.add_argument(
+            '--fail', action='store_true',
+            help='Exit with an error when any query plan is flagged.',
+        )
+
+    def handle(self, *args, **options):
+        # importing the URLconf imports every view module and so its registrations
+        import_module(settings.ROOT_URLCONF)
+
+        entries = query_plans.registered()
+        if options['names']:
+            entries = [entry for entry in entries if entry.name in options['names']]
+        flagged = 0
+        for entry in entries:
+            for role in entry.roles:
+                queryset = entry.factory(sample_user(role))
+                plan = query_plans.explain(queryset[:settings.LIST_PAGE_SIZE])
+                found = query_plans.problems(plan, entry.allow_scans, entry.allow_sort)
+                label = '%s [%s]' % (entry.name, role)
+                if found:
+                    flagged += 1
+                    self.stdout.write(self.style.WARNING('FLAG %s' % label))
+                    lines = plan if options['verbose_plan'] else found
+                else:
+                    self.stdout.write('ok   %s' % label)
+                    lines = plan if options['verbose_plan'] else []
+                for line in lines:
+                    self.stdout.write('       %s' % line)
+
+        if flagged and options['fail']:
+            raise CommandError('%d query plan(s) flagged.' % flagged)
+        self.stdout.write('%d queries explained, %d flagged.' % (
+            sum(len(entry.roles) for entry in entries), flagged,
+        ))
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from store.importers import BATCH_SIZE, CHUNK_SIZE, FORMATS, OrderImporter, guess_format, read_rows
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Bulk-import orders from a CSV or JSON Lines file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to import.')
+        parser.add_argument('--format', choices=FORMATS, help='Defaults to a guess from the file name.')
+        parser.add_argument('--user', help='Import as this user (buyers are limited to their own buyer).')
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='Rows per INSERT.')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help='Rows per transaction.')
+
+    def handle(self, *args, **options):
+        user = None
+        if options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError('No user named %r.' % options['user'])
+
+        fmt = options['format'] or guess_format(options['path'])
+        importer = OrderImporter(user, options['batch_size'], options['chunk_size'])
+        with open(options['path'], encoding='utf-8-sig', newline='') as stream:
+            report = importer.run(read_rows(stream, fmt))
+
+        for row in report.errors:
+            messages = '; '.join(
+                '%s: %s' % (field, ' '.join(errors)) for field, errors in row['errors'].items()
+            )
+            self.stderr.write('line %s: %s' % (row['line'], messages))
+        if report.truncated:
+            self.stderr.write('... %d more rejected rows not shown' % (report.error_count - len(report.errors)))
+        self.stdout.write(self.style.SUCCESS(
+            'Imported %d of %d rows (%d rejected).' % (report.created, report.rows, report.error_count)
+        ))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from store import counters
+
+
+class Command(BaseCommand):
+    help = 'Recompute the dashboard counters from the order and master tables.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help='Report drifted counters without rewriting them.',
+        )
+
+    def handle(self, *args, **options):
+        drift = counters.rebuild(dry_run=options['dry_run'])
+        for key in sorted(drift):
+            stored, actual = drift[key]
+            self.stdout.write('%s: stored=%s actual=%s' % (key, stored, actual))
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('Counters are consistent.'))
+        elif options['dry_run']:
+            self.stdout.write(self.style.WARNING('%d counter(s) drifted.' % len(drift)))
+        else:
+            self.stdout.write(self.style.SUCCESS('Rebuilt %d drifted counter(s).' % len(drift)))
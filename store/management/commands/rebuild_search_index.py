@@ -0,0 +1,18 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from store import search
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text order search index from the order and master tables.'
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        with transaction.atomic():
+            total = search.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            'Indexed %d orders in %.1fs.' % (total, time.monotonic() - started)
+        ))
@@ -0,0 +1,42 @@
+import sqlite3
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from inventory.routers import PRIMARY, REPLICA
+
+
+class Command(BaseCommand):
+    help = 'Copy the primary SQLite database into the read replica with the online backup API.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--every', type=float, metavar='SECONDS',
+            help='Keep refreshing at this interval instead of copying once.',
+        )
+        parser.add_argument(
+            '--pages', type=int, default=1024,
+            help='Pages copied per step; writers may run on the primary between steps.',
+        )
+
+    def handle(self, *args, **options):
+        if REPLICA not in connections.databases:
+            raise CommandError('No replica database is configured (set SQLITE_REPLICA=1).')
+        while True:
+            started = time.monotonic()
+            self.refresh(options['pages'])
+            self.stdout.write('Replica refreshed in %.2fs.' % (time.monotonic() - started))
+            if not options['every']:
+                return
+            time.sleep(max(0, options['every'] - (time.monotonic() - started)))
+
+    def refresh(self, pages):
+        primary = connections[PRIMARY]
+        primary.ensure_connection()
+        target = sqlite3.connect(connections.databases[REPLICA]['NAME'])
+        try:
+            primary.connection.backup(target, pages=pages)
+            target.execute('PRAGMA journal_mode=wal')
+        finally:
+            target.close()
@@ -0,0 +1,232 @@
+import random
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from itertools import accumulate
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Max
+
+from store import caching, counters, search
+from store.choices import CHOICE_MODELS
+from store.models import Buyer, Delivery, Drop, Order, Product, Season, Supplier
+from users.models import User
+
+COLORS = (
+    'Black', 'White', 'Navy', 'Grey', 'Red', 'Olive', 'Beige', 'Blue',
+    'Green', 'Pink', 'Brown', 'Yellow', 'Orange', 'Purple',
+)
+DESIGNS = ['D-%04d' % n for n in range(10000)]
+COURIERS = ('DHL', 'FedEx', 'UPS', 'Aramex', 'Blue Dart', 'Maersk')
+# (status, share of orders)
+STATUSES = (('pending', 30), ('done', 60), ('cancelled', 10))
+
+
+class FastPasswordHasher(PBKDF2PasswordHasher):
+    # a single PBKDF2 round; the iteration count is stored in the hash, so
+    # the stock hasher still verifies it and upgrades it on first login
+    iterations = 1
+
+
+# columns written by seed_inventory, in the order its row tuples use
+ORDER_FIELDS = (
+    'id', 'supplier', 'buyer', 'product', 'season', 'drop', 'design', 'color', 'status', 'created_date',
+)
+DELIVERY_FIELDS = ('order', 'supplier', 'buyer', 'courier_name', 'created_date')
+
+
+def insert_rows(model, fields, rows):
+    """
+    INSERT ``rows`` (tuples of ready-to-store values in ``fields`` order)
+    with one executemany.
+
+    bulk_create spends most of its time building model instances and
+    preparing every value through its field; for a million generated rows
+    that are already in database form it is several times slower.
+    """
+    if not rows:
+        return
+    quote = connection.ops.quote_name
+    sql = 'INSERT INTO %s (%s) VALUES (%s)' % (
+        quote(model._meta.db_table),
+        ', '.join(quote(model._meta.get_field(name).column) for name in fields),
+        ', '.join(['%s'] * len(fields)),
+    )
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, rows)
+
+
+def zipf_weights(count, skew):
+    """Cumulative weights giving rank ``n`` a share proportional to ``1 / (n + 1) ** skew``."""
+    return list(accumulate(1 / (rank + 1) ** skew for rank in range(count)))
+
+
+class Command(BaseCommand):
+    help = (
+        'Fill the database with synthetic suppliers, buyers, products, orders and deliveries '
+        'for scale testing. The same --seed always produces the same data.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--suppliers', type=int, default=50)
+        parser.add_argument('--buyers', type=int, default=2000)
+        parser.add_argument('--seasons', type=int, default=8)
+        parser.add_argument('--drops', type=int, default=24)
+        parser.add_argument('--products', type=int, default=500)
+        parser.add_argument('--orders', type=int, default=100000)
+        parser.add_argument(
+            '--delivered', type=float, default=0.8,
+            help='Share of done orders that get a delivery.',
+        )
+        parser.add_argument(
+            '--supplier-skew', type=float, default=1.2,
+            help='Zipf exponent of orders per supplier; higher means a few huge suppliers.',
+        )
+        parser.add_argument(
+            '--buyer-skew', type=float, default=0.6,
+            help='Zipf exponent of orders per buyer; lower means a longer tail.',
+        )
+        parser.add_argument('--days', type=int, default=365, help='Spread order dates over this many days.')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--prefix', default='seed', help='Prefix of the generated names and usernames.')
+        parser.add_argument('--password', default='password', help='Password of every generated user.')
+        parser.add_argument('--chunk-size', type=int, default=50000, help='Orders per transaction.')
+        parser.add_argument('--cache-mb', type=int, default=256, help='SQLite page cache while seeding.')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.prefix = options['prefix']
+        if options['orders'] and not all(options[name] for name in ('suppliers', 'buyers', 'products')):
+            raise CommandError('Orders need at least one supplier, buyer and product.')
+        if User.objects.filter(username__startswith='%s-' % self.prefix).exists():
+            raise CommandError(
+                'Users prefixed %r already exist; pick another --prefix.' % self.prefix
+            )
+        started = time.monotonic()
+        if connection.vendor == 'sqlite':
+            # keep the order indexes in memory while they are filled in random order
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA cache_size=%d' % (-1024 * options['cache_mb']))
+
+        with self.step('users'):
+            password = make_password(options['password'], hasher=FastPasswordHasher())
+            supplier_ids = self.create_owners(Supplier, 'supplier', options['suppliers'], password)
+            buyer_ids = self.create_owners(Buyer, 'buyer', options['buyers'], password)
+        with self.step('reference data'):
+            season_ids = self.create_named(Season, options['seasons'], description='Synthetic season')
+            drop_ids = self.create_named(Drop, options['drops'])
+            product_ids = self.create_named(Product, options['products'])
+
+        # every key is taken from the rows created above, so skip checking them
+        with self.step('orders and deliveries'), connection.constraint_checks_disabled():
+            total, deliveries = self.create_orders(
+                options, supplier_ids, buyer_ids, product_ids, season_ids, drop_ids,
+            )
+        with self.step('counters'):
+            # the inserts above send no signals, so nothing has kept them up to date
+            counters.rebuild()
+            caching.bump_version(*[caching.model_namespace(model) for model in CHOICE_MODELS.values()])
+        with self.step('search index'):
+            # in one pass once the orders are in: indexing inside every chunk's
+            # transaction doubled the time the orders step took
+            search.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(
+            'Seeded %d suppliers, %d buyers, %d products, %d orders and %d deliveries in %.1fs.' % (
+                len(supplier_ids), len(buyer_ids), len(product_ids), total, deliveries,
+                time.monotonic() - started,
+            )
+        ))
+
+    @contextmanager
+    def step(self, label):
+        started = time.monotonic()
+        yield
+        self.stdout.write('%-22s %6.1fs' % (label, time.monotonic() - started))
+
+    def name(self, kind, n):
+        return '%s %s %d' % (self.prefix.title(), kind, n)
+
+    def create_owners(self, model, role, count, password):
+        """Users flagged with ``role`` plus their Supplier/Buyer rows; returns the new ids."""
+        with transaction.atomic():
+            users = User.objects.bulk_create([
+                User(
+                    username='%s-%s-%d' % (self.prefix, role, n), password=password,
+                    **{'is_%s' % role: True}
+                )
+                for n in range(1, count + 1)
+            ], batch_size=500)
+            owners = model.objects.bulk_create([
+                model(user=user, name=self.name(role.title(), n), address='%d Synthetic Street' % n)
+                for n, user in enumerate(users, 1)
+            ], batch_size=500)
+        return [owner.pk for owner in owners]
+
+    def create_named(self, model, count, **fields):
+        """``count`` rows of ``model`` named after it, e.g. "Seed Season 3"; returns the new ids."""
+        kind = model._meta.verbose_name.title()
+        rows = [model(name=self.name(kind, n), **fields) for n in range(1, count + 1)]
+        if model is Product:
+            for n, row in enumerate(rows, 1):
+                row.sortno = n
+        with transaction.atomic():
+            return [row.pk for row in model.objects.bulk_create(rows, batch_size=500)]
+
+    def create_orders(self, options, supplier_ids, buyer_ids, product_ids, season_ids, drop_ids):
+        """
+        Insert the orders, and deliveries for some of the done ones, in
+        transactions of ``--chunk-size`` orders; returns both totals.
+
+        Dates fall evenly over ``--days``, newest ids latest, and each
+        delivery follows its order by a few days.
+        """
+        rng = self.rng
+        total = options['orders']
+        supplier_weights = zipf_weights(len(supplier_ids), options['supplier_skew'])
+        buyer_weights = zipf_weights(len(buyer_ids), options['buyer_skew'])
+        # best sellers: product popularity is skewed as well
+        product_weights = zipf_weights(len(product_ids), 1.0)
+        statuses = [status for status, _ in STATUSES]
+        status_weights = list(accumulate(share for _, share in STATUSES))
+        seasons = season_ids or [None]
+        drops = drop_ids or [None]
+        days = max(options['days'], 1)
+        today = date.today()
+        dates = [(today - timedelta(days=ago)).isoformat() for ago in range(days)]
+
+        created = delivered = 0
+        while created < total:
+            size = min(options['chunk_size'], total - created)
+            suppliers = rng.choices(supplier_ids, cum_weights=supplier_weights, k=size)
+            buyers = rng.choices(buyer_ids, cum_weights=buyer_weights, k=size)
+            products = rng.choices(product_ids, cum_weights=product_weights, k=size)
+            chunk_statuses = rng.choices(statuses, cum_weights=status_weights, k=size)
+            ago = [(days - 1) * (total - 1 - n) // max(total - 1, 1) for n in range(created, created + size)]
+            delivered_flags = rng.choices((True, False), (options['delivered'], 1 - options['delivered']), k=size)
+            couriers = rng.choices(COURIERS, k=size)
+            lags = rng.choices(range(1, 8), k=size)
+            with transaction.atomic():
+                # ids are assigned here so deliveries can point at their orders
+                first_id = (Order.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+                ids = range(first_id, first_id + size)
+                orders = list(zip(
+                    ids, suppliers, buyers, products,
+                    rng.choices(seasons, k=size), rng.choices(drops, k=size),
+                    rng.choices(DESIGNS, k=size), rng.choices(COLORS, k=size),
+                    chunk_statuses, [dates[n] for n in ago],
+                ))
+                deliveries = [
+                    (ids[i], suppliers[i], buyers[i], couriers[i], dates[max(ago[i] - lags[i], 0)])
+                    for i in range(size)
+                    if chunk_statuses[i] == 'done' and delivered_flags[i]
+                ]
+                insert_rows(Order, ORDER_FIELDS, orders)
+                insert_rows(Delivery, DELIVERY_FIELDS, deliveries)
+            created += size
+            delivered += len(deliveries)
+            if options['verbosity'] > 1:
+                self.stdout.write('  %d/%d orders' % (created, total))
+        return created, delivered
@@ -0,0 +1,36 @@
+import os
+import urllib.request
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from store.assets import VENDOR, VENDOR_DIR
+
+
+class Command(BaseCommand):
+    help = 'Download the third-party static files listed in store.assets.VENDOR into static/vendor/.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Download files that already exist.')
+        parser.add_argument('--timeout', type=float, default=30, help='Seconds per download.')
+
+    def handle(self, *args, **options):
+        root = os.path.join(settings.STATICFILES_DIRS[0], VENDOR_DIR)
+        fetched = 0
+        for path, url in sorted(VENDOR.items()):
+            target = os.path.join(root, *path.split('/'))
+            if os.path.exists(target) and not options['force']:
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            try:
+                with urllib.request.urlopen(url, timeout=options['timeout']) as response:
+                    data = response.read()
+            except OSError as e:
+                raise CommandError('Could not download %s: %s' % (url, e))
+            with open(target, 'wb') as f:
+                f.write(data)
+            fetched += 1
+            self.stdout.write('%s (%d bytes)' % (path, len(data)))
+        self.stdout.write(self.style.SUCCESS(
+            'Vendored %d file(s); %d already present.' % (fetched, len(VENDOR) - fetched)
+        ))
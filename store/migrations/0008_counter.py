@@ -0,0 +1,48 @@
+# Generated by Django 5.1.15 on 2026-10-18 16:42
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counters(apps, schema_editor):
+    Counter = apps.get_model('store', 'Counter')
+    Order = apps.get_model('store', 'Order')
+
+    counts = {
+        'product': apps.get_model('store', 'Product').objects.count(),
+        'supplier': apps.get_model('store', 'Supplier').objects.count(),
+        'buyer': apps.get_model('store', 'Buyer').objects.count(),
+        'order': Order.objects.count(),
+    }
+    grouped = Order.objects.order_by().values_list
+    for status, total in grouped('status').annotate(total=Count('id')):
+        counts['order.status.%s' % status] = total
+    for supplier_id, total in grouped('supplier_id').annotate(total=Count('id')):
+        counts['order.supplier.%s' % supplier_id] = total
+    for buyer_id, total in grouped('buyer_id').annotate(total=Count('id')):
+        if buyer_id is not None:
+            counts['order.buyer.%s' % buyer_id] = total
+
+    Counter.objects.bulk_create(
+        [Counter(key=key, value=value) for key, value in counts.items()],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0007_alter_buyer_id_alter_delivery_id_alter_drop_id_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Counter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('value', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+
+CREATE_SQL = '''
+CREATE VIRTUAL TABLE store_order_search USING fts5(
+    design, color, product, buyer, supplier, season, "drop", owner,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+)
+'''
+
+# the orders already in the database; see store.search.INDEX_SQL
+FILL_SQL = '''
+INSERT INTO store_order_search
+    (rowid, design, color, product, buyer, supplier, season, "drop", owner)
+SELECT o.id, o.design, o.color, p.name, COALESCE(b.name, ''), s.name,
+       COALESCE(se.name, ''), COALESCE(d.name, ''),
+       's' || s.user_id || COALESCE(' b' || b.user_id, '')
+FROM store_order o
+JOIN store_product p ON p.id = o.product_id
+JOIN store_supplier s ON s.id = o.supplier_id
+LEFT JOIN store_buyer b ON b.id = o.buyer_id
+LEFT JOIN store_season se ON se.id = o.season_id
+LEFT JOIN store_drop d ON d.id = o.drop_id
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0009_order_access_path_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            [CREATE_SQL, FILL_SQL],
+            reverse_sql='DROP TABLE store_order_search',
+        ),
+    ]
@@ -0,0 +1,44 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+# the owners of the deliveries already in the database, from their orders
+FILL_SQL = '''
+UPDATE store_delivery SET
+    supplier_id = (SELECT o.supplier_id FROM store_order o WHERE o.id = store_delivery.order_id),
+    buyer_id = (SELECT o.buyer_id FROM store_order o WHERE o.id = store_delivery.order_id)
+'''
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0010_order_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='delivery',
+            name='supplier',
+            field=models.ForeignKey(
+                editable=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name='+', to='store.supplier',
+            ),
+        ),
+        migrations.AddField(
+            model_name='delivery',
+            name='buyer',
+            field=models.ForeignKey(
+                editable=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name='+', to='store.buyer',
+            ),
+        ),
+        migrations.RunSQL(FILL_SQL, reverse_sql=migrations.RunSQL.noop),
+        migrations.AlterField(
+            model_name='delivery',
+            name='supplier',
+            field=models.ForeignKey(
+                editable=False, on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name='+', to='store.supplier',
+            ),
+        ),
+    ]
@@ -55,6 +55,12 @@ class Order(models.Model):
         ('done', 'Done'),
         ('cancelled', 'Cancelled'),
     )
+    # allowed status changes; anything else is rejected by store.status
+    STATUS_TRANSITIONS = {
+        'pending': ('done', 'cancelled'),
+        'done': ('pending',),
+        'cancelled': ('pending',),
+    }
     supplier = models.ForeignKey(Supplier, on_delete=models.CASCADE)
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     design = models.CharField(max_length=50)
@@ -65,14 +71,66 @@ class Order(models.Model):
     status = models.CharField(max_length=10, choices=STATUS_CHOICE, default='pending')
     created_date = models.DateField(auto_now_add=True)
 
+    class Meta:
+        # The single-column supplier/buyer FK indexes already serve
+        # "owner = ? ORDER BY id DESC" (SQLite appends the rowid to every
+        # index); these cover the same paths narrowed by status or date.
+        indexes = [
+            models.Index(fields=['supplier', 'status', '-id'], name='order_supplier_status_idx'),
+            models.Index(fields=['buyer', 'status', '-id'], name='order_buyer_status_idx'),
+            models.Index(fields=['status', '-id'], name='order_status_idx'),
+            models.Index(fields=['created_date'], name='order_created_date_idx'),
+            # "does this supplier have orders for this product" (store.queries.supplier_products)
+            models.Index(fields=['supplier', 'product'], name='order_supplier_product_idx'),
+        ]
+
+    # columns whose previous values the counters need on update
+    TRACKED_FIELDS = ('status', 'supplier_id', 'buyer_id')
+
     def __str__(self):
         return self.product.name
 
+    @property
+    def status_options(self):
+        """The current status plus the ones it may move to, as choices."""
+        allowed = self.STATUS_TRANSITIONS.get(self.status, ())
+        return [(value, label) for value, label in self.STATUS_CHOICE
+                if value == self.status or value in allowed]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: instance.__dict__[name]
+            for name in cls.TRACKED_FIELDS if name in instance.__dict__
+        }
+        return instance
+
 
 class Delivery(models.Model):
     order = models.ForeignKey(Order, on_delete=models.CASCADE)
+    # copies of the order's owners, so each owner's deliveries page on
+    # their own FK index (owner, rowid) instead of being sorted after a
+    # join through every order they have; the order cascade deletes them
+    supplier = models.ForeignKey(Supplier, on_delete=models.DO_NOTHING, editable=False, related_name='+')
+    buyer = models.ForeignKey(Buyer, on_delete=models.DO_NOTHING, null=True, editable=False, related_name='+')
     courier_name = models.CharField(max_length=120)
     created_date = models.DateField(auto_now_add=True)
 
     def __str__(self):
         return self.courier_name
+
+    def save(self, *args, **kwargs):
+        # store.signals.order_saved keeps these in step when an order is reassigned
+        self.supplier_id = self.order.supplier_id
+        self.buyer_id = self.order.buyer_id
+        super().save(*args, **kwargs)
+
+
+class Counter(models.Model):
+    """Row counts maintained alongside writes; see store/counters.py."""
+    key = models.CharField(max_length=64, unique=True)
+    value = models.BigIntegerField(default=0)
+
+    def __str__(self):
+        return '%s=%s' % (self.key, self.value)
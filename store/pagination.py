@@ -0,0 +1,101 @@
+from django.conf import settings
+
+
+def parse_cursor(value):
+    """Return a positive integer cursor from a query parameter, or None."""
+    try:
+        cursor = int(value)
+    except (TypeError, ValueError):
+        return None
+    return cursor if cursor > 0 else None
+
+
+class KeysetPage:
+    """
+    One page of a queryset walked newest-first on its primary key.
+
+    Unlike Django's Paginator this never runs COUNT(*) or OFFSET: the next
+    page starts strictly below the last primary key shown (``?after=<id>``).
+    """
+
+    def __init__(self, object_list, page_size, has_next, after=None):
+        self.object_list = object_list
+        self.page_size = page_size
+        self.after = after
+        self._has_next = has_next
+        self.next_query = ''
+        self.first_query = ''
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self.after is not None
+
+    @property
+    def next_cursor(self):
+        if self._has_next and self.object_list:
+            return self.object_list[-1].pk
+        return None
+
+
+def keyset_paginate(queryset, after=None, page_size=None):
+    page_size = page_size or settings.LIST_PAGE_SIZE
+    if after is not None:
+        queryset = queryset.filter(pk__lt=after)
+    # fetch one extra row to learn whether another page exists
+    rows = list(queryset.order_by('-pk')[:page_size + 1])
+    return KeysetPage(rows[:page_size], page_size, len(rows) > page_size, after)
+
+
+def link_page(page, params, cursor_kwarg='after'):
+    """
+    Set ``page.first_query`` and ``page.next_query`` to ``params`` with
+    ``cursor_kwarg`` dropped or moved past the page; every other parameter
+    is kept.
+    """
+    params = params.copy()
+    params.pop(cursor_kwarg, None)
+    page.first_query = params.urlencode()
+    if page.has_next():
+        params[cursor_kwarg] = page.next_cursor
+        page.next_query = params.urlencode()
+    return page
+
+
+class KeysetPaginationMixin:
+    """
+    ListView mixin replacing OFFSET pagination with a ``-pk`` cursor.
+
+    The page size comes from ``?page_size=`` (bounded by ``max_paginate_by``)
+    and falls back to ``paginate_by``.
+    """
+    paginate_by = None
+    max_paginate_by = None
+    cursor_kwarg = 'after'
+    page_size_kwarg = 'page_size'
+
+    def get_default_page_size(self):
+        return self.paginate_by or settings.LIST_PAGE_SIZE
+
+    def get_paginate_by(self, queryset):
+        default = self.get_default_page_size()
+        maximum = self.max_paginate_by or settings.LIST_PAGE_SIZE_MAX
+        try:
+            size = int(self.request.GET.get(self.page_size_kwarg, default))
+        except (TypeError, ValueError):
+            size = default
+        return max(1, min(size, maximum))
+
+    def paginate_queryset(self, queryset, page_size):
+        after = parse_cursor(self.request.GET.get(self.cursor_kwarg))
+        page = keyset_paginate(queryset, after, page_size)
+
+        link_page(page, self.request.GET, self.cursor_kwarg)
+        return None, page, page.object_list, page.has_next()
@@ -1,6 +1,11 @@
 # permissions.py for store app
 
+import hashlib
 from functools import wraps
+from types import MappingProxyType
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
 from django.http import HttpResponseForbidden
 from django.shortcuts import redirect
 
@@ -30,6 +35,104 @@ admin = {
     # Add more permissions as needed
 }
 
+# ---- compiled once at import: one bit per permission, one mask per role ----
+
+ROLE_TABLES = {'buyer': buyer, 'supplier': supplier, 'admin': admin}
+
+PERMISSIONS = tuple(sorted({name for table in ROLE_TABLES.values() for name in table}))
+PERMISSION_BITS = MappingProxyType({name: 1 << index for index, name in enumerate(PERMISSIONS)})
+ALL_PERMISSIONS = (1 << len(PERMISSIONS)) - 1
+
+
+def permission_mask(*names):
+    mask = 0
+    for name in names:
+        mask |= PERMISSION_BITS.get(name, 0)
+    return mask
+
+
+ROLE_MASKS = MappingProxyType({
+    role: ALL_PERMISSIONS if role == 'admin' else permission_mask(*[
+        name for name, granted in table.items() if granted
+    ])
+    for role, table in ROLE_TABLES.items()
+})
+
+# changes whenever the matrix does; cache keys built from permissions embed it
+PERMISSION_VERSION = hashlib.sha1(
+    repr(sorted((role, mask) for role, mask in ROLE_MASKS.items()) + list(PERMISSIONS)).encode()
+).hexdigest()[:12]
+
+# role flags of a user, as a bitset role_required can test in one operation
+BUYER_FLAG = 1
+SUPPLIER_FLAG = 2
+ADMIN_FLAG = 4
+ROLE_FLAGS = MappingProxyType({'buyer': BUYER_FLAG, 'supplier': SUPPLIER_FLAG, 'admin': ADMIN_FLAG})
+
+
+class RolePermissions:
+    """
+    The permission set of one role.
+
+    Templates test a permission with ``{{ role_perms.can_view_products }}``;
+    code can test several at once with ``has_all``/``has_any``.
+    """
+    __slots__ = ('role', 'mask', 'flags', 'is_superuser')
+
+    def __init__(self, role, flags=0, is_superuser=False):
+        self.role = role
+        self.mask = ROLE_MASKS.get(role, 0)
+        self.flags = flags
+        self.is_superuser = is_superuser
+
+    def __getitem__(self, name):
+        # only permission names, so templates still reach role/flags as attributes
+        if name not in PERMISSION_BITS:
+            raise KeyError(name)
+        return self.has(name)
+
+    def __contains__(self, name):
+        return self.has(name)
+
+    def __bool__(self):
+        return self.role is not None
+
+    def has(self, name):
+        # admins keep access to permissions nobody has named yet
+        return self.role == 'admin' or bool(self.mask & PERMISSION_BITS.get(name, 0))
+
+    def has_all(self, *names):
+        mask = permission_mask(*names)
+        return self.role == 'admin' or (self.mask & mask) == mask
+
+    def has_any(self, *names):
+        return self.role == 'admin' or bool(self.mask & permission_mask(*names))
+
+
+NO_PERMISSIONS = RolePermissions(None)
+
+
+def permissions_for(user):
+    """The RolePermissions of ``user``; resolves the role flags once."""
+    if not user.is_authenticated:
+        return NO_PERMISSIONS
+    flags = (
+        (BUYER_FLAG if user.is_buyer else 0)
+        | (SUPPLIER_FLAG if user.is_supplier else 0)
+        | (ADMIN_FLAG if user.is_admin else 0)
+    )
+    return RolePermissions(user.role, flags, user.is_superuser)
+
+
+def request_permissions(request):
+    """``request.role_perms``, computed here when the middleware did not run."""
+    perms = getattr(request, 'role_perms', None)
+    if perms is None:
+        perms = request.role_perms = permissions_for(request.user)
+        request.role = perms.role
+    return perms
+
+
 def has_permission(role, permission):
     """
     Helper function to check if a role has a specific permission.
@@ -37,25 +140,65 @@ def has_permission(role, permission):
     """
     if role == 'admin':
         return True
-    perms = globals().get(role, {})
-    return perms.get(permission, False)
+    return bool(ROLE_MASKS.get(role, 0) & PERMISSION_BITS.get(permission, 0))
+
 
 def role_required(*roles):
+    required = 0
+    for role in roles:
+        required |= ROLE_FLAGS[role]
+
     def decorator(view_func):
         @wraps(view_func)
         def _wrapped_view(request, *args, **kwargs):
             if not request.user.is_authenticated:
                 return redirect('login')
+            perms = request_permissions(request)
             # Superusers (admins) have full access automatically
-            if request.user.is_superuser:
+            if perms.is_superuser or perms.flags & required:
                 return view_func(request, *args, **kwargs)
-            for role in roles:
-                if role == 'buyer' and request.user.is_buyer:
-                    return view_func(request, *args, **kwargs)
-                if role == 'supplier' and request.user.is_supplier:
-                    return view_func(request, *args, **kwargs)
-                if role == 'admin' and request.user.is_admin:
-                    return view_func(request, *args, **kwargs)
             return HttpResponseForbidden("You do not have permission to access this page.")
         return _wrapped_view
-    return decorator
\ No newline at end of file
+    return decorator
+
+
+class RolePermissionMiddleware:
+    """Resolve the user's role and permissions once and attach them to the request."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        self.attach(request, request.user)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        # load the user here, so async views and templates rendered on
+        # worker threads find it on the request instead of querying again
+        request.user = await request.auser()
+        self.attach(request, request.user)
+        return await self.get_response(request)
+
+    def attach(self, request, user):
+        perms = request.role_perms = permissions_for(user)
+        request.role = perms.role
+
+
+def permissions_context(request):
+    """
+    Context processor exposing ``role`` and ``role_perms`` to templates, and
+    the key parts base.html caches its role-dependent chrome under.
+    """
+    perms = request_permissions(request)
+    return {
+        'role': perms.role,
+        'role_perms': perms,
+        'chrome_cache_version': '%s.%s' % (PERMISSION_VERSION, settings.TEMPLATE_CACHE_VERSION),
+        'chrome_cache_timeout': settings.CHROME_CACHE_TIMEOUT,
+    }
@@ -0,0 +1,115 @@
+from django.db.models import Exists, OuterRef, Q
+
+from .models import Buyer, Delivery, Order, Product, Supplier
+
+# columns rendered by the order tables; everything else stays deferred
+ORDER_LIST_RELATED = ('supplier', 'product', 'buyer', 'season', 'drop')
+ORDER_LIST_FIELDS = (
+    'design',
+    'color',
+    'status',
+    'created_date',
+    'supplier__name',
+    'supplier__user',
+    'product__name',
+    'buyer__name',
+    'season__name',
+    'drop__name',
+)
+DELIVERY_LIST_FIELDS = (
+    'courier_name',
+    'created_date',
+    'order__product__name',
+)
+# columns behind an order picker label, read in one joined query
+ORDER_PICKER_COLUMNS = ('pk', 'product__name', 'design', 'color', 'buyer__name')
+
+
+def orders_for_user(user):
+    """Orders visible to ``user``: everything for staff, otherwise their own."""
+    if user.is_staff or user.is_superuser:
+        return Order.objects.all()
+    elif user.is_supplier:
+        return Order.objects.filter(supplier__user=user)
+    elif user.is_buyer:
+        return Order.objects.filter(buyer__user=user)
+    return Order.objects.none()
+
+
+def deliveries_for_user(user):
+    """Deliveries of the orders visible to ``user``."""
+    if user.is_staff or user.is_superuser:
+        return Delivery.objects.all()
+    elif user.is_supplier:
+        return Delivery.objects.filter(supplier__user=user)
+    elif user.is_buyer:
+        return Delivery.objects.filter(buyer__user=user)
+    return Delivery.objects.none()
+
+
+def with_order_columns(orders):
+    return orders.select_related(*ORDER_LIST_RELATED).only(*ORDER_LIST_FIELDS).order_by('-id')
+
+
+def with_delivery_columns(deliveries):
+    return deliveries.select_related('order__product').only(*DELIVERY_LIST_FIELDS).order_by('-id')
+
+
+def order_list_queryset(user):
+    return with_order_columns(orders_for_user(user))
+
+
+def delivery_list_queryset(user):
+    return with_delivery_columns(deliveries_for_user(user))
+
+
+def undelivered_orders(orders):
+    return orders.filter(~Exists(Delivery.objects.filter(order=OuterRef('pk'))))
+
+
+def order_label(pk, product, design, color, buyer):
+    return '#%s %s - %s / %s (%s)' % (pk, product, design, color, buyer)
+
+
+def order_picker_rows(orders, search=''):
+    """``(pk, label)`` rows for an order picker, newest first, optionally searched."""
+    search = search.strip()
+    if search:
+        match = Q(product__name__istartswith=search) | Q(design__istartswith=search)
+        if search.lstrip('#').isdigit():
+            match |= Q(pk=int(search.lstrip('#')))
+        orders = orders.filter(match)
+    return orders.values_list(*ORDER_PICKER_COLUMNS).order_by('-pk')
+
+
+def supplier_products(user):
+    """
+    Products the supplier has orders for.
+
+    Each product is checked with one probe of order_supplier_product_idx,
+    so a page costs at most a walk of the catalogue, however many orders
+    the supplier has.
+    """
+    ordered = Order.objects.filter(supplier__user=user, product=OuterRef('pk'))
+    return Product.objects.filter(Exists(ordered)).only('name', 'sortno')
+
+
+def owner_user_ids(supplier_ids=(), buyer_ids=()):
+    """User ids behind the given supplier and buyer ids."""
+    user_ids = set()
+    supplier_ids = [pk for pk in supplier_ids if pk is not None]
+    buyer_ids = [pk for pk in buyer_ids if pk is not None]
+    if supplier_ids:
+        user_ids.update(Supplier.objects.filter(pk__in=supplier_ids).values_list('user_id', flat=True))
+    if buyer_ids:
+        user_ids.update(Buyer.objects.filter(pk__in=buyer_ids).values_list('user_id', flat=True))
+    return user_ids
+
+
+def order_owner_user_ids(orders):
+    """User ids of the suppliers and buyers behind an Order queryset."""
+    user_ids = set()
+    for supplier_user, buyer_user in orders.values_list('supplier__user', 'buyer__user'):
+        user_ids.update((supplier_user, buyer_user))
+    user_ids.discard(None)
+    return user_ids
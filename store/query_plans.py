@@ -0,0 +1,60 @@
+"""
+Registry of the querysets behind each view, checked by ``manage.py explain_views``.
+
+Views register a factory taking a user and returning the queryset they would
+run for that user; the command runs ``EXPLAIN QUERY PLAN`` on each one for
+every role and reports tables that are read with a full scan.
+"""
+import re
+from collections import namedtuple
+
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+
+ROLES = ('admin', 'supplier', 'buyer')
+
+PlannedQuery = namedtuple('PlannedQuery', 'name factory roles allow_scans allow_sort')
+
+_registry = {}
+
+# "SCAN store_order", "SCAN U0 USING COVERING INDEX ..." etc.
+SCAN_RE = re.compile(r'^SCAN (?:TABLE )?(\w+)')
+TEMP_SORT = 'USE TEMP B-TREE FOR ORDER BY'
+
+
+def register(name, factory, roles=ROLES, allow_scans=(), allow_sort=False):
+    """
+    Register ``factory(user)`` under ``name``.
+
+    ``allow_scans`` lists tables (or query aliases) that may legitimately be
+    scanned, such as an unfiltered admin listing read newest-first, and
+    ``allow_sort`` accepts a temporary sort of the filtered rows.
+    """
+    _registry[name] = PlannedQuery(name, factory, tuple(roles), frozenset(allow_scans), allow_sort)
+
+
+def registered():
+    return [_registry[name] for name in sorted(_registry)]
+
+
+def explain(queryset):
+    """Return the detail column of ``EXPLAIN QUERY PLAN`` for ``queryset``."""
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return []
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def problems(plan, allow_scans=(), allow_sort=False):
+    """Full scans and whole-result sorts found in an explained plan."""
+    found = []
+    for detail in plan:
+        match = SCAN_RE.match(detail)
+        if match and match.group(1) not in allow_scans:
+            found.append(detail)
+        elif detail.startswith(TEMP_SORT) and not allow_sort:
+            found.append(detail)
+    return found
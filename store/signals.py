@@ -0,0 +1,148 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import caching, counters, search
+from .models import Buyer, Delivery, Drop, Order, Product, Season, Supplier
+from .queries import owner_user_ids
+
+
+# models the search index copies columns from: the order column pointing
+# at them, and the columns copied (see store.search.INDEX_SQL)
+SEARCH_SOURCES = {
+    Product: ('product_id', ('name',)),
+    Supplier: ('supplier_id', ('name', 'user_id')),
+    Buyer: ('buyer_id', ('name', 'user_id')),
+    Season: ('season_id', ('name',)),
+    Drop: ('drop_id', ('name',)),
+}
+# order columns the search index is built from
+SEARCH_ORDER_FIELDS = {'design', 'color', 'product', 'buyer', 'supplier', 'season', 'drop'}
+
+
+def _order_keys(values):
+    return counters.order_keys(values['status'], values['supplier_id'], values['buyer_id'])
+
+
+def _current_values(order):
+    return {name: getattr(order, name) for name in Order.TRACKED_FIELDS}
+
+
+def _invalidate_owner_dashboards(*values):
+    caching.invalidate_dashboards(owner_user_ids(
+        supplier_ids={v['supplier_id'] for v in values},
+        buyer_ids={v['buyer_id'] for v in values},
+    ))
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=Supplier)
+@receiver(post_save, sender=Buyer)
+def count_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        counters.apply({counters.MODEL_KEYS[sender]: 1})
+
+
+@receiver(post_delete, sender=Product)
+@receiver(post_delete, sender=Supplier)
+@receiver(post_delete, sender=Buyer)
+def count_deleted(sender, instance, **kwargs):
+    counters.apply({counters.MODEL_KEYS[sender]: -1})
+    if sender is Supplier:
+        counters.discard(counters.supplier_orders_key(instance.pk))
+    elif sender is Buyer:
+        counters.discard(counters.buyer_orders_key(instance.pk))
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=Supplier)
+@receiver(post_save, sender=Buyer)
+@receiver(post_save, sender=Season)
+@receiver(post_save, sender=Drop)
+@receiver(post_delete, sender=Product)
+@receiver(post_delete, sender=Supplier)
+@receiver(post_delete, sender=Buyer)
+@receiver(post_delete, sender=Season)
+@receiver(post_delete, sender=Drop)
+def reference_data_changed(sender, raw=False, **kwargs):
+    # cached form choices and list pages of this model (store.choices, CachedListMixin)
+    if not raw:
+        caching.bump_version(caching.model_namespace(sender))
+
+
+@receiver(post_save, sender=Order)
+def order_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    current = _current_values(instance)
+    if created:
+        counters.apply({key: 1 for key in _order_keys(current)})
+        _invalidate_owner_dashboards(current)
+    else:
+        loaded = getattr(instance, '_loaded_values', {})
+        if len(loaded) == len(current) and loaded != current:
+            deltas = {key: -1 for key in _order_keys(loaded)}
+            for key in _order_keys(current):
+                deltas[key] = deltas.get(key, 0) + 1
+            counters.apply(deltas)
+            if (loaded['supplier_id'], loaded['buyer_id']) != (current['supplier_id'], current['buyer_id']):
+                # its deliveries carry copies of the owners
+                Delivery.objects.filter(order=instance).update(
+                    supplier_id=current['supplier_id'], buyer_id=current['buyer_id'],
+                )
+            # a reassigned order also leaves its previous owners' dashboards
+            _invalidate_owner_dashboards(current, loaded)
+        else:
+            _invalidate_owner_dashboards(current)
+    instance._loaded_values = current
+
+
+@receiver(post_delete, sender=Order)
+def order_deleted(sender, instance, **kwargs):
+    current = _current_values(instance)
+    counters.apply({key: -1 for key in _order_keys(current)})
+    _invalidate_owner_dashboards(current)
+
+
+@receiver(post_save, sender=Delivery)
+@receiver(post_delete, sender=Delivery)
+def delivery_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        _invalidate_owner_dashboards({'supplier_id': instance.supplier_id, 'buyer_id': instance.buyer_id})
+
+
+@receiver(post_save, sender=Order)
+def order_indexed(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or (update_fields is not None and not SEARCH_ORDER_FIELDS & set(update_fields)):
+        return
+    search.index_orders([instance.pk])
+
+
+@receiver(post_delete, sender=Order)
+def order_unindexed(sender, instance, **kwargs):
+    search.remove_orders([instance.pk])
+
+
+@receiver(pre_save, sender=Product)
+@receiver(pre_save, sender=Supplier)
+@receiver(pre_save, sender=Buyer)
+@receiver(pre_save, sender=Season)
+@receiver(pre_save, sender=Drop)
+def note_rename(sender, instance, raw=False, **kwargs):
+    instance._renamed = False
+    if not raw and instance.pk is not None:
+        columns = SEARCH_SOURCES[sender][1]
+        previous = sender.objects.filter(pk=instance.pk).values_list(*columns).first()
+        current = tuple(getattr(instance, column) for column in columns)
+        instance._renamed = previous is not None and previous != current
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_save, sender=Supplier)
+@receiver(post_save, sender=Buyer)
+@receiver(post_save, sender=Season)
+@receiver(post_save, sender=Drop)
+def reindex_renamed(sender, instance, raw=False, **kwargs):
+    # every order indexed with the old name or owner is indexed again
+    if getattr(instance, '_renamed', False):
+        search.index('o.%s = %%s' % SEARCH_SOURCES[sender][0], [instance.pk])
+        instance._renamed = False
@@ -0,0 +1,182 @@
+"""
+Order status changes as compare-and-set UPDATEs.
+
+``Order.STATUS_TRANSITIONS`` is the state machine. Every change is a single
+``UPDATE ... WHERE id = ? AND status = <expected>`` that touches only the
+status column, so concurrent writers cannot silently overwrite each other:
+a change whose expected status no longer holds is reported as a conflict
+instead of being applied. Callers scope the change to a supplier, or leave
+it unscoped for staff.
+"""
+from django.conf import settings
+from django.db import transaction
+
+from . import caching, counters
+from .models import Order, Supplier
+from .queries import order_owner_user_ids, owner_user_ids
+
+STATUSES = tuple(value for value, _ in Order.STATUS_CHOICE)
+
+CHANGED = 'changed'
+UNCHANGED = 'unchanged'
+CONFLICT = 'conflict'
+
+
+class InvalidTransition(ValueError):
+    pass
+
+
+class InvalidRequest(ValueError):
+    pass
+
+
+def can_transition(current, new):
+    return new in Order.STATUS_TRANSITIONS.get(current, ())
+
+
+def check_transition(current, new):
+    if new not in STATUSES or current not in STATUSES:
+        raise InvalidTransition('Unknown order status.')
+    if current != new and not can_transition(current, new):
+        raise InvalidTransition('An order cannot go from %s to %s.' % (current, new))
+
+
+def supplier_scope(user):
+    """
+    The ``supplier_id`` an UPDATE must be limited to for ``user``.
+
+    Returns None for staff (no restriction); raises PermissionError for users
+    who cannot change order status at all.
+    """
+    if user.is_staff or user.is_superuser:
+        return None
+    if user.is_supplier:
+        supplier_id = Supplier.objects.filter(user=user).values_list('pk', flat=True).first()
+        if supplier_id is not None:
+            return supplier_id
+    raise PermissionError('User may not change order status.')
+
+
+def _scope(supplier_id):
+    return {} if supplier_id is None else {'supplier_id': supplier_id}
+
+
+def transition(order_id, expected, new_status, supplier_id=None):
+    """
+    Move one order from ``expected`` to ``new_status``.
+
+    Returns CHANGED, UNCHANGED (nothing to do) or CONFLICT when the order is
+    not in ``expected`` any more, or is not visible in the supplier scope.
+    Raises InvalidTransition for a change the state machine forbids.
+    """
+    check_transition(expected, new_status)
+    if expected == new_status:
+        return UNCHANGED
+    with transaction.atomic():
+        updated = Order.objects.filter(
+            pk=order_id, status=expected, **_scope(supplier_id)
+        ).update(status=new_status)
+        if not updated:
+            return CONFLICT
+        counters.apply({counters.status_key(expected): -1, counters.status_key(new_status): 1})
+        caching.invalidate_dashboards(order_owner_user_ids(Order.objects.filter(pk=order_id)))
+    return CHANGED
+
+
+def parse_bulk_request(data):
+    """
+    The order ids and status a bulk change posts (``ids`` + ``status``).
+
+    Raises InvalidRequest for ids that are not integers, more ids than
+    BULK_STATUS_MAX_ORDERS, or a status the state machine does not know.
+    """
+    try:
+        order_ids = {int(pk) for pk in data.getlist('ids')}
+    except ValueError:
+        raise InvalidRequest('Order ids must be integers.')
+    if len(order_ids) > settings.BULK_STATUS_MAX_ORDERS:
+        raise InvalidRequest('At most %d orders can be updated at once.' % settings.BULK_STATUS_MAX_ORDERS)
+    new_status = data.get('status')
+    if new_status not in STATUSES:
+        raise InvalidRequest('Unknown order status.')
+    return order_ids, new_status
+
+
+class BulkStatusResult:
+    def __init__(self, updated=(), unchanged=(), rejected=(), conflicts=(), skipped=()):
+        self.updated = sorted(updated)
+        self.unchanged = sorted(unchanged)
+        self.rejected = sorted(rejected)
+        self.conflicts = sorted(conflicts)
+        self.skipped = sorted(skipped)
+
+    def as_dict(self):
+        return {
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'rejected': self.rejected,
+            'conflicts': self.conflicts,
+            'skipped': self.skipped,
+        }
+
+
+def bulk_set_status(order_ids, new_status, supplier_id=None):
+    """
+    Move many orders to ``new_status``.
+
+    One compare-and-set UPDATE is issued per current status the state machine
+    allows to move to ``new_status``. Ids that do not exist or belong to
+    another supplier are ``skipped``; orders whose status may not move to
+    ``new_status`` are ``rejected``; orders already there are ``unchanged``.
+    Orders a concurrent writer moved out of their status first are reported
+    under ``conflicts``.
+    """
+    if new_status not in STATUSES:
+        raise InvalidTransition('Unknown order status.')
+    order_ids = set(order_ids)
+    scope = _scope(supplier_id)
+    updated, unchanged, rejected, conflicts = [], [], [], []
+
+    with transaction.atomic():
+        rows = list(
+            Order.objects.filter(id__in=order_ids, **scope)
+            .values_list('id', 'status', 'supplier_id', 'buyer_id')
+        )
+        by_status = {}
+        for row in rows:
+            if row[1] == new_status:
+                unchanged.append(row[0])
+            elif can_transition(row[1], new_status):
+                by_status.setdefault(row[1], []).append(row)
+            else:
+                rejected.append(row[0])
+
+        deltas = {}
+        for expected, group in by_status.items():
+            ids = [row[0] for row in group]
+            moved = Order.objects.filter(id__in=ids, status=expected, **scope).update(status=new_status)
+            # the row count is exact for this status, whatever else changed
+            deltas[counters.status_key(expected)] = -moved
+            deltas[counters.status_key(new_status)] = deltas.get(counters.status_key(new_status), 0) + moved
+            if moved < len(ids):
+                # some lost the race: the ones that moved are those now in
+                # new_status (or moved there by the other writer, as asked)
+                moved_ids = set(Order.objects.filter(id__in=ids, status=new_status).values_list('id', flat=True))
+                conflicts.extend(pk for pk in ids if pk not in moved_ids)
+                ids = [pk for pk in ids if pk in moved_ids]
+            updated.extend(ids)
+        if deltas:
+            counters.apply(deltas)
+            changed = [row for group in by_status.values() for row in group]
+            caching.invalidate_dashboards(owner_user_ids(
+                supplier_ids={row[2] for row in changed},
+                buyer_ids={row[3] for row in changed},
+            ))
+
+    return BulkStatusResult(
+        updated=updated,
+        unchanged=unchanged,
+        rejected=rejected,
+        conflicts=conflicts,
+        skipped=order_ids - {row[0] for row in rows},
+    )
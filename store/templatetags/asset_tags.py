@@ -0,0 +1,34 @@
+from functools import lru_cache
+
+from django import template
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+from django.utils.html import format_html_join
+
+from .. import assets
+
+register = template.Library()
+
+TAGS = {
+    '.css': '<link rel="stylesheet" href="{}">',
+    '.js': '<script src="{}"></script>',
+}
+
+
+@lru_cache(maxsize=None)
+def bundle_urls(name):
+    """The built bundle when there is one, otherwise each of its files (CDN if not vendored)."""
+    bundle = assets.bundle_path(name)
+    if finders.find(bundle):
+        return (static(bundle),)
+    urls = []
+    for path in assets.BUNDLES[name]:
+        cdn = assets.vendor_url(path)
+        urls.append(static(path) if cdn is None or finders.find(path) else cdn)
+    return tuple(urls)
+
+
+@register.simple_tag
+def asset_bundle(name):
+    tag = TAGS[name[name.rindex('.'):]]
+    return format_html_join('\n    ', tag, ((url,) for url in bundle_urls(name)))
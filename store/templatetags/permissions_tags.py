@@ -1,12 +1,17 @@
 from django import template
-from ..permissions import has_permission
+from ..permissions import permissions_for
 
 register = template.Library()
 
+
+def _role_perms(context):
+    # set once per request by RolePermissionMiddleware / the context processor
+    perms = context.get('role_perms')
+    if perms is None:
+        perms = permissions_for(context['user'])
+    return perms
+
+
 @register.simple_tag(takes_context=True)
 def has_perm(context, permission):
-    user = context['user']
-    role = user.role if user.is_authenticated else None
-    if role:
-        return has_permission(role, permission)
-    return False
\ No newline at end of file
+    return _role_perms(context).has(permission)
@@ -0,0 +1,608 @@
+import csv
+import json
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F, QuerySet
+from django.http import HttpResponse, QueryDict
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from inventory import routers
+from inventory.urls import urlpatterns as inventory_urls
+from monitoring.nplusone import detect_nplusone
+from store import counters, status
+from store.models import Buyer, Counter, Delivery, Drop, Order, Product, Season, Supplier
+from store.permissions import (
+    ADMIN_FLAG,
+    BUYER_FLAG,
+    PERMISSIONS,
+    SUPPLIER_FLAG,
+    buyer as buyer_permissions,
+    has_permission,
+    permissions_for,
+    supplier as supplier_permissions,
+)
+from store.queries import deliveries_for_user
+from store.urls import urlpatterns as store_urls
+from users.models import User
+from users.urls import urlpatterns as users_urls
+
+# Most queries any role may spend on one cold-cache GET of each view. The
+# count must also not grow with the number of rows behind the page.
+QUERY_BUDGETS = {
+    'dashboard': 5,
+    'login': 2,
+    'register': 2,
+    'logout': 4,
+    'metrics': 2,
+    'create-supplier': 2,
+    'create-buyer': 2,
+    'create-season': 2,
+    'create-drop': 2,
+    'create-product': 2,
+    'create-order': 8,
+    'import-orders': 2,
+    'autocomplete': 3,
+    'create-delivery': 3,
+    'order-picker': 3,
+    'order-search': 4,
+    'supplier-list': 3,
+    'buyer-list': 3,
+    'season-list': 3,
+    'drop-list': 3,
+    'product-list': 3,
+    'order-list': 5,
+    'update-order-status': 3,
+    'bulk-update-order-status': 2,
+    'delivery-list': 5,
+    # one query per EXPORT_CHUNK_SIZE rows; the seeded data fits in one
+    'export-orders': 3,
+    'export-deliveries': 3,
+    'edit-supplier': 4,
+    # deletes run on a row nothing references; the collector still visits
+    # every related table (and for suppliers and buyers, their user's)
+    'delete-supplier': 18,
+    'edit-buyer': 4,
+    'delete-buyer': 18,
+    'edit-season': 3,
+    'delete-season': 7,
+    'edit-drop': 3,
+    'delete-drop': 7,
+    'edit-product': 3,
+    'delete-product': 10,
+}
+
+# seed_inventory options for the two data sizes compared
+SMALL = dict(prefix='small', suppliers=2, buyers=3, seasons=2, drops=2, products=3, orders=30)
+LARGE = dict(prefix='large', suppliers=2, buyers=3, seasons=12, drops=12, products=60, orders=900)
+
+
+def url_names():
+    return {
+        pattern.name for pattern in store_urls + users_urls + inventory_urls
+        if getattr(pattern, 'name', None)
+    }
+
+
+def seed(**options):
+    call_command('seed_inventory', stdout=StringIO(), **options)
+
+
+class QueryBudgetTests(TestCase):
+    """
+    GET every view as each role, once against a small data set and once
+    after a much larger one is added, and hold both query counts to
+    QUERY_BUDGETS. The supplier and buyer of each size are the ones that
+    own most of its orders. Any N+1 query fails the test outright.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        # the admin user comes from users/migrations/0004_create_admin.py
+        cls.admin = User.objects.get(username='admin')
+        # create_order gives whoever opens it first a buyer record
+        Buyer.objects.create(user=cls.admin, name='admin', address='')
+        seed(**SMALL)
+
+    def user(self, role, prefix):
+        if role == 'admin':
+            return self.admin
+        return User.objects.get(username='%s-%s-1' % (prefix, role))
+
+    def requests(self, user):
+        """``[(label, url name, path)]`` covering every named view."""
+        supplier = Supplier.objects.filter(user=user).first() or Supplier.objects.latest('pk')
+        buyer = Buyer.objects.filter(user=user).first() or Buyer.objects.latest('pk')
+        order = Order.objects.filter(supplier=supplier).latest('pk')
+        pks = {
+            'supplier': supplier.pk, 'buyer': buyer.pk, 'order': order.pk,
+            'season': Season.objects.latest('pk').pk,
+            'drop': Drop.objects.latest('pk').pk,
+            'product': Product.objects.latest('pk').pk,
+        }
+        # deletes remove a row nothing references, created for the purpose
+        spare = {
+            'supplier': Supplier.objects.create(
+                user=User.objects.create(username='spare-supplier-%s' % user.pk, is_supplier=True),
+                name='Spare supplier %s' % user.pk,
+            ).pk,
+            'buyer': Buyer.objects.create(
+                user=User.objects.create(username='spare-buyer-%s' % user.pk, is_buyer=True),
+                name='Spare buyer %s' % user.pk,
+            ).pk,
+            'season': Season.objects.create(name='Spare season %s' % user.pk).pk,
+            'drop': Drop.objects.create(name='Spare drop %s' % user.pk).pk,
+            'product': Product.objects.create(name='Spare product %s' % user.pk, sortno=0).pk,
+        }
+
+        requests = []
+        for name in sorted(url_names()):
+            if name == 'logout':
+                continue
+            if name == 'autocomplete':
+                for choice in ('product', 'buyer'):
+                    requests.append(('%s:%s' % (name, choice), name, reverse(name, args=[choice])))
+            elif name == 'order-search':
+                # every seeded order matches, so the ranking sees the whole index
+                requests.append((name, name, reverse(name) + '?q=product'))
+            elif name.startswith(('edit-', 'delete-', 'update-')):
+                kind = name.split('-', 1)[1].replace('order-status', 'order')
+                source = spare if name.startswith('delete-') else pks
+                requests.append((name, name, reverse(name, args=[source[kind]])))
+            else:
+                requests.append((name, name, reverse(name)))
+        # ends the session, so it goes last
+        requests.append(('logout', 'logout', reverse('logout')))
+        return requests
+
+    def measure(self, role, prefix):
+        """``{label: (url name, queries)}`` for every request, each with a cold cache."""
+        user = self.user(role, prefix)
+        self.client.force_login(user)
+        results = {}
+        for label, name, path in self.requests(user):
+            cache.clear()
+            # a low threshold, as the seeded pages are only a few rows long
+            with detect_nplusone(threshold=2, raise_error=True, where=label):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(path)
+                    if response.streaming:
+                        b''.join(response.streaming_content)
+            self.assertLess(response.status_code, 500, label)
+            results[label] = (name, [query['sql'] for query in queries.captured_queries])
+        return results
+
+    def check_budgets(self, role):
+        small = self.measure(role, 'small')
+        seed(**LARGE)
+        large = self.measure(role, 'large')
+
+        failures = []
+        for label, (name, small_queries) in small.items():
+            large_queries = large[label][1]
+            budget = QUERY_BUDGETS[name]
+            if len(large_queries) != len(small_queries) or len(large_queries) > budget:
+                failures.append((label, budget, small_queries, large_queries))
+        if failures:
+            self.fail(self.report(role, failures))
+
+    def report(self, role, failures):
+        lines = ['Query budgets exceeded for %s:' % role]
+        lines.append('  %-28s %6s %6s %6s' % ('view', 'budget', 'small', 'large'))
+        for label, budget, small_queries, large_queries in failures:
+            lines.append('  %-28s %6d %6d %6d' % (label, budget, len(small_queries), len(large_queries)))
+        for label, budget, small_queries, large_queries in failures:
+            lines.append('')
+            lines.append('%s (%s rows):' % (label, LARGE['prefix']))
+            lines.extend('  %3d. %s' % (n, sql) for n, sql in enumerate(large_queries, 1))
+        return '\n'.join(lines)
+
+    def test_every_view_has_a_budget(self):
+        self.assertEqual(url_names() - set(QUERY_BUDGETS), set())
+
+    def test_admin_query_budgets(self):
+        self.check_budgets('admin')
+
+    def test_supplier_query_budgets(self):
+        self.check_budgets('supplier')
+
+    def test_buyer_query_budgets(self):
+        self.check_budgets('buyer')
+
+
+class OrderSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.get(username='admin')
+        seed(**SMALL)
+        cls.supplier = User.objects.get(username='small-supplier-1')
+
+    def search(self, user, text):
+        self.client.force_login(user)
+        response = self.client.get(reverse('order-search'), {'q': text})
+        return [result['id'] for result in response.json()['results']]
+
+    def test_results_are_scoped_to_the_users_orders(self):
+        everything = self.search(self.admin, 'small')
+        own = self.search(self.supplier, 'small')
+        self.assertEqual(len(everything), Order.objects.count())
+        self.assertEqual(set(own), set(Order.objects.filter(supplier__user=self.supplier).values_list('pk', flat=True)))
+
+    def test_best_match_first(self):
+        order = Order.objects.first()
+        order.design = 'Paisley'
+        order.color = 'Paisley'
+        order.save()
+        other = Order.objects.exclude(pk=order.pk).first()
+        other.design = 'Paisley'
+        other.save()
+        self.assertEqual(self.search(self.admin, 'pais'), [order.pk, other.pk])
+
+    def test_index_follows_renames_and_deletes(self):
+        product = Product.objects.get(name='Small Product 1')
+        product.name = 'Tartan scarf'
+        product.save()
+        expected = set(Order.objects.filter(product=product).values_list('pk', flat=True))
+        self.assertEqual(set(self.search(self.admin, 'tartan')), expected)
+        self.assertEqual(set(self.search(self.admin, 'small product 1')) & expected, set())
+
+        Order.objects.filter(pk__in=expected).delete()
+        self.assertEqual(self.search(self.admin, 'tartan'), [])
+
+    def test_rebuild_catches_up_with_writes_that_skip_signals(self):
+        Supplier.objects.filter(user=self.supplier).update(name='Renamed quietly')
+        self.assertEqual(self.search(self.admin, 'quietly'), [])
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(
+            set(self.search(self.admin, 'quietly')),
+            set(Order.objects.filter(supplier__user=self.supplier).values_list('pk', flat=True)),
+        )
+
+
+@override_settings(ORDER_LIST_PAGE_SIZE=7)
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.get(username='admin')
+        seed(**SMALL)
+        cls.supplier = User.objects.get(username='small-supplier-1')
+
+    def page(self, user, **params):
+        self.client.force_login(user)
+        return self.client.get(reverse('order-list'), params).context['page_obj']
+
+    def test_pages_walk_every_order_once_newest_first(self):
+        seen = []
+        page = self.page(self.admin)
+        while True:
+            seen.extend(order.pk for order in page)
+            if not page.has_next():
+                break
+            page = self.page(self.admin, after=page.next_cursor)
+        self.assertEqual(seen, list(Order.objects.order_by('-pk').values_list('pk', flat=True)))
+
+    def test_bad_cursors_start_from_the_newest(self):
+        first = [order.pk for order in self.page(self.admin)]
+        for after in ('', 'abc', '0', '-5', '1e3', '7.5'):
+            with self.subTest(after=after):
+                page = self.page(self.admin, after=after)
+                self.assertEqual([order.pk for order in page], first)
+                self.assertFalse(page.has_previous())
+
+    def test_tampered_cursors_stay_in_the_users_orders(self):
+        own = Order.objects.filter(supplier__user=self.supplier)
+        other = Order.objects.exclude(supplier__user=self.supplier).latest('pk')
+        page = self.page(self.supplier, after=other.pk)
+        self.assertEqual(
+            [order.pk for order in page],
+            list(own.filter(pk__lt=other.pk).order_by('-pk').values_list('pk', flat=True)[:7]),
+        )
+        page = self.page(self.supplier, after='9' * 30)
+        self.assertEqual([order.pk for order in page], list(own.order_by('-pk').values_list('pk', flat=True)[:7]))
+
+    @override_settings(DASHBOARD_PANEL_SIZE=2)
+    def test_dashboard_panels_keep_each_others_cursors(self):
+        self.client.force_login(self.supplier)
+        cursor = self.client.get(reverse('dashboard')).context['orders'].next_cursor
+        context = self.client.get(reverse('dashboard'), {'products_after': 9999, 'orders_after': cursor}).context
+        orders = context['orders']
+        self.assertEqual(orders.first_query, 'products_after=9999')
+        self.assertEqual(orders.next_query, 'products_after=9999&orders_after=%d' % orders.next_cursor)
+        self.assertEqual(context['deliveries'].first_query, 'products_after=9999&orders_after=%d' % cursor)
+
+    def test_page_size_is_bounded(self):
+        self.assertEqual(len(self.page(self.admin, page_size=0)), 1)
+        self.assertEqual(len(self.page(self.admin, page_size='many')), 7)
+        with self.settings(LIST_PAGE_SIZE_MAX=10):
+            self.assertEqual(len(self.page(self.admin, page_size=1000)), 10)
+
+
+class DeliveryOwnerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed(**SMALL)
+
+    def owners(self, delivery):
+        delivery.refresh_from_db()
+        return delivery.supplier_id, delivery.buyer_id
+
+    def test_deliveries_copy_and_follow_their_orders_owners(self):
+        order = Order.objects.filter(buyer__isnull=False).first()
+        delivery = Delivery.objects.create(order=order, courier_name='DHL')
+        self.assertEqual(self.owners(delivery), (order.supplier_id, order.buyer_id))
+
+        order.supplier = Supplier.objects.exclude(pk=order.supplier_id).first()
+        order.buyer = None
+        order.save()
+        self.assertEqual(self.owners(delivery), (order.supplier_id, None))
+        self.assertIn(delivery, deliveries_for_user(order.supplier.user))
+
+
+class CounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed(**SMALL)
+
+    def assertConsistent(self):
+        expected = counters.expected_counts()
+        self.assertEqual(counters.get_many(expected), expected)
+        self.assertEqual(counters.rebuild(dry_run=True), {})
+
+    def test_writes_keep_the_counters_in_step(self):
+        self.assertConsistent()
+        order = Order.objects.filter(status='pending').first()
+        supplier = Supplier.objects.exclude(pk=order.supplier_id).first()
+        Order.objects.create(
+            supplier=supplier, product=order.product, buyer=None, design='Plain', color='Red',
+        )
+        order.status = 'done'
+        order.supplier = supplier
+        order.save()
+        self.assertConsistent()
+
+        Order.objects.filter(pk=order.pk).delete()
+        Product.objects.create(name='Counted product', sortno=0)
+        Supplier.objects.exclude(pk=supplier.pk).first().user.delete()
+        self.assertConsistent()
+
+    def test_rebuild_repairs_drift(self):
+        Counter.objects.filter(key=counters.ORDER).update(value=F('value') + 5)
+        Counter.objects.filter(key=counters.status_key('done')).delete()
+        Counter.objects.create(key=counters.supplier_orders_key(0), value=3)
+        actual = Order.objects.count()
+
+        drift = counters.rebuild()
+        self.assertEqual(drift[counters.ORDER], (actual + 5, actual))
+        self.assertEqual(drift[counters.supplier_orders_key(0)], (3, 0))
+        self.assertIn(counters.status_key('done'), drift)
+        self.assertConsistent()
+
+    def test_rebuild_keeps_writes_made_after_it_counted(self):
+        expected_counts = counters.expected_counts
+
+        def count_then_write():
+            counts = expected_counts()
+            # another writer commits its order and its counter adjustment
+            order = Order.objects.first()
+            Order.objects.create(supplier=order.supplier, product=order.product, design='Late', color='Blue')
+            return counts
+
+        Counter.objects.filter(key=counters.ORDER).update(value=0)
+        with mock.patch.object(counters, 'expected_counts', count_then_write):
+            counters.rebuild()
+        self.assertConsistent()
+
+
+class OrderImportTests(TestCase):
+    HEADER = 'supplier,product,design,color,buyer,season,drop\n'
+    ROW = 'Small Supplier 1,Small Product 1,%s,Red,Small Buyer 1,Small Season 1,Small Drop 1\n'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.get(username='admin')
+        seed(**SMALL)
+
+    def upload(self, content, name='orders.csv', encoding='utf-8'):
+        self.client.force_login(self.admin)
+        upload = SimpleUploadedFile(name, content.encode(encoding))
+        response = self.client.post(
+            reverse('import-orders'), {'file': upload}, HTTP_ACCEPT='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_invalid_rows_are_reported_and_the_rest_imported(self):
+        before = Order.objects.count()
+        report = self.upload(
+            self.HEADER + self.ROW % 'Stripe'
+            + 'Nobody,Small Product 1,Dots,Red,Small Buyer 1,Small Season 1,Small Drop 1\n'
+            + self.ROW % ('x' * 51) + self.ROW % 'Check'
+        )
+        self.assertEqual((report['rows'], report['created'], report['error_count']), (4, 2, 2))
+        self.assertEqual([error['line'] for error in report['errors']], [3, 4])
+        self.assertEqual(list(report['errors'][0]['errors']), ['supplier'])
+        self.assertEqual(list(report['errors'][1]['errors']), ['design'])
+        self.assertEqual(Order.objects.count(), before + 2)
+
+    def test_undecodable_text_is_reported_not_raised(self):
+        report = self.upload(self.HEADER + self.ROW % 'Crêpe', encoding='latin-1')
+        self.assertEqual(report['created'], 0)
+        self.assertEqual(report['error_count'], 1)
+        self.assertIn('not UTF-8', report['errors'][0]['errors']['__all__'][0])
+
+    def test_malformed_csv_lines_are_skipped(self):
+        limit = csv.field_size_limit(100)
+        self.addCleanup(csv.field_size_limit, limit)
+        report = self.upload(self.HEADER + self.ROW % 'Stripe' + self.ROW % ('x' * 200) + self.ROW % 'Check')
+        self.assertEqual((report['rows'], report['created'], report['error_count']), (3, 2, 1))
+        self.assertEqual(report['errors'][0]['line'], 3)
+        self.assertIn('Malformed CSV', report['errors'][0]['errors']['__all__'][0])
+
+    def test_json_lines(self):
+        row = dict(zip(self.HEADER.strip().split(','), (self.ROW % 'Stripe').strip().split(',')))
+        report = self.upload('%s\n[1, 2]\n{"design": \n' % json.dumps(row), name='orders.jsonl')
+        self.assertEqual((report['rows'], report['created'], report['error_count']), (3, 1, 2))
+        self.assertEqual(report['errors'][0]['errors'], {'__all__': ['Line is not a JSON object.']})
+
+
+class OrderStatusTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        seed(**SMALL)
+        cls.supplier = Supplier.objects.get(name='Small Supplier 1')
+
+    def pending(self, **filters):
+        return Order.objects.filter(status='pending', **filters)
+
+    def test_transition_compares_and_sets(self):
+        order = self.pending().first()
+        self.assertEqual(status.transition(order.pk, 'pending', 'done'), status.CHANGED)
+        self.assertEqual(status.transition(order.pk, 'done', 'done'), status.UNCHANGED)
+        # the form still shows pending, but the order has moved on
+        self.assertEqual(status.transition(order.pk, 'pending', 'cancelled'), status.CONFLICT)
+        order.refresh_from_db()
+        self.assertEqual(order.status, 'done')
+        self.assertEqual(counters.rebuild(dry_run=True), {})
+
+    def test_transition_rejects_moves_the_state_machine_forbids(self):
+        order = self.pending().first()
+        status.transition(order.pk, 'pending', 'done')
+        with self.assertRaises(status.InvalidTransition):
+            status.transition(order.pk, 'done', 'cancelled')
+        with self.assertRaises(status.InvalidTransition):
+            status.transition(order.pk, 'done', 'shipped')
+
+    def test_transition_is_scoped_to_the_supplier(self):
+        order = self.pending().exclude(supplier=self.supplier).first()
+        self.assertEqual(status.transition(order.pk, 'pending', 'done', self.supplier.pk), status.CONFLICT)
+        self.assertEqual(Order.objects.get(pk=order.pk).status, 'pending')
+
+    def test_bulk_sorts_every_order(self):
+        own = Order.objects.filter(supplier=self.supplier).values_list('pk', flat=True)
+        pending = list(own.filter(status='pending')[:2])
+        done = list(own.filter(status='done')[:1])
+        cancelled = list(own.filter(status='cancelled')[:1])
+        other = self.pending().exclude(supplier=self.supplier).first().pk
+        result = status.bulk_set_status(pending + done + cancelled + [other, 0], 'done', self.supplier.pk)
+        self.assertEqual(result.updated, sorted(pending))
+        self.assertEqual(result.unchanged, done)
+        self.assertEqual(result.rejected, cancelled)
+        self.assertEqual(result.skipped, sorted([other, 0]))
+        self.assertEqual(counters.rebuild(dry_run=True), {})
+
+    def test_bulk_reports_only_the_orders_that_lost_a_race(self):
+        ids = list(self.pending().values_list('pk', flat=True)[:3])
+        update = QuerySet.update
+
+        def someone_else_first(queryset, **kwargs):
+            if kwargs == {'status': 'done'}:
+                # another writer cancels one order between the read and the UPDATE
+                status.transition(ids[0], 'pending', 'cancelled')
+            return update(queryset, **kwargs)
+
+        with mock.patch.object(QuerySet, 'update', someone_else_first):
+            result = status.bulk_set_status(ids, 'done')
+        self.assertEqual(result.conflicts, [ids[0]])
+        self.assertEqual(result.updated, sorted(ids[1:]))
+        self.assertEqual(counters.rebuild(dry_run=True), {})
+
+    @override_settings(BULK_STATUS_MAX_ORDERS=2)
+    def test_bulk_request_rejects_bad_ids_and_statuses(self):
+        self.assertEqual(status.parse_bulk_request(QueryDict('ids=1&ids=2&ids=1&status=done')), ({1, 2}, 'done'))
+        for query in ('ids=1&ids=x&status=done', 'ids=1&ids=2&ids=3&status=done', 'ids=1&status=lost'):
+            with self.subTest(query=query), self.assertRaises(status.InvalidRequest):
+                status.parse_bulk_request(QueryDict(query))
+
+
+class RolePermissionTests(TestCase):
+    def user(self, **flags):
+        return User(username='someone', **flags)
+
+    def test_each_role_gets_its_permission_table(self):
+        buyer = permissions_for(self.user(is_buyer=True))
+        self.assertEqual((buyer.role, buyer.flags), ('buyer', BUYER_FLAG))
+        self.assertTrue(buyer['can_create_orders'])
+        self.assertFalse(buyer['can_view_suppliers'])
+        self.assertFalse(buyer.has('can_edit_products'))
+
+        supplier = permissions_for(self.user(is_supplier=True))
+        self.assertEqual((supplier.role, supplier.flags), ('supplier', SUPPLIER_FLAG))
+        self.assertTrue(supplier.has_all('can_create_products', 'can_manage_orders'))
+        self.assertFalse(supplier.has_any('can_create_orders', 'can_view_buyers'))
+
+        admin = permissions_for(self.user(is_superuser=True, is_admin=True))
+        self.assertEqual((admin.role, admin.flags, admin.is_superuser), ('admin', ADMIN_FLAG, True))
+        self.assertTrue(admin.has_all(*PERMISSIONS))
+        self.assertTrue(admin.has('a_permission_nobody_named_yet'))
+
+        nobody = permissions_for(AnonymousUser())
+        self.assertFalse(nobody)
+        self.assertEqual(nobody.flags, 0)
+        self.assertFalse(nobody.has_any(*PERMISSIONS))
+
+    def test_flags_combine_roles(self):
+        both = permissions_for(self.user(is_buyer=True, is_supplier=True))
+        self.assertEqual(both.flags, BUYER_FLAG | SUPPLIER_FLAG)
+        # the permissions are those of the one role User.role reports
+        self.assertEqual(both.role, 'supplier')
+
+    def test_templates_read_permissions_and_attributes(self):
+        template = Template(
+            '{{ perms.can_create_orders }} {{ perms.can_delete }} {{ perms.role }} {{ perms.flags }}'
+        )
+        perms = permissions_for(self.user(is_buyer=True))
+        self.assertEqual(template.render(Context({'perms': perms})), 'True False buyer 1')
+
+    def test_has_permission_matches_the_tables(self):
+        for role, table in (('buyer', buyer_permissions), ('supplier', supplier_permissions)):
+            for name in PERMISSIONS:
+                self.assertEqual(has_permission(role, name), table.get(name, False), (role, name))
+        self.assertTrue(has_permission('admin', 'can_view_products'))
+        self.assertFalse(has_permission(None, 'can_view_products'))
+
+
+@mock.patch('inventory.routers.replica_enabled', return_value=True)
+class ReplicaRouterTests(TestCase):
+    router = routers.ReplicaRouter()
+
+    def respond(self, request, write_model=None):
+        def view(request):
+            if write_model is not None:
+                self.router.db_for_write(write_model)
+            return HttpResponse(self.router.db_for_read(Order))
+        return routers.ReplicaPinMiddleware(routers.reads_from_replica(view))(request)
+
+    def test_reads_go_to_the_replica_until_the_client_writes(self, replica_enabled):
+        factory = RequestFactory()
+        response = self.respond(factory.get('/'))
+        self.assertEqual(response.content, b'replica')
+        self.assertNotIn(routers.PIN_COOKIE, response.cookies)
+
+        response = self.respond(factory.post('/'), write_model=Order)
+        pin = response.cookies[routers.PIN_COOKIE]
+        self.assertEqual(pin['max-age'], settings.REPLICA_PIN_SECONDS)
+
+        request = factory.get('/')
+        request.COOKIES[routers.PIN_COOKIE] = pin.value
+        self.assertEqual(self.respond(request).content, b'default')
+        self.assertEqual(routers.read_alias(request), routers.PRIMARY)
+
+    def test_session_writes_do_not_pin(self, replica_enabled):
+        response = self.respond(RequestFactory().get('/'), write_model=Session)
+        self.assertNotIn(routers.PIN_COOKIE, response.cookies)
+
+    def test_reads_outside_routed_views_stay_on_the_primary(self, replica_enabled):
+        self.assertEqual(self.router.db_for_read(Order), routers.PRIMARY)
+        with routers.use_primary():
+            self.assertEqual(self.router.db_for_read(Order), routers.PRIMARY)
+        self.assertFalse(self.router.allow_migrate(routers.REPLICA, 'store'))
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
     create_supplier,
@@ -6,17 +7,26 @@ from .views import (
     create_drop,
     create_product,
     create_order,
+    import_orders,
+    autocomplete,
     create_delivery,
+    order_picker,
+    order_search,
     SupplierListView,
     BuyerListView,
     SeasonListView,
     DropListView,
     ProductListView,
     OrderListView,
+    OrderListAsyncView,
     DeliveryListView,
+    DeliveryListAsyncView,
     edit_supplier,
     delete_supplier,
     update_order_status,
+    bulk_update_order_status,
+    export_orders,
+    export_deliveries,
     edit_buyer,
     delete_buyer,
     edit_season,
@@ -27,6 +37,10 @@ from .views import (
     delete_product,
 )
 
+# async variants under ASGI, see settings.ASYNC_VIEWS
+order_list = OrderListAsyncView if settings.ASYNC_VIEWS else OrderListView
+delivery_list = DeliveryListAsyncView if settings.ASYNC_VIEWS else DeliveryListView
+
 urlpatterns = [
     path('create-supplier/', create_supplier, name='create-supplier'),
     path('create-buyer/', create_buyer, name='create-buyer'),
@@ -34,16 +48,23 @@ urlpatterns = [
     path('create-drop/', create_drop, name='create-drop'),
     path('create-product/', create_product, name='create-product'),
     path('create-order/', create_order, name='create-order'),
+    path('import-orders/', import_orders, name='import-orders'),
+    path('autocomplete/<str:name>/', autocomplete, name='autocomplete'),
     path('create-delivery/', create_delivery, name='create-delivery'),
+    path('order-picker/', order_picker, name='order-picker'),
+    path('order-search/', order_search, name='order-search'),
 
     path('supplier-list/', SupplierListView.as_view(), name='supplier-list'),
     path('buyer-list/', BuyerListView.as_view(), name='buyer-list'),
     path('season-list/', SeasonListView.as_view(), name='season-list'),
     path('drop-list/', DropListView.as_view(), name='drop-list'),
     path('product-list/', ProductListView.as_view(), name='product-list'),
-    path('order-list/', OrderListView.as_view(), name='order-list'),
+    path('order-list/', order_list.as_view(), name='order-list'),
     path('update-order-status/<int:pk>/', update_order_status, name='update-order-status'),
-    path('delivery-list/', DeliveryListView.as_view(), name='delivery-list'),
+    path('bulk-update-order-status/', bulk_update_order_status, name='bulk-update-order-status'),
+    path('delivery-list/', delivery_list.as_view(), name='delivery-list'),
+    path('export-orders/', export_orders, name='export-orders'),
+    path('export-deliveries/', export_deliveries, name='export-deliveries'),
 
     path('edit-supplier/<int:pk>/', edit_supplier, name='edit-supplier'),
     path('delete-supplier/<int:pk>/', delete_supplier, name='delete-supplier'),
@@ -1,9 +1,20 @@
+import inspect
+
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404, HttpResponseBadRequest, HttpResponseForbidden, JsonResponse
+from django.contrib import messages
 from django.shortcuts import render, redirect
+from django.utils.http import url_has_allowed_host_and_scheme
+from django.views.decorators.http import require_POST
 from django.views.generic import ListView
 from django.contrib.auth.decorators import login_required
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 
+from inventory.aio import gather, offload
+from inventory.db import retry_on_locked
+from inventory.routers import read_alias, reads_from_replica
 from users.models import User
 from .models import (
     Supplier,
@@ -25,9 +36,40 @@ from .forms import (
     DropForm,
     ProductForm,
     OrderForm,
+    OrderFilterForm,
+    OrderImportForm,
     DeliveryForm,
 )
+from . import caching, choices, exports, query_plans, search, status
+from .importers import OrderImporter, guess_format, open_upload, read_rows
+from .pagination import KeysetPaginationMixin, keyset_paginate, parse_cursor
 from .permissions import role_required
+from .queries import (
+    ORDER_PICKER_COLUMNS,
+    deliveries_for_user,
+    delivery_list_queryset,
+    order_label,
+    order_list_queryset,
+    order_picker_rows,
+    orders_for_user,
+    undelivered_orders,
+)
+
+
+class CachedListMixin:
+    """
+    Let the template cache its table with ``{% cache list_cache_timeout <fragment> list_cache_version %}``.
+
+    The version is the model's cache namespace, bumped by store.signals on
+    every save or delete, so a cached table is never stale. The queryset stays
+    lazy and only runs when the fragment has to be rendered.
+    """
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['list_cache_version'] = caching.get_version(caching.model_namespace(self.model))
+        context['list_cache_timeout'] = settings.LIST_CACHE_TIMEOUT
+        return context
 
 
 # ---------------- SUPPLIER ----------------
@@ -47,25 +89,28 @@ def create_supplier(request):
             retype_password = forms.cleaned_data['retype_password']
 
             if password == retype_password:
-                user = User.objects.create_user(
-                    username=username,
-                    password=password,
-                    email=email,
-                    is_supplier=True
-                )
-                Supplier.objects.create(
-                    user=user,
-                    name=name,
-                    address=address
-                )
+                with transaction.atomic():
+                    user = User.objects.create_user(
+                        username=username,
+                        password=password,
+                        email=email,
+                        is_supplier=True
+                    )
+                    Supplier.objects.create(
+                        user=user,
+                        name=name,
+                        address=address
+                    )
                 return redirect('supplier-list')
 
     return render(request, 'store/create_supplier.html', {'form': forms})
 
 
-@method_decorator([login_required(login_url='login'), role_required('supplier')], name='dispatch')
+@method_decorator([login_required(login_url='login'), role_required('supplier'), reads_from_replica], name='dispatch')
 class SupplierListView(ListView):
     model = Supplier
+    # the template shows each supplier's email
+    queryset = Supplier.objects.select_related('user')
     template_name = 'store/supplier_list.html'
     context_object_name = 'supplier'
 
@@ -105,7 +150,8 @@ def edit_supplier(request, pk):
 @role_required('supplier')
 def delete_supplier(request, pk):
     supplier = Supplier.objects.get(pk=pk)
-    supplier.user.delete()  # deletes supplier + user
+    with transaction.atomic():
+        supplier.user.delete()  # deletes supplier + user
     return redirect('supplier-list')
 
 
@@ -124,25 +170,28 @@ def create_buyer(request):
             retype_password = forms.cleaned_data['retype_password']
 
             if password == retype_password:
-                user = User.objects.create_user(
-                    username=username,
-                    password=password,
-                    email=email,
-                    is_buyer=True
-                )
-                Buyer.objects.create(
-                    user=user,
-                    name=name,
-                    address=address
-                )
+                with transaction.atomic():
+                    user = User.objects.create_user(
+                        username=username,
+                        password=password,
+                        email=email,
+                        is_buyer=True
+                    )
+                    Buyer.objects.create(
+                        user=user,
+                        name=name,
+                        address=address
+                    )
                 return redirect('buyer-list')
 
     return render(request, 'store/create_buyer.html', {'form': forms})
 
 
-@method_decorator([login_required(login_url='login'), role_required('supplier')], name='dispatch')
+@method_decorator([login_required(login_url='login'), role_required('supplier'), reads_from_replica], name='dispatch')
 class BuyerListView(ListView):
     model = Buyer
+    # the template shows each buyer's email
+    queryset = Buyer.objects.select_related('user')
     template_name = 'store/buyer_list.html'
     context_object_name = 'buyer'
 
@@ -182,7 +231,8 @@ def edit_buyer(request, pk):
 @role_required('supplier')
 def delete_buyer(request, pk):
     buyer = Buyer.objects.get(pk=pk)
-    buyer.user.delete()  # deletes buyer + user
+    with transaction.atomic():
+        buyer.user.delete()  # deletes buyer + user
     return redirect('buyer-list')
 
 
@@ -201,7 +251,7 @@ def create_season(request):
     return render(request, 'store/create_season.html', {'form': forms})
 
 
-class SeasonListView(ListView):
+class SeasonListView(CachedListMixin, ListView):
     model = Season
     template_name = 'store/season_list.html'
     context_object_name = 'season'
@@ -225,7 +275,8 @@ def edit_season(request, pk):
 @login_required(login_url='login')
 def delete_season(request, pk):
     season = Season.objects.get(pk=pk)
-    season.delete()
+    with transaction.atomic():
+        season.delete()
     return redirect('season-list')
 
 
@@ -244,7 +295,7 @@ def create_drop(request):
     return render(request, 'store/create_drop.html', {'form': forms})
 
 
-class DropListView(ListView):
+class DropListView(CachedListMixin, ListView):
     model = Drop
     template_name = 'store/drop_list.html'
     context_object_name = 'drop'
@@ -268,7 +319,8 @@ def edit_drop(request, pk):
 @login_required(login_url='login')
 def delete_drop(request, pk):
     drop = Drop.objects.get(pk=pk)
-    drop.delete()
+    with transaction.atomic():
+        drop.delete()
     return redirect('drop-list')
 
 
@@ -282,14 +334,15 @@ def create_product(request):
     if request.method == 'POST':
         forms = ProductForm(request.POST)
         if forms.is_valid():
-            forms.save()
+            with transaction.atomic():
+                forms.save()
             return redirect('product-list')
 
     return render(request, 'store/create_product.html', {'form': forms})
 
 
 @method_decorator([login_required(login_url='login'), role_required('buyer', 'supplier')], name='dispatch')
-class ProductListView(ListView):
+class ProductListView(CachedListMixin, ListView):
     model = Product
     template_name = 'store/product_list.html'
     context_object_name = 'product'
@@ -315,7 +368,8 @@ def edit_product(request, pk):
 @role_required('supplier')
 def delete_product(request, pk):
     product = Product.objects.get(pk=pk)
-    product.delete()
+    with transaction.atomic():
+        product.delete()
     return redirect('product-list')
 
 
@@ -325,41 +379,124 @@ def delete_product(request, pk):
 @login_required(login_url='login')
 @login_required(login_url='login')
 @role_required('buyer')
+@retry_on_locked
 def create_order(request):
     buyer, created = Buyer.objects.get_or_create(user=request.user, defaults={'name': request.user.username, 'address': ''})
     forms = OrderForm(user=request.user, initial={'buyer': buyer.pk})
     if request.method == 'POST':
         forms = OrderForm(request.POST, user=request.user)
         if forms.is_valid():
-            Order.objects.create(
-                supplier=forms.cleaned_data['supplier'],
-                product=forms.cleaned_data['product'],
-                design=forms.cleaned_data['design'],
-                color=forms.cleaned_data['color'],
-                buyer=forms.cleaned_data['buyer'],
-                season=forms.cleaned_data['season'],
-                drop=forms.cleaned_data['drop'],
-                status='pending'
-            )
+            with transaction.atomic():
+                Order.objects.create(
+                    supplier=forms.cleaned_data['supplier'],
+                    product=forms.cleaned_data['product'],
+                    design=forms.cleaned_data['design'],
+                    color=forms.cleaned_data['color'],
+                    buyer=forms.cleaned_data['buyer'],
+                    season=forms.cleaned_data['season'],
+                    drop=forms.cleaned_data['drop'],
+                    status='pending'
+                )
             return redirect('order-list')
 
     return render(request, 'store/create_order.html', {'form': forms})
 
 
-class OrderListView(ListView):
+@login_required(login_url='login')
+def autocomplete(request, name):
+    """Name-prefix matches for one of OrderForm's selects, as JSON."""
+    if name not in choices.CHOICE_MODELS:
+        raise Http404
+    prefix = request.GET.get('q', '').strip()
+    limit = settings.AUTOCOMPLETE_LIMIT
+    if name == 'buyer' and request.user.is_buyer:
+        # buyers only ever pick their own buyer record
+        rows = list(
+            Buyer.objects.filter(user=request.user, name__istartswith=prefix)
+            .order_by('name').values_list('pk', 'name')[:limit + 1]
+        )
+        matches, more = rows[:limit], len(rows) > limit
+    else:
+        matches, more = choices.prefix_index(name).search(prefix, limit)
+    return JsonResponse({
+        'results': [{'id': pk, 'text': label} for pk, label in matches],
+        'more': more,
+    })
+
+
+@login_required(login_url='login')
+@role_required('buyer')
+def import_orders(request):
+    """Bulk-create orders from an uploaded CSV or JSON Lines file."""
+    form = OrderImportForm()
+    report = None
+    if request.method == 'POST':
+        form = OrderImportForm(request.POST, request.FILES)
+        if form.is_valid():
+            upload = form.cleaned_data['file']
+            fmt = form.cleaned_data['format'] or guess_format(upload.name)
+            importer = OrderImporter(user=request.user)
+            report = importer.run(read_rows(open_upload(upload), fmt))
+            if request.headers.get('Accept', '').startswith('application/json'):
+                return JsonResponse(report.as_dict())
+
+    return render(request, 'store/import_orders.html', {'form': form, 'report': report})
+
+
+class FilteredListMixin:
+    """Narrow a list view with OrderFilterForm and expose the form to the template."""
+    order_prefix = ''
+
+    def filter_queryset(self, queryset):
+        self.filter_form = OrderFilterForm(self.request.GET)
+        if self.filter_form.is_valid():
+            queryset = self.filter_form.filter(queryset, self.order_prefix)
+        return queryset
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['filter_form'] = self.filter_form
+        context['filter_query'] = self.filter_form.query_string()
+        return context
+
+
+class ConcurrentListMixin:
+    """
+    Async ``get`` for a FilteredListMixin list under ASGI.
+
+    The page and the filter form's season/drop options are independent
+    queries, so they run concurrently on worker threads; the template then
+    renders on one, so it must not query anything new.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        # the sync decorators on dispatch (login_required) may answer without
+        # reaching get, so their response is not always awaitable
+        response = super().dispatch(request, *args, **kwargs)
+        if inspect.isawaitable(response):
+            response = await response
+        return response
+
+    async def get(self, request, *args, **kwargs):
+        # validating the filters may look up the chosen season or drop
+        self.object_list = await offload(self.get_queryset)
+        results = await gather({'context': self.get_context_data, **self.filter_form.choice_reads()})
+        context = results.pop('context')
+        self.filter_form.set_choices(results)
+        return await offload(lambda: self.render_to_response(context).render())
+
+
+@method_decorator([login_required(login_url='login'), reads_from_replica], name='dispatch')
+class OrderListView(FilteredListMixin, KeysetPaginationMixin, ListView):
     model = Order
     template_name = 'store/order_list.html'
 
+    def get_default_page_size(self):
+        return settings.ORDER_LIST_PAGE_SIZE
+
     def get_queryset(self):
-        user = self.request.user
-        if user.is_staff or user.is_superuser:
-            return Order.objects.all().order_by('-id')
-        elif user.is_supplier:
-            return Order.objects.filter(supplier__user=user).order_by('-id')
-        elif user.is_buyer:
-            return Order.objects.filter(buyer__user=user).order_by('-id')
-        else:
-            return Order.objects.none()
+        # one joined query per page; the template only reads the related names
+        return self.filter_queryset(order_list_queryset(self.request.user))
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -374,50 +511,100 @@ class OrderListView(ListView):
         return context
 
 
+class OrderListAsyncView(ConcurrentListMixin, OrderListView):
+    pass
+
+
+query_plans.register('order-list', order_list_queryset, roles=('supplier', 'buyer'))
+query_plans.register(
+    'order-list:by-status',
+    lambda user: order_list_queryset(user).filter(status='pending'),
+)
+# staff read the whole table newest-first, which is a (bounded) rowid scan
+query_plans.register('order-list:admin', order_list_queryset, roles=('admin',), allow_scans=('store_order',))
+
+
 @login_required(login_url='login')
 @csrf_exempt
+@retry_on_locked
 def update_order_status(request, pk):
-    # only staff/superuser/supplier can update order status
-    if not request.user.is_authenticated:
-        return redirect('login')
-    # allow staff, superuser, or supplier for their orders
-    user = request.user
-    can_update = False
-    if user.is_staff or user.is_superuser:
-        can_update = True
-    elif user.is_supplier:
-        order = Order.objects.get(pk=pk)
-        if order.supplier.user == user:
-            can_update = True
-    
-    if not can_update:
+    """
+    Move one order along the status state machine.
+
+    The form posts the status it showed (``expected``) next to the new one;
+    if the order has moved on since, the change is refused as a conflict.
+    """
+    wants_json = request.headers.get('Accept', '').startswith('application/json')
+    # only staff/superuser/supplier can update order status, suppliers only their own
+    try:
+        supplier_id = status.supplier_scope(request.user)
+    except PermissionError:
         return redirect('order-list')
 
-    order = Order.objects.get(pk=pk)
     if request.method == 'POST':
         new_status = request.POST.get('status')
-        # validate status based on user role
-        if user.is_staff or user.is_superuser:
-            valid_statuses = [s[0] for s in Order.STATUS_CHOICE]
-        elif user.is_supplier:
-            valid_statuses = ['pending', 'done', 'cancelled']
+        expected = request.POST.get('expected')
+        try:
+            outcome = status.transition(pk, expected, new_status, supplier_id)
+        except status.InvalidTransition as e:
+            if wants_json:
+                return JsonResponse({'result': 'invalid', 'error': str(e)}, status=400)
+            messages.error(request, 'Order %s: %s' % (pk, e))
         else:
-            valid_statuses = []
-        
-        if new_status in valid_statuses:
-            order.status = new_status
-            order.save()
+            if wants_json:
+                return JsonResponse({'result': outcome}, status=409 if outcome == status.CONFLICT else 200)
+            if outcome == status.CONFLICT:
+                messages.warning(request, 'Order %s was changed by someone else; reload and try again.' % pk)
     return redirect('order-list')
 
 
+@login_required(login_url='login')
+@require_POST
+@retry_on_locked
+def bulk_update_order_status(request):
+    """
+    Apply one status to many orders (``ids`` + ``status``).
+
+    Suppliers are limited to their own orders; ids that are missing or not
+    theirs come back as ``skipped``. See status.bulk_set_status.
+    """
+    wants_json = request.headers.get('Accept', '').startswith('application/json')
+    try:
+        supplier_id = status.supplier_scope(request.user)
+    except PermissionError:
+        return HttpResponseForbidden("You do not have permission to access this page.")
+
+    try:
+        order_ids, new_status = status.parse_bulk_request(request.POST)
+    except status.InvalidRequest as e:
+        return HttpResponseBadRequest(str(e))
+    result = status.bulk_set_status(order_ids, new_status, supplier_id)
+    if wants_json:
+        return JsonResponse(result.as_dict())
+
+    _report_bulk_result(request, result, new_status)
+    next_url = request.POST.get('next')
+    if next_url and url_has_allowed_host_and_scheme(next_url, allowed_hosts={request.get_host()}):
+        return redirect(next_url)
+    return redirect('order-list')
+
+
+def _report_bulk_result(request, result, new_status):
+    messages.success(request, '%d order(s) set to %s.' % (len(result.updated), new_status))
+    for label, ids in (('Not allowed to move to %s' % new_status, result.rejected),
+                       ('Changed by someone else', result.conflicts),
+                       ('Skipped', result.skipped)):
+        if ids:
+            messages.warning(request, '%s: order(s) %s.' % (label, ', '.join(map(str, ids))))
+
 
 # ---------------- DELIVERY ----------------
 
 @login_required(login_url='login')
 def create_delivery(request):
-    forms = DeliveryForm()
+    forms = DeliveryForm(user=request.user)
     if request.method == 'POST':
-        forms = DeliveryForm(request.POST)
+        forms = DeliveryForm(request.POST, user=request.user)
         if forms.is_valid():
             forms.save()
             return redirect('delivery-list')
@@ -425,7 +612,89 @@ def create_delivery(request):
     return render(request, 'store/create_delivery.html', {'form': forms})
 
 
-class DeliveryListView(ListView):
+@login_required(login_url='login')
+def order_picker(request):
+    """Undelivered orders for the delivery form, searched and paged on ``-id``."""
+    orders = undelivered_orders(orders_for_user(request.user))
+    page = keyset_paginate(
+        order_picker_rows(orders, request.GET.get('q', '')),
+        parse_cursor(request.GET.get('after')),
+        settings.AUTOCOMPLETE_LIMIT,
+    )
+    return JsonResponse({
+        'results': [{'id': row[0], 'text': order_label(*row)} for row in page],
+        'more': page.has_next(),
+        'next': page.object_list[-1][0] if page.has_next() else None,
+    })
+
+
+@login_required(login_url='login')
+def order_search(request):
+    """Orders visible to the user matching ``q`` anywhere in their names, best match first."""
+    limit = settings.ORDER_SEARCH_LIMIT
+    ids = search.search_order_ids(request.user, request.GET.get('q', ''), limit + 1)
+    more, ids = len(ids) > limit, ids[:limit]
+    rows = {
+        row[0]: row
+        for row in Order.objects.filter(pk__in=ids).values_list(*ORDER_PICKER_COLUMNS, 'status')
+    }
+    return JsonResponse({
+        'results': [
+            {'id': pk, 'text': order_label(*rows[pk][:-1]), 'status': rows[pk][-1]}
+            for pk in ids if pk in rows
+        ],
+        'more': more,
+    })
+
+
+@method_decorator([login_required(login_url='login'), reads_from_replica], name='dispatch')
+class DeliveryListView(FilteredListMixin, KeysetPaginationMixin, ListView):
     model = Delivery
     template_name = 'store/delivery_list.html'
     context_object_name = 'delivery'
+    order_prefix = 'order__'
+
+    def get_queryset(self):
+        # product names come in the same query as the page of deliveries
+        return self.filter_queryset(delivery_list_queryset(self.request.user))
+
+
+class DeliveryListAsyncView(ConcurrentListMixin, DeliveryListView):
+    pass
+
+
+query_plans.register('delivery-list', delivery_list_queryset, roles=('supplier', 'buyer'))
+query_plans.register(
+    'delivery-list:admin', delivery_list_queryset, roles=('admin',), allow_scans=('store_delivery',),
+)
+query_plans.register(
+    'order-picker',
+    lambda user: order_picker_rows(undelivered_orders(orders_for_user(user)))[:settings.AUTOCOMPLETE_LIMIT],
+    roles=('supplier', 'buyer'),
+)
+
+
+def _export(request, queryset, columns, basename, order_prefix=''):
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in exports.FORMATS:
+        return HttpResponseBadRequest('Unknown export format.')
+    filter_form = OrderFilterForm(request.GET)
+    if not filter_form.is_valid():
+        return HttpResponseBadRequest(filter_form.errors.as_text())
+    # rows are read while the response streams, after any routing scope ends
+    queryset = filter_form.filter(queryset, order_prefix).using(read_alias(request))
+    return exports.export_response(queryset, columns, fmt, basename)
+
+
+@login_required(login_url='login')
+def export_orders(request):
+    """Stream the orders the user can see as CSV or JSON Lines (``?format=``)."""
+    return _export(request, orders_for_user(request.user), exports.ORDER_COLUMNS, 'orders')
+
+
+@login_required(login_url='login')
+def export_deliveries(request):
+    """Stream the deliveries the user can see as CSV or JSON Lines (``?format=``)."""
+    return _export(
+        request, deliveries_for_user(request.user), exports.DELIVERY_COLUMNS, 'deliveries', 'order__',
+    )
@@ -1,9 +1,10 @@
+from django.conf import settings
 from django.urls import path
 
-from .views import login_page, logout_page, register_page
+from .views import login_page, login_page_async, logout_page, register_page
 
 urlpatterns = [
-    path('login/', login_page, name='login'),
+    path('login/', login_page_async if settings.ASYNC_VIEWS else login_page, name='login'),
     path('register/', register_page, name='register'),
     path('logout/', logout_page, name='logout'),
 ]
@@ -1,11 +1,13 @@
 from django.shortcuts import render, redirect
-from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth import alogin, authenticate, login, logout
 
 from django.contrib.auth import get_user_model
 from django.conf import settings
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.db import transaction
 
+from inventory.aio import offload
 from .forms import LoginForm, RegistrationForm
 from store.models import Buyer
 
@@ -25,6 +27,22 @@ def login_page(request):
     return render(request, 'users/login.html', context)
 
 
+async def login_page_async(request):
+    """``login_page`` for ASGI: password hashing runs on a worker thread, off the event loop."""
+    forms = LoginForm()
+    if request.method == 'POST':
+        forms = LoginForm(request.POST)
+        if forms.is_valid():
+            username = forms.cleaned_data['username']
+            password = forms.cleaned_data['password']
+            user = await offload(authenticate, username=username, password=password)
+            if user:
+                await alogin(request, user)
+                return redirect('dashboard')
+    context = {'form': forms}
+    return await offload(render, request, 'users/login.html', context)
+
+
 def logout_page(request):
     logout(request)
     return redirect('login')
@@ -55,12 +73,13 @@ def register_page(request):
                 form.add_error('password1', e)
                 return render(request, 'users/register.html', {'form': form})
 
-            # create user as buyer
-            user = User.objects.create_user(username=username, email=email, password=password)
-            user.is_buyer = True
-            user.save()
-            # create Buyer object
-            Buyer.objects.create(user=user, name=username, address='')
+            with transaction.atomic():
+                # create user as buyer
+                user = User.objects.create_user(username=username, email=email, password=password)
+                user.is_buyer = True
+                user.save()
+                # create Buyer object
+                Buyer.objects.create(user=user, name=username, address='')
             # don't auto-login; redirect to login page so the user can sign in
             return redirect('login')
 